@@ -0,0 +1,66 @@
+import os
+import sys
+import gc
+import json
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+from ccxt.base.exchange import optional_numpy  # noqa: E402
+
+# compares building candles from trades with build_ohlcvc() over trade dicts
+# and with build_ohlcvc_columns() over parallel lists, through its pure python
+# path and through its numpy path (when numpy is installed). The recorded
+# binance aggTrades in go/cli/bench/trades.json are tiled forward in time to
+# the requested number of trades
+#
+#     python examples/py/build-ohlcvc-benchmark.py [trades] [timeframe]
+
+
+def load_trades(count):
+    with open(os.path.join(root, 'go', 'cli', 'bench', 'trades.json')) as file:
+        recorded = json.load(file)
+    span = recorded[-1]['T'] - recorded[0]['T'] + 1
+    trades = []
+    for i in range(count):
+        trade = recorded[i % len(recorded)]
+        trades.append({'timestamp': trade['T'] + span * (i // len(recorded)), 'price': float(trade['p']), 'amount': float(trade['q'])})
+    return trades
+
+
+def measure(build):
+    gc.collect()
+    gc.disable()
+    start = time.perf_counter()
+    candles = build()
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed, candles
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    timeframe = sys.argv[2] if len(sys.argv) > 2 else '1m'
+    exchange = ccxt.binance()
+    trades = load_trades(count)
+    timestamps = [trade['timestamp'] for trade in trades]
+    prices = [trade['price'] for trade in trades]
+    amounts = [trade['amount'] for trade in trades]
+    results = {}
+    results['build_ohlcvc'] = measure(lambda: exchange.build_ohlcvc(trades, timeframe))
+    exchange.ohlcvc_bulk_threshold = float('inf')
+    results['columns (python)'] = measure(lambda: exchange.build_ohlcvc_columns(timestamps, prices, amounts, timeframe))
+    if optional_numpy() is not None:
+        exchange.ohlcvc_bulk_threshold = 0
+        results['columns (numpy)'] = measure(lambda: exchange.build_ohlcvc_columns(timestamps, prices, amounts, timeframe))
+    reference = results['build_ohlcvc'][0]
+    print('trades:', count, 'timeframe:', timeframe, 'candles:', len(results['build_ohlcvc'][1]))
+    for name, (elapsed, candles) in results.items():
+        assert len(candles) == len(results['build_ohlcvc'][1])
+        print(name.ljust(18), (str(round(elapsed * 1000, 1)) + ' ms').rjust(12), (str(round(reference / elapsed, 1)) + 'x').rjust(8))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+import os
+import sys
+import subprocess
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# imports each ccxt package in a fresh interpreter and reports the wall time and
+# the peak memory of the import, then the cost of touching the first exchange,
+# which is the only one the lazy packages load
+#
+#     python examples/py/import-time-benchmark.py [runs]
+
+MEASURE = '''
+import resource
+import sys
+import time
+start = time.perf_counter()
+import {package} as package
+imported = time.perf_counter()
+package.binance
+accessed = time.perf_counter()
+print(imported - start, accessed - imported, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, sum(name.startswith('{package}.') for name in sys.modules))
+'''
+
+
+def measure(package, runs):
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', MEASURE.format(package=package)], cwd=root + '/python', capture_output=True, text=True, check=True).stdout
+        samples.append([float(value) for value in output.split()])
+    # the best run, the others only add noise from the disk cache and the scheduler
+    return min(samples)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print('runs:', runs)
+    for package in ('ccxt', 'ccxt.async_support', 'ccxt.pro'):
+        imported, accessed, rss, modules = measure(package, runs)
+        print(package.ljust(20), 'import', (str(round(imported * 1000)) + ' ms').rjust(8), 'first exchange', (str(round(accessed * 1000)) + ' ms').rjust(8), 'peak rss', (str(round(rss / 1024)) + ' MB').rjust(7), 'submodules', int(modules))
+
+
+if __name__ == '__main__':
+    main()
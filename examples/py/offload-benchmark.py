@@ -0,0 +1,91 @@
+import os
+import sys
+import asyncio
+import concurrent.futures
+import copy
+import json
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt.async_support as ccxt  # noqa: E402
+
+# decodes a large response body and builds a large set of markets with and without
+# options['offload'] while a ticker coroutine measures how long the event loop goes
+# without running it, the worst of those stalls is what every other coroutine and
+# websocket connection of the process waits at most
+#
+#     python examples/py/offload-benchmark.py [markets]
+
+
+def make_markets(count):
+    return [{
+        'id': 'BASE' + str(i) + 'USDT',
+        'symbol': 'BASE' + str(i) + '/USDT',
+        'base': 'BASE' + str(i),
+        'quote': 'USDT',
+        'baseId': 'BASE' + str(i),
+        'quoteId': 'USDT',
+        'type': 'spot',
+        'spot': True,
+        'active': True,
+        'precision': {'amount': 0.001, 'price': 0.01},
+        'limits': {'amount': {'min': 0.001, 'max': 100000}, 'price': {'min': 0.01, 'max': 1000000}},
+        'info': {'symbol': 'BASE' + str(i) + 'USDT', 'status': 'TRADING', 'filters': [{'filterType': 'PRICE_FILTER', 'tickSize': '0.01000000'}, {'filterType': 'LOT_SIZE', 'stepSize': '0.00100000'}]},
+    } for i in range(count)]
+
+
+async def worst_stall(task):
+    stalls = [0]
+    running = True
+
+    async def ticker():
+        last = time.perf_counter()
+        while running:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            stalls[0] = max(stalls[0], now - last)
+            last = now
+
+    ticking = asyncio.ensure_future(ticker())
+    await asyncio.sleep(0.01)
+    wall = time.perf_counter()
+    await task()
+    wall = time.perf_counter() - wall
+    running = False
+    await ticking
+    return wall, stalls[0]
+
+
+async def run(count):
+    markets = make_markets(count)
+    body = json.dumps({'data': markets})
+    print('markets:', count, 'body:', round(len(body) / 1048576, 1), 'MB')
+    processes = concurrent.futures.ProcessPoolExecutor(1)
+    configs = {
+        'on the loop': None,
+        'thread': {},
+        'process': {'executor': processes},
+    }
+    for name, config in configs.items():
+        exchange = ccxt.Exchange({'id': 'benchmark', 'options': {} if config is None else {'offload': config}})
+        if name == 'process':
+            await exchange.parse_json_off_loop(body)  # start the worker
+        wall, stall = await worst_stall(lambda: exchange.parse_json_off_loop(body))
+        print(('decode, ' + name).ljust(25), 'wall', (str(round(wall * 1000)) + ' ms').rjust(8), 'worst stall', (str(round(stall * 1000)) + ' ms').rjust(8))
+        if name != 'process':
+            fresh = copy.deepcopy(markets)  # set_markets() extends the markets it is given
+            wall, stall = await worst_stall(lambda: exchange.set_markets_off_loop(fresh))
+            print(('set_markets, ' + name).ljust(25), 'wall', (str(round(wall * 1000)) + ' ms').rjust(8), 'worst stall', (str(round(stall * 1000)) + ' ms').rjust(8))
+        await exchange.close()
+    processes.shutdown()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    asyncio.run(run(count))
+
+
+if __name__ == '__main__':
+    main()
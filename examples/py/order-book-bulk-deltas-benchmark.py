@@ -0,0 +1,62 @@
+import os
+import sys
+import gc
+import json
+import random
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt.pro as ccxt  # noqa: E402
+
+# compares applying a whole depth message level by level through the binance
+# handle_deltas() loop with the bulk handle_deltas_bulk() path, on messages of
+# growing size cut from the recorded 5000-level binance snapshot in
+# go/cli/bench/orderbook.json (prices and amounts stay strings, as on the wire)
+#
+#     python examples/py/order-book-bulk-deltas-benchmark.py [rounds]
+
+
+def load_levels():
+    with open(os.path.join(root, 'go', 'cli', 'bench', 'orderbook.json')) as file:
+        return json.load(file)['bids']
+
+
+def make_message(levels, size, rng):
+    message = []
+    for price, amount in rng.sample(levels, size):
+        message.append([price, '0.00000000' if rng.random() < 0.3 else amount])
+    return message
+
+
+def measure(apply, exchange, messages):
+    # the garbage collector is paused while timing, like timeit does, so that
+    # a collection triggered by one side does not get billed to the other
+    book = exchange.order_book({})
+    gc.collect()
+    gc.disable()
+    start = time.perf_counter()
+    for message in messages:
+        apply(book['bids'], message)
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed, book
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    exchange = ccxt.binance()
+    levels = load_levels()
+    rng = random.Random(1)
+    print('levels/msg'.rjust(10), 'handle_deltas'.rjust(16), 'handle_deltas_bulk'.rjust(20), 'speedup'.rjust(9))
+    for size in (10, 100, 1000, 5000):
+        messages = [make_message(levels, size, rng) for _ in range(rounds)]
+        loop_time, loop_book = measure(exchange.handle_deltas, exchange, messages)
+        bulk_time, bulk_book = measure(exchange.handle_deltas_bulk, exchange, messages)
+        assert list(loop_book['bids']) == list(bulk_book['bids'])
+        print(str(size).rjust(10), (str(round(loop_time * 1000, 2)) + ' ms').rjust(16), (str(round(bulk_time * 1000, 2)) + ' ms').rjust(20), (str(round(loop_time / bulk_time, 1)) + 'x').rjust(9))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+import os
+import sys
+import json
+import random
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.async_support.base.ws.order_book import OrderBook, ChunkedOrderBook  # noqa: E402
+
+# compares the list-backed and the chunked order book sides on a full-depth
+# book: both are seeded with the recorded 5000-level binance snapshot from
+# go/cli/bench/orderbook.json and then replay the same diff-depth stream of
+# inserts, updates and deletes spread across the whole depth of the book
+#
+#     python examples/py/order-book-side-benchmark.py [deltas] [depth]
+#
+# to use the chunked engine in your own code, set the exchange option
+#
+#     exchange = ccxt.pro.binance({'options': {'watchOrderBook': {'orderBookEngine': 'chunked'}}})
+
+
+def load_snapshot(depth):
+    with open(os.path.join(root, 'go', 'cli', 'bench', 'orderbook.json')) as file:
+        snapshot = json.load(file)
+    return {
+        'bids': [[float(price), float(amount)] for price, amount in snapshot['bids'][:depth]],
+        'asks': [[float(price), float(amount)] for price, amount in snapshot['asks'][:depth]],
+        'nonce': snapshot['lastUpdateId'],
+    }
+
+
+def build_stream(snapshot, count):
+    rng = random.Random(1)
+    deltas = []
+    for side in ('bids', 'asks'):
+        prices = [level[0] for level in snapshot[side]]
+        low, high = min(prices), max(prices)
+        for _ in range(count // 2):
+            if rng.random() < 0.5:
+                price = rng.choice(prices)  # update or delete an existing level
+            else:
+                price = round(rng.uniform(low, high), 2)  # a new level anywhere in the book
+            amount = 0.0 if rng.random() < 0.3 else round(rng.uniform(0.001, 5), 5)
+            deltas.append((side, price, amount))
+    rng.shuffle(deltas)
+    return deltas
+
+
+def run(book_class, snapshot, stream):
+    book = book_class(snapshot)
+    bids = book['bids']
+    asks = book['asks']
+    start = time.perf_counter()
+    for side, price, amount in stream:
+        (bids if side == 'bids' else asks).store(price, amount)
+    elapsed = time.perf_counter() - start
+    return elapsed, book
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    snapshot = load_snapshot(depth)
+    stream = build_stream(snapshot, count)
+    results = {}
+    books = {}
+    for name, book_class in (('list', OrderBook), ('chunked', ChunkedOrderBook)):
+        results[name], books[name] = run(book_class, snapshot, stream)
+    assert list(books['list']['bids']) == list(books['chunked']['bids'])
+    assert list(books['list']['asks']) == list(books['chunked']['asks'])
+    print('deltas:', len(stream), 'initial depth per side:', depth, 'final depth per side:', len(books['list']['bids']), len(books['list']['asks']))
+    for name, elapsed in results.items():
+        print(name.ljust(8), str(round(elapsed * 1000, 1)).rjust(10), 'ms', str(round(elapsed * 1e9 / len(stream))).rjust(8), 'ns/delta')
+
+
+if __name__ == '__main__':
+    main()
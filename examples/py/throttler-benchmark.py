@@ -0,0 +1,41 @@
+import os
+import sys
+import asyncio
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.async_support.base.throttler import Throttler  # noqa: E402
+
+# keeps the async Throttler saturated with a few hundred queued requests and
+# reports how much CPU time the event loop burns while it mostly waits, along
+# with the queue depth and wait-time statistics of the throttler
+#
+#     python examples/py/throttler-benchmark.py [requests] [rateLimit in ms]
+
+
+async def saturate(config, count):
+    throttler = Throttler(config)
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    await asyncio.gather(*[throttler() for _ in range(count)])
+    return time.perf_counter() - wall, time.process_time() - cpu, throttler.stats()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rate_limit = float(sys.argv[2]) if len(sys.argv) > 2 else 10
+    configs = {
+        'leakyBucket': {'refillRate': 1 / rate_limit, 'capacity': 1, 'rateLimit': rate_limit},
+        # a window that only admits a tenth of the requests at once
+        'rollingWindow': {'algorithm': 'rollingWindow', 'windowSize': count * rate_limit / 10, 'rateLimit': rate_limit},
+    }
+    print('requests:', count, 'rateLimit:', rate_limit, 'ms')
+    for name, config in configs.items():
+        wall, cpu, stats = asyncio.run(saturate(config, count))
+        print(name.ljust(14), 'wall', (str(round(wall, 2)) + ' s').rjust(8), 'cpu', (str(round(cpu * 1000, 1)) + ' ms').rjust(10), '(' + str(round(cpu / wall * 100, 2)) + '%)', 'max queue', stats['maxQueue'], 'average wait', str(round(stats['averageWait'])) + ' ms')
+
+
+if __name__ == '__main__':
+    main()
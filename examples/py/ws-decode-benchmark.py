@@ -0,0 +1,109 @@
+import os
+import sys
+import glob
+import gzip
+import json
+import time
+import zlib
+from collections import namedtuple
+from gzip import GzipFile
+from io import BytesIO
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from aiohttp import WSMsgType  # noqa: E402
+from ccxt.async_support.base.ws.client import Client, json_parser  # noqa: E402
+from ccxt.async_support.base.ws.functions import is_json_encoded_object  # noqa: E402
+
+# replays the messages recorded in ts/src/test/static/ws as gzip, deflate and
+# context takeover deflate frames through Client.handle_message() and compares the
+# messages per second with the decoding the client did before, which turned every
+# frame into text first and gunzipped through GzipFile
+#
+#     python examples/py/ws-decode-benchmark.py [rounds]
+
+Message = namedtuple('Message', ['type', 'data'])
+
+
+def recorded_messages():
+    messages = []
+    for path in sorted(glob.glob(os.path.join(root, 'ts', 'src', 'test', 'static', 'ws', '*.json'))):
+        with open(path) as file:
+            recorded = json.load(file)
+        for tests in recorded['methods'].values():
+            for test in tests:
+                for message in test['messages']:
+                    if isinstance(message, (dict, list)):
+                        messages.append(json.dumps(message, separators=(',', ':')).encode('utf-8'))
+    # orjson does not read integers beyond 64 bits
+    return [message for message in messages if parses(message)]
+
+
+def parses(message):
+    try:
+        json_parser.loads(message)
+        return True
+    except ValueError:
+        return False
+
+
+def deflate_frames(messages, takeover):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+    frames = []
+    for message in messages:
+        if not takeover:
+            compressor = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+            frames.append(compressor.compress(message) + compressor.flush())
+        else:
+            frames.append((compressor.compress(message) + compressor.flush(zlib.Z_SYNC_FLUSH))[:-4])
+    return frames
+
+
+def previous_decode(data, gunzip):
+    # Client.handle_message() and handle_text_or_binary_message() as they were
+    if gunzip:
+        data = GzipFile('', 'rb', 9, BytesIO(data)).read().decode('utf-8')
+    else:
+        data = zlib.decompress(data, -zlib.MAX_WBITS)
+    if isinstance(data, bytes):
+        data = data.decode()
+    return json_parser.loads(data) if is_json_encoded_object(data) else data
+
+
+def rate(count, seconds):
+    return str(round(count / seconds)).rjust(8) + ' msg/s'
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    messages = recorded_messages()
+    count = len(messages) * rounds
+    print('recorded messages:', len(messages), 'rounds:', rounds, 'json parser:', json_parser.__name__)
+    received = []
+    for name, frames, config in [
+        ('gzip', [gzip.compress(message) for message in messages], {'gunzip': True}),
+        ('deflate', deflate_frames(messages, False), {'inflate': True}),
+        ('deflate stream', deflate_frames(messages, True), {'inflateStream': True}),
+    ]:
+        if name != 'deflate stream':
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for frame in frames:
+                    received.append(previous_decode(frame, config.get('gunzip')))
+            previous = time.perf_counter() - start
+        received.clear()
+        client = Client('wss://example.com', lambda client, message: received.append(message), None, None, None, config)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            client.inflater = zlib.decompressobj(-zlib.MAX_WBITS) if client.inflateStream else None  # as open() does
+            for frame in frames:
+                client.handle_message(Message(WSMsgType.BINARY, frame))
+        current = time.perf_counter() - start
+        assert len(received) == count
+        received.clear()
+        print(name.ljust(16), 'before', rate(count, previous) if name != 'deflate stream' else 'unsupported'.rjust(14), 'after', rate(count, current))
+
+
+if __name__ == '__main__':
+    main()
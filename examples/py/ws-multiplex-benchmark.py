@@ -0,0 +1,50 @@
+import os
+import sys
+import time
+import asyncio
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support.base.ws.future import Future  # noqa: E402
+
+# calls watch_multiple() over a wide set of message hashes in a loop, each call
+# answered by an update of one of them, and compares the updates per second with
+# the race over a client future per message hash the calls used to set up
+#
+#     python examples/py/ws-multiplex-benchmark.py [hashes] [updates]
+
+URL = 'wss://localhost/ws'
+
+
+async def watch_loop(exchange, client, message_hashes, updates, wait):
+    start = time.perf_counter()
+    for i in range(updates):
+        future = wait(message_hashes)
+        client.resolve(i, message_hashes[i % len(message_hashes)])
+        await future
+    return updates / (time.perf_counter() - start)
+
+
+async def main(hashes, updates):
+    exchange = Exchange({'id': 'multiplexbenchmark'})
+    try:
+        client = exchange.client(URL)
+        client.connected.resolve(URL)
+        message_hashes = ['orderbook:' + str(i) + '/USDT' for i in range(hashes)]
+
+        def race(message_hashes):
+            return Future.race([client.future(message_hash) for message_hash in message_hashes])
+
+        before = await watch_loop(exchange, client, message_hashes, updates, race)
+        after = await watch_loop(exchange, client, message_hashes, updates, lambda message_hashes: exchange.watch_multiple(URL, message_hashes))
+        print(hashes, 'message hashes')
+        print('future race', round(before), 'updates/s')
+        print('multiplexer', round(after), 'updates/s')
+    finally:
+        await exchange.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 300, int(sys.argv[2]) if len(sys.argv) > 2 else 2000))
@@ -26,7 +26,10 @@ __version__ = '4.5.75'
 
 # ----------------------------------------------------------------------------
 
+from typing import TYPE_CHECKING
+
 from ccxt.base.exchange import Exchange                     # noqa: F401
+from ccxt.base.lazy_exchanges import lazy_exchanges
 from ccxt.base.precise import Precise                       # noqa: F401
 
 from ccxt.base.decimal_to_precision import decimal_to_precision  # noqa: F401
@@ -84,109 +87,112 @@ from ccxt.base.errors import CancelPending                            # noqa: F4
 from ccxt.base.errors import UnsubscribeError                         # noqa: F401
 from ccxt.base.errors import error_hierarchy                          # noqa: F401
 
-from ccxt.alpaca import alpaca                                        # noqa: F401
-from ccxt.apex import apex                                            # noqa: F401
-from ccxt.aster import aster                                          # noqa: F401
-from ccxt.backpack import backpack                                    # noqa: F401
-from ccxt.bequant import bequant                                      # noqa: F401
-from ccxt.bigone import bigone                                        # noqa: F401
-from ccxt.binance import binance                                      # noqa: F401
-from ccxt.binancecoinm import binancecoinm                            # noqa: F401
-from ccxt.binanceus import binanceus                                  # noqa: F401
-from ccxt.binanceusdm import binanceusdm                              # noqa: F401
-from ccxt.bingx import bingx                                          # noqa: F401
-from ccxt.bit2c import bit2c                                          # noqa: F401
-from ccxt.bitbank import bitbank                                      # noqa: F401
-from ccxt.bitbns import bitbns                                        # noqa: F401
-from ccxt.bitfinex import bitfinex                                    # noqa: F401
-from ccxt.bitflyer import bitflyer                                    # noqa: F401
-from ccxt.bitget import bitget                                        # noqa: F401
-from ccxt.bithumb import bithumb                                      # noqa: F401
-from ccxt.bitmex import bitmex                                        # noqa: F401
-from ccxt.bitopro import bitopro                                      # noqa: F401
-from ccxt.bitrue import bitrue                                        # noqa: F401
-from ccxt.bitso import bitso                                          # noqa: F401
-from ccxt.bitstamp import bitstamp                                    # noqa: F401
-from ccxt.bitteam import bitteam                                      # noqa: F401
-from ccxt.bittrade import bittrade                                    # noqa: F401
-from ccxt.bitvavo import bitvavo                                      # noqa: F401
-from ccxt.blockchaincom import blockchaincom                          # noqa: F401
-from ccxt.blofin import blofin                                        # noqa: F401
-from ccxt.btcbox import btcbox                                        # noqa: F401
-from ccxt.btcmarkets import btcmarkets                                # noqa: F401
-from ccxt.btcturk import btcturk                                      # noqa: F401
-from ccxt.btse import btse                                            # noqa: F401
-from ccxt.bullish import bullish                                      # noqa: F401
-from ccxt.bybit import bybit                                          # noqa: F401
-from ccxt.bybiteu import bybiteu                                      # noqa: F401
-from ccxt.bydfi import bydfi                                          # noqa: F401
-from ccxt.cex import cex                                              # noqa: F401
-from ccxt.coinbase import coinbase                                    # noqa: F401
-from ccxt.coinbaseexchange import coinbaseexchange                    # noqa: F401
-from ccxt.coinbaseinternational import coinbaseinternational          # noqa: F401
-from ccxt.coincheck import coincheck                                  # noqa: F401
-from ccxt.coinex import coinex                                        # noqa: F401
-from ccxt.coinmate import coinmate                                    # noqa: F401
-from ccxt.coinone import coinone                                      # noqa: F401
-from ccxt.coinsph import coinsph                                      # noqa: F401
-from ccxt.coinspot import coinspot                                    # noqa: F401
-from ccxt.cryptocom import cryptocom                                  # noqa: F401
-from ccxt.cryptomus import cryptomus                                  # noqa: F401
-from ccxt.deepcoin import deepcoin                                    # noqa: F401
-from ccxt.delta import delta                                          # noqa: F401
-from ccxt.deribit import deribit                                      # noqa: F401
-from ccxt.derive import derive                                        # noqa: F401
-from ccxt.digifinex import digifinex                                  # noqa: F401
-from ccxt.dydx import dydx                                            # noqa: F401
-from ccxt.extended import extended                                    # noqa: F401
-from ccxt.fmfwio import fmfwio                                        # noqa: F401
-from ccxt.foxbit import foxbit                                        # noqa: F401
-from ccxt.gate import gate                                            # noqa: F401
-from ccxt.gateeu import gateeu                                        # noqa: F401
-from ccxt.gemini import gemini                                        # noqa: F401
-from ccxt.grvt import grvt                                            # noqa: F401
-from ccxt.hashkey import hashkey                                      # noqa: F401
-from ccxt.hibachi import hibachi                                      # noqa: F401
-from ccxt.hitbtc import hitbtc                                        # noqa: F401
-from ccxt.hollaex import hollaex                                      # noqa: F401
-from ccxt.htx import htx                                              # noqa: F401
-from ccxt.hyperliquid import hyperliquid                              # noqa: F401
-from ccxt.independentreserve import independentreserve                # noqa: F401
-from ccxt.indodax import indodax                                      # noqa: F401
-from ccxt.kraken import kraken                                        # noqa: F401
-from ccxt.krakenfutures import krakenfutures                          # noqa: F401
-from ccxt.kucoin import kucoin                                        # noqa: F401
-from ccxt.kucoinfutures import kucoinfutures                          # noqa: F401
-from ccxt.latoken import latoken                                      # noqa: F401
-from ccxt.lbank import lbank                                          # noqa: F401
-from ccxt.lighter import lighter                                      # noqa: F401
-from ccxt.luno import luno                                            # noqa: F401
-from ccxt.mercado import mercado                                      # noqa: F401
-from ccxt.mexc import mexc                                            # noqa: F401
-from ccxt.modetrade import modetrade                                  # noqa: F401
-from ccxt.mudrex import mudrex                                        # noqa: F401
-from ccxt.myokx import myokx                                          # noqa: F401
-from ccxt.nado import nado                                            # noqa: F401
-from ccxt.ndax import ndax                                            # noqa: F401
-from ccxt.okx import okx                                              # noqa: F401
-from ccxt.okxus import okxus                                          # noqa: F401
-from ccxt.onetrading import onetrading                                # noqa: F401
-from ccxt.p2b import p2b                                              # noqa: F401
-from ccxt.pacifica import pacifica                                    # noqa: F401
-from ccxt.paradex import paradex                                      # noqa: F401
-from ccxt.paymium import paymium                                      # noqa: F401
-from ccxt.phemex import phemex                                        # noqa: F401
-from ccxt.poloniex import poloniex                                    # noqa: F401
-from ccxt.tokocrypto import tokocrypto                                # noqa: F401
-from ccxt.toobit import toobit                                        # noqa: F401
-from ccxt.upbit import upbit                                          # noqa: F401
-from ccxt.weex import weex                                            # noqa: F401
-from ccxt.whitebit import whitebit                                    # noqa: F401
-from ccxt.woo import woo                                              # noqa: F401
-from ccxt.woofipro import woofipro                                    # noqa: F401
-from ccxt.xt import xt                                                # noqa: F401
-from ccxt.zaif import zaif                                            # noqa: F401
-from ccxt.zebpay import zebpay                                        # noqa: F401
+# the exchanges are imported on first access, see lazy_exchanges() at the bottom,
+# the imports below are only there for type checkers and editors
+if TYPE_CHECKING:
+    from ccxt.alpaca import alpaca                                        # noqa: F401
+    from ccxt.apex import apex                                            # noqa: F401
+    from ccxt.aster import aster                                          # noqa: F401
+    from ccxt.backpack import backpack                                    # noqa: F401
+    from ccxt.bequant import bequant                                      # noqa: F401
+    from ccxt.bigone import bigone                                        # noqa: F401
+    from ccxt.binance import binance                                      # noqa: F401
+    from ccxt.binancecoinm import binancecoinm                            # noqa: F401
+    from ccxt.binanceus import binanceus                                  # noqa: F401
+    from ccxt.binanceusdm import binanceusdm                              # noqa: F401
+    from ccxt.bingx import bingx                                          # noqa: F401
+    from ccxt.bit2c import bit2c                                          # noqa: F401
+    from ccxt.bitbank import bitbank                                      # noqa: F401
+    from ccxt.bitbns import bitbns                                        # noqa: F401
+    from ccxt.bitfinex import bitfinex                                    # noqa: F401
+    from ccxt.bitflyer import bitflyer                                    # noqa: F401
+    from ccxt.bitget import bitget                                        # noqa: F401
+    from ccxt.bithumb import bithumb                                      # noqa: F401
+    from ccxt.bitmex import bitmex                                        # noqa: F401
+    from ccxt.bitopro import bitopro                                      # noqa: F401
+    from ccxt.bitrue import bitrue                                        # noqa: F401
+    from ccxt.bitso import bitso                                          # noqa: F401
+    from ccxt.bitstamp import bitstamp                                    # noqa: F401
+    from ccxt.bitteam import bitteam                                      # noqa: F401
+    from ccxt.bittrade import bittrade                                    # noqa: F401
+    from ccxt.bitvavo import bitvavo                                      # noqa: F401
+    from ccxt.blockchaincom import blockchaincom                          # noqa: F401
+    from ccxt.blofin import blofin                                        # noqa: F401
+    from ccxt.btcbox import btcbox                                        # noqa: F401
+    from ccxt.btcmarkets import btcmarkets                                # noqa: F401
+    from ccxt.btcturk import btcturk                                      # noqa: F401
+    from ccxt.btse import btse                                            # noqa: F401
+    from ccxt.bullish import bullish                                      # noqa: F401
+    from ccxt.bybit import bybit                                          # noqa: F401
+    from ccxt.bybiteu import bybiteu                                      # noqa: F401
+    from ccxt.bydfi import bydfi                                          # noqa: F401
+    from ccxt.cex import cex                                              # noqa: F401
+    from ccxt.coinbase import coinbase                                    # noqa: F401
+    from ccxt.coinbaseexchange import coinbaseexchange                    # noqa: F401
+    from ccxt.coinbaseinternational import coinbaseinternational          # noqa: F401
+    from ccxt.coincheck import coincheck                                  # noqa: F401
+    from ccxt.coinex import coinex                                        # noqa: F401
+    from ccxt.coinmate import coinmate                                    # noqa: F401
+    from ccxt.coinone import coinone                                      # noqa: F401
+    from ccxt.coinsph import coinsph                                      # noqa: F401
+    from ccxt.coinspot import coinspot                                    # noqa: F401
+    from ccxt.cryptocom import cryptocom                                  # noqa: F401
+    from ccxt.cryptomus import cryptomus                                  # noqa: F401
+    from ccxt.deepcoin import deepcoin                                    # noqa: F401
+    from ccxt.delta import delta                                          # noqa: F401
+    from ccxt.deribit import deribit                                      # noqa: F401
+    from ccxt.derive import derive                                        # noqa: F401
+    from ccxt.digifinex import digifinex                                  # noqa: F401
+    from ccxt.dydx import dydx                                            # noqa: F401
+    from ccxt.extended import extended                                    # noqa: F401
+    from ccxt.fmfwio import fmfwio                                        # noqa: F401
+    from ccxt.foxbit import foxbit                                        # noqa: F401
+    from ccxt.gate import gate                                            # noqa: F401
+    from ccxt.gateeu import gateeu                                        # noqa: F401
+    from ccxt.gemini import gemini                                        # noqa: F401
+    from ccxt.grvt import grvt                                            # noqa: F401
+    from ccxt.hashkey import hashkey                                      # noqa: F401
+    from ccxt.hibachi import hibachi                                      # noqa: F401
+    from ccxt.hitbtc import hitbtc                                        # noqa: F401
+    from ccxt.hollaex import hollaex                                      # noqa: F401
+    from ccxt.htx import htx                                              # noqa: F401
+    from ccxt.hyperliquid import hyperliquid                              # noqa: F401
+    from ccxt.independentreserve import independentreserve                # noqa: F401
+    from ccxt.indodax import indodax                                      # noqa: F401
+    from ccxt.kraken import kraken                                        # noqa: F401
+    from ccxt.krakenfutures import krakenfutures                          # noqa: F401
+    from ccxt.kucoin import kucoin                                        # noqa: F401
+    from ccxt.kucoinfutures import kucoinfutures                          # noqa: F401
+    from ccxt.latoken import latoken                                      # noqa: F401
+    from ccxt.lbank import lbank                                          # noqa: F401
+    from ccxt.lighter import lighter                                      # noqa: F401
+    from ccxt.luno import luno                                            # noqa: F401
+    from ccxt.mercado import mercado                                      # noqa: F401
+    from ccxt.mexc import mexc                                            # noqa: F401
+    from ccxt.modetrade import modetrade                                  # noqa: F401
+    from ccxt.mudrex import mudrex                                        # noqa: F401
+    from ccxt.myokx import myokx                                          # noqa: F401
+    from ccxt.nado import nado                                            # noqa: F401
+    from ccxt.ndax import ndax                                            # noqa: F401
+    from ccxt.okx import okx                                              # noqa: F401
+    from ccxt.okxus import okxus                                          # noqa: F401
+    from ccxt.onetrading import onetrading                                # noqa: F401
+    from ccxt.p2b import p2b                                              # noqa: F401
+    from ccxt.pacifica import pacifica                                    # noqa: F401
+    from ccxt.paradex import paradex                                      # noqa: F401
+    from ccxt.paymium import paymium                                      # noqa: F401
+    from ccxt.phemex import phemex                                        # noqa: F401
+    from ccxt.poloniex import poloniex                                    # noqa: F401
+    from ccxt.tokocrypto import tokocrypto                                # noqa: F401
+    from ccxt.toobit import toobit                                        # noqa: F401
+    from ccxt.upbit import upbit                                          # noqa: F401
+    from ccxt.weex import weex                                            # noqa: F401
+    from ccxt.whitebit import whitebit                                    # noqa: F401
+    from ccxt.woo import woo                                              # noqa: F401
+    from ccxt.woofipro import woofipro                                    # noqa: F401
+    from ccxt.xt import xt                                                # noqa: F401
+    from ccxt.zaif import zaif                                            # noqa: F401
+    from ccxt.zebpay import zebpay                                        # noqa: F401
 
 exchanges = [
     'alpaca',
@@ -302,3 +308,6 @@ base = [
 ]
 
 __all__ = base + errors.__all__ + exchanges
+
+# PEP 562, `ccxt.binance` imports the binance module the first time it is accessed
+__getattr__, __dir__ = lazy_exchanges(__name__)
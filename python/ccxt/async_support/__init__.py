@@ -8,7 +8,10 @@ __version__ = '4.5.75'
 
 # -----------------------------------------------------------------------------
 
+from typing import TYPE_CHECKING
+
 from ccxt.async_support.base.exchange import Exchange                   # noqa: F401
+from ccxt.base.lazy_exchanges import lazy_exchanges
 
 from ccxt.base.decimal_to_precision import decimal_to_precision  # noqa: F401
 from ccxt.base.decimal_to_precision import TRUNCATE              # noqa: F401
@@ -64,109 +67,112 @@ from ccxt.base.errors import UnsubscribeError                         # noqa: F4
 from ccxt.base.errors import error_hierarchy                          # noqa: F401
 
 
-from ccxt.async_support.alpaca import alpaca                                    # noqa: F401
-from ccxt.async_support.apex import apex                                        # noqa: F401
-from ccxt.async_support.aster import aster                                      # noqa: F401
-from ccxt.async_support.backpack import backpack                                # noqa: F401
-from ccxt.async_support.bequant import bequant                                  # noqa: F401
-from ccxt.async_support.bigone import bigone                                    # noqa: F401
-from ccxt.async_support.binance import binance                                  # noqa: F401
-from ccxt.async_support.binancecoinm import binancecoinm                        # noqa: F401
-from ccxt.async_support.binanceus import binanceus                              # noqa: F401
-from ccxt.async_support.binanceusdm import binanceusdm                          # noqa: F401
-from ccxt.async_support.bingx import bingx                                      # noqa: F401
-from ccxt.async_support.bit2c import bit2c                                      # noqa: F401
-from ccxt.async_support.bitbank import bitbank                                  # noqa: F401
-from ccxt.async_support.bitbns import bitbns                                    # noqa: F401
-from ccxt.async_support.bitfinex import bitfinex                                # noqa: F401
-from ccxt.async_support.bitflyer import bitflyer                                # noqa: F401
-from ccxt.async_support.bitget import bitget                                    # noqa: F401
-from ccxt.async_support.bithumb import bithumb                                  # noqa: F401
-from ccxt.async_support.bitmex import bitmex                                    # noqa: F401
-from ccxt.async_support.bitopro import bitopro                                  # noqa: F401
-from ccxt.async_support.bitrue import bitrue                                    # noqa: F401
-from ccxt.async_support.bitso import bitso                                      # noqa: F401
-from ccxt.async_support.bitstamp import bitstamp                                # noqa: F401
-from ccxt.async_support.bitteam import bitteam                                  # noqa: F401
-from ccxt.async_support.bittrade import bittrade                                # noqa: F401
-from ccxt.async_support.bitvavo import bitvavo                                  # noqa: F401
-from ccxt.async_support.blockchaincom import blockchaincom                      # noqa: F401
-from ccxt.async_support.blofin import blofin                                    # noqa: F401
-from ccxt.async_support.btcbox import btcbox                                    # noqa: F401
-from ccxt.async_support.btcmarkets import btcmarkets                            # noqa: F401
-from ccxt.async_support.btcturk import btcturk                                  # noqa: F401
-from ccxt.async_support.btse import btse                                        # noqa: F401
-from ccxt.async_support.bullish import bullish                                  # noqa: F401
-from ccxt.async_support.bybit import bybit                                      # noqa: F401
-from ccxt.async_support.bybiteu import bybiteu                                  # noqa: F401
-from ccxt.async_support.bydfi import bydfi                                      # noqa: F401
-from ccxt.async_support.cex import cex                                          # noqa: F401
-from ccxt.async_support.coinbase import coinbase                                # noqa: F401
-from ccxt.async_support.coinbaseexchange import coinbaseexchange                # noqa: F401
-from ccxt.async_support.coinbaseinternational import coinbaseinternational      # noqa: F401
-from ccxt.async_support.coincheck import coincheck                              # noqa: F401
-from ccxt.async_support.coinex import coinex                                    # noqa: F401
-from ccxt.async_support.coinmate import coinmate                                # noqa: F401
-from ccxt.async_support.coinone import coinone                                  # noqa: F401
-from ccxt.async_support.coinsph import coinsph                                  # noqa: F401
-from ccxt.async_support.coinspot import coinspot                                # noqa: F401
-from ccxt.async_support.cryptocom import cryptocom                              # noqa: F401
-from ccxt.async_support.cryptomus import cryptomus                              # noqa: F401
-from ccxt.async_support.deepcoin import deepcoin                                # noqa: F401
-from ccxt.async_support.delta import delta                                      # noqa: F401
-from ccxt.async_support.deribit import deribit                                  # noqa: F401
-from ccxt.async_support.derive import derive                                    # noqa: F401
-from ccxt.async_support.digifinex import digifinex                              # noqa: F401
-from ccxt.async_support.dydx import dydx                                        # noqa: F401
-from ccxt.async_support.extended import extended                                # noqa: F401
-from ccxt.async_support.fmfwio import fmfwio                                    # noqa: F401
-from ccxt.async_support.foxbit import foxbit                                    # noqa: F401
-from ccxt.async_support.gate import gate                                        # noqa: F401
-from ccxt.async_support.gateeu import gateeu                                    # noqa: F401
-from ccxt.async_support.gemini import gemini                                    # noqa: F401
-from ccxt.async_support.grvt import grvt                                        # noqa: F401
-from ccxt.async_support.hashkey import hashkey                                  # noqa: F401
-from ccxt.async_support.hibachi import hibachi                                  # noqa: F401
-from ccxt.async_support.hitbtc import hitbtc                                    # noqa: F401
-from ccxt.async_support.hollaex import hollaex                                  # noqa: F401
-from ccxt.async_support.htx import htx                                          # noqa: F401
-from ccxt.async_support.hyperliquid import hyperliquid                          # noqa: F401
-from ccxt.async_support.independentreserve import independentreserve            # noqa: F401
-from ccxt.async_support.indodax import indodax                                  # noqa: F401
-from ccxt.async_support.kraken import kraken                                    # noqa: F401
-from ccxt.async_support.krakenfutures import krakenfutures                      # noqa: F401
-from ccxt.async_support.kucoin import kucoin                                    # noqa: F401
-from ccxt.async_support.kucoinfutures import kucoinfutures                      # noqa: F401
-from ccxt.async_support.latoken import latoken                                  # noqa: F401
-from ccxt.async_support.lbank import lbank                                      # noqa: F401
-from ccxt.async_support.lighter import lighter                                  # noqa: F401
-from ccxt.async_support.luno import luno                                        # noqa: F401
-from ccxt.async_support.mercado import mercado                                  # noqa: F401
-from ccxt.async_support.mexc import mexc                                        # noqa: F401
-from ccxt.async_support.modetrade import modetrade                              # noqa: F401
-from ccxt.async_support.mudrex import mudrex                                    # noqa: F401
-from ccxt.async_support.myokx import myokx                                      # noqa: F401
-from ccxt.async_support.nado import nado                                        # noqa: F401
-from ccxt.async_support.ndax import ndax                                        # noqa: F401
-from ccxt.async_support.okx import okx                                          # noqa: F401
-from ccxt.async_support.okxus import okxus                                      # noqa: F401
-from ccxt.async_support.onetrading import onetrading                            # noqa: F401
-from ccxt.async_support.p2b import p2b                                          # noqa: F401
-from ccxt.async_support.pacifica import pacifica                                # noqa: F401
-from ccxt.async_support.paradex import paradex                                  # noqa: F401
-from ccxt.async_support.paymium import paymium                                  # noqa: F401
-from ccxt.async_support.phemex import phemex                                    # noqa: F401
-from ccxt.async_support.poloniex import poloniex                                # noqa: F401
-from ccxt.async_support.tokocrypto import tokocrypto                            # noqa: F401
-from ccxt.async_support.toobit import toobit                                    # noqa: F401
-from ccxt.async_support.upbit import upbit                                      # noqa: F401
-from ccxt.async_support.weex import weex                                        # noqa: F401
-from ccxt.async_support.whitebit import whitebit                                # noqa: F401
-from ccxt.async_support.woo import woo                                          # noqa: F401
-from ccxt.async_support.woofipro import woofipro                                # noqa: F401
-from ccxt.async_support.xt import xt                                            # noqa: F401
-from ccxt.async_support.zaif import zaif                                        # noqa: F401
-from ccxt.async_support.zebpay import zebpay                                    # noqa: F401
+# the exchanges are imported on first access, see lazy_exchanges() at the bottom,
+# the imports below are only there for type checkers and editors
+if TYPE_CHECKING:
+    from ccxt.async_support.alpaca import alpaca                                    # noqa: F401
+    from ccxt.async_support.apex import apex                                        # noqa: F401
+    from ccxt.async_support.aster import aster                                      # noqa: F401
+    from ccxt.async_support.backpack import backpack                                # noqa: F401
+    from ccxt.async_support.bequant import bequant                                  # noqa: F401
+    from ccxt.async_support.bigone import bigone                                    # noqa: F401
+    from ccxt.async_support.binance import binance                                  # noqa: F401
+    from ccxt.async_support.binancecoinm import binancecoinm                        # noqa: F401
+    from ccxt.async_support.binanceus import binanceus                              # noqa: F401
+    from ccxt.async_support.binanceusdm import binanceusdm                          # noqa: F401
+    from ccxt.async_support.bingx import bingx                                      # noqa: F401
+    from ccxt.async_support.bit2c import bit2c                                      # noqa: F401
+    from ccxt.async_support.bitbank import bitbank                                  # noqa: F401
+    from ccxt.async_support.bitbns import bitbns                                    # noqa: F401
+    from ccxt.async_support.bitfinex import bitfinex                                # noqa: F401
+    from ccxt.async_support.bitflyer import bitflyer                                # noqa: F401
+    from ccxt.async_support.bitget import bitget                                    # noqa: F401
+    from ccxt.async_support.bithumb import bithumb                                  # noqa: F401
+    from ccxt.async_support.bitmex import bitmex                                    # noqa: F401
+    from ccxt.async_support.bitopro import bitopro                                  # noqa: F401
+    from ccxt.async_support.bitrue import bitrue                                    # noqa: F401
+    from ccxt.async_support.bitso import bitso                                      # noqa: F401
+    from ccxt.async_support.bitstamp import bitstamp                                # noqa: F401
+    from ccxt.async_support.bitteam import bitteam                                  # noqa: F401
+    from ccxt.async_support.bittrade import bittrade                                # noqa: F401
+    from ccxt.async_support.bitvavo import bitvavo                                  # noqa: F401
+    from ccxt.async_support.blockchaincom import blockchaincom                      # noqa: F401
+    from ccxt.async_support.blofin import blofin                                    # noqa: F401
+    from ccxt.async_support.btcbox import btcbox                                    # noqa: F401
+    from ccxt.async_support.btcmarkets import btcmarkets                            # noqa: F401
+    from ccxt.async_support.btcturk import btcturk                                  # noqa: F401
+    from ccxt.async_support.btse import btse                                        # noqa: F401
+    from ccxt.async_support.bullish import bullish                                  # noqa: F401
+    from ccxt.async_support.bybit import bybit                                      # noqa: F401
+    from ccxt.async_support.bybiteu import bybiteu                                  # noqa: F401
+    from ccxt.async_support.bydfi import bydfi                                      # noqa: F401
+    from ccxt.async_support.cex import cex                                          # noqa: F401
+    from ccxt.async_support.coinbase import coinbase                                # noqa: F401
+    from ccxt.async_support.coinbaseexchange import coinbaseexchange                # noqa: F401
+    from ccxt.async_support.coinbaseinternational import coinbaseinternational      # noqa: F401
+    from ccxt.async_support.coincheck import coincheck                              # noqa: F401
+    from ccxt.async_support.coinex import coinex                                    # noqa: F401
+    from ccxt.async_support.coinmate import coinmate                                # noqa: F401
+    from ccxt.async_support.coinone import coinone                                  # noqa: F401
+    from ccxt.async_support.coinsph import coinsph                                  # noqa: F401
+    from ccxt.async_support.coinspot import coinspot                                # noqa: F401
+    from ccxt.async_support.cryptocom import cryptocom                              # noqa: F401
+    from ccxt.async_support.cryptomus import cryptomus                              # noqa: F401
+    from ccxt.async_support.deepcoin import deepcoin                                # noqa: F401
+    from ccxt.async_support.delta import delta                                      # noqa: F401
+    from ccxt.async_support.deribit import deribit                                  # noqa: F401
+    from ccxt.async_support.derive import derive                                    # noqa: F401
+    from ccxt.async_support.digifinex import digifinex                              # noqa: F401
+    from ccxt.async_support.dydx import dydx                                        # noqa: F401
+    from ccxt.async_support.extended import extended                                # noqa: F401
+    from ccxt.async_support.fmfwio import fmfwio                                    # noqa: F401
+    from ccxt.async_support.foxbit import foxbit                                    # noqa: F401
+    from ccxt.async_support.gate import gate                                        # noqa: F401
+    from ccxt.async_support.gateeu import gateeu                                    # noqa: F401
+    from ccxt.async_support.gemini import gemini                                    # noqa: F401
+    from ccxt.async_support.grvt import grvt                                        # noqa: F401
+    from ccxt.async_support.hashkey import hashkey                                  # noqa: F401
+    from ccxt.async_support.hibachi import hibachi                                  # noqa: F401
+    from ccxt.async_support.hitbtc import hitbtc                                    # noqa: F401
+    from ccxt.async_support.hollaex import hollaex                                  # noqa: F401
+    from ccxt.async_support.htx import htx                                          # noqa: F401
+    from ccxt.async_support.hyperliquid import hyperliquid                          # noqa: F401
+    from ccxt.async_support.independentreserve import independentreserve            # noqa: F401
+    from ccxt.async_support.indodax import indodax                                  # noqa: F401
+    from ccxt.async_support.kraken import kraken                                    # noqa: F401
+    from ccxt.async_support.krakenfutures import krakenfutures                      # noqa: F401
+    from ccxt.async_support.kucoin import kucoin                                    # noqa: F401
+    from ccxt.async_support.kucoinfutures import kucoinfutures                      # noqa: F401
+    from ccxt.async_support.latoken import latoken                                  # noqa: F401
+    from ccxt.async_support.lbank import lbank                                      # noqa: F401
+    from ccxt.async_support.lighter import lighter                                  # noqa: F401
+    from ccxt.async_support.luno import luno                                        # noqa: F401
+    from ccxt.async_support.mercado import mercado                                  # noqa: F401
+    from ccxt.async_support.mexc import mexc                                        # noqa: F401
+    from ccxt.async_support.modetrade import modetrade                              # noqa: F401
+    from ccxt.async_support.mudrex import mudrex                                    # noqa: F401
+    from ccxt.async_support.myokx import myokx                                      # noqa: F401
+    from ccxt.async_support.nado import nado                                        # noqa: F401
+    from ccxt.async_support.ndax import ndax                                        # noqa: F401
+    from ccxt.async_support.okx import okx                                          # noqa: F401
+    from ccxt.async_support.okxus import okxus                                      # noqa: F401
+    from ccxt.async_support.onetrading import onetrading                            # noqa: F401
+    from ccxt.async_support.p2b import p2b                                          # noqa: F401
+    from ccxt.async_support.pacifica import pacifica                                # noqa: F401
+    from ccxt.async_support.paradex import paradex                                  # noqa: F401
+    from ccxt.async_support.paymium import paymium                                  # noqa: F401
+    from ccxt.async_support.phemex import phemex                                    # noqa: F401
+    from ccxt.async_support.poloniex import poloniex                                # noqa: F401
+    from ccxt.async_support.tokocrypto import tokocrypto                            # noqa: F401
+    from ccxt.async_support.toobit import toobit                                    # noqa: F401
+    from ccxt.async_support.upbit import upbit                                      # noqa: F401
+    from ccxt.async_support.weex import weex                                        # noqa: F401
+    from ccxt.async_support.whitebit import whitebit                                # noqa: F401
+    from ccxt.async_support.woo import woo                                          # noqa: F401
+    from ccxt.async_support.woofipro import woofipro                                # noqa: F401
+    from ccxt.async_support.xt import xt                                            # noqa: F401
+    from ccxt.async_support.zaif import zaif                                        # noqa: F401
+    from ccxt.async_support.zebpay import zebpay                                    # noqa: F401
 
 exchanges = [
     'alpaca',
@@ -281,3 +287,6 @@ base = [
 ]
 
 __all__ = base + errors.__all__ + exchanges
+
+# PEP 562, `ccxt.binance` imports the binance module the first time it is accessed
+__getattr__, __dir__ = lazy_exchanges(__name__)
@@ -8,11 +8,18 @@ __version__ = '4.5.75'
 
 import asyncio
 import concurrent.futures
+import contextvars
+import copy
+import functools
+import json
+import json.scanner
+import marshal
 import socket
 import certifi
 import aiohttp
 import ssl
 import sys
+import time
 import yarl
 import math
 from ccxt.base.types import Int, Str, Num, Strings
@@ -20,22 +27,26 @@ from ccxt.base.types import Int, Str, Num, Strings
 # -----------------------------------------------------------------------------
 
 from ccxt.async_support.base.throttler import Throttler
+from ccxt.base.latency_histogram import LatencyHistogram
+from ccxt.base.response_cache import refresh_responses
 
 # -----------------------------------------------------------------------------
 
-from ccxt.base.errors import BadSymbol, BadRequest, BadResponse, ExchangeClosedByUser, ExchangeError, ExchangeNotAvailable, RequestTimeout, NotSupported, NullResponse, InvalidAddress, RateLimitExceeded, OperationFailed
+from ccxt.base.errors import BadSymbol, BadRequest, BadResponse, ExchangeClosedByUser, ExchangeError, ExchangeNotAvailable, RequestTimeout, NotSupported, NullResponse, InvalidAddress, RateLimitExceeded, OperationFailed, UnsubscribeError
 from ccxt.base.types import ConstructorArgs, OrderType, OrderSide, OrderRequest, CancellationRequest, Order
 
 # -----------------------------------------------------------------------------
 
-from ccxt.base.exchange import BaseExchange as SyncExchange, ArgumentsRequired
+from ccxt.base.exchange import BaseExchange as SyncExchange, ArgumentsRequired, bucketed_request
 
 # -----------------------------------------------------------------------------
 
 from ccxt.async_support.base.ws.functions import inflate, gunzip
 from ccxt.async_support.base.ws.client import Client
 from ccxt.async_support.base.ws.future import Future
-from ccxt.async_support.base.ws.order_book import OrderBook, IndexedOrderBook, CountedOrderBook
+from ccxt.async_support.base.ws.stream import Stream, Subscription, current_stream
+from ccxt.async_support.base.ws.order_book import OrderBook, IndexedOrderBook, CountedOrderBook, ChunkedOrderBook, ChunkedIndexedOrderBook, ChunkedCountedOrderBook
+from ccxt.async_support.base.ws.order_book_side import IndexedOrderBookSide, ChunkedIndexedOrderBookSide
 
 
 # -----------------------------------------------------------------------------
@@ -56,6 +67,42 @@ __all__ = [
 
 # -----------------------------------------------------------------------------
 
+# json.loads() and orjson.loads() hold the GIL for the whole document, a thread that runs
+# them stalls the event loop as much as running them on the loop. This decoder walks the
+# document in python and leaves the strings and numbers to the C scanner, so the thread
+# gives the GIL up at every switch interval, at the price of a slower decoding
+interruptible_json_decoder = json.JSONDecoder()
+interruptible_json_decoder.scan_once = json.scanner.py_make_scanner(interruptible_json_decoder)
+
+# -----------------------------------------------------------------------------
+
+# with options['requestTiming'], the timing of the request in progress in the current task,
+# throttle() starts it, or request_with_buckets() before the waits for its buckets, and fetch()
+# takes it over, the sign phase is what lies in between
+request_timing = contextvars.ContextVar('request_timing', default=None)
+# and the api and the path template of the request signed last in the current task, its endpoint
+request_endpoint = contextvars.ContextVar('request_endpoint', default=None)
+
+
+def timing_trace_config():
+    # only aiohttp sees a connection being made, fetch() passes the timing along as trace_request_ctx
+    trace_config = aiohttp.TraceConfig()
+
+    async def on_connection_create_start(session, context, params):
+        if context.trace_request_ctx is not None:
+            context.trace_request_ctx['connecting'] = time.perf_counter()
+
+    async def on_connection_create_end(session, context, params):
+        timing = context.trace_request_ctx
+        if timing is not None and 'connecting' in timing:
+            timing['connect'] = (time.perf_counter() - timing.pop('connecting')) * 1000
+
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    return trace_config
+
+# -----------------------------------------------------------------------------
+
 
 class BaseExchange(SyncExchange):
     synchronous = False
@@ -79,7 +126,13 @@ class BaseExchange(SyncExchange):
         self.throttler = None
         super(BaseExchange, self).__init__(config)
         self.markets_loading = None
+        self.markets_revalidation = None
         self.reloading_markets = False
+        self.inflight_requests = {}  # the path, api, method and params of a coalesced request in flight -> its task and followers
+        self.request_timings = {}  # endpoint -> phase -> LatencyHistogram, with options['requestTiming']
+        self.lost_subscriptions = {}  # (url, subscribe hash) -> the key of the sharded connection it was on when that was lost
+        if self.safe_dict(self.options, 'requestTiming') is not None:
+            self.sign = self.endpoint_sign(self.sign)
 
     async def load_lighter_library(self, path, chainId, privateKey, apiKeyIndex, accountIndex, createClient):
         return self.load_lighter_library_helper(path, chainId, privateKey, apiKeyIndex, accountIndex, createClient)
@@ -91,7 +144,126 @@ class BaseExchange(SyncExchange):
         self.throttler = Throttler(self.tokenBucket, self.asyncio_loop)
 
     async def throttle(self, cost=None):
-        return await self.throttler(cost)
+        # the requests charged to named rateLimitBuckets have been throttled by those already,
+        # the flag is for their own throttle() only, not for the requests they make on the way
+        bucketed = bucketed_request.get()
+        if bucketed:
+            bucketed_request.set(False)
+        if self.safe_dict(self.options, 'requestTiming') is None:
+            if not bucketed:
+                await self.throttler(cost)
+            return
+        timing = request_timing.get()
+        start = timing['start'] if timing is not None and 'throttled' not in timing else time.perf_counter()
+        if not bucketed:
+            await self.throttler(cost)
+        end = time.perf_counter()
+        request_timing.set({'start': start, 'throttle': (end - start) * 1000, 'throttled': end})
+
+    async def throttle_bucket(self, name, cost=None):
+        # every bucket has a Throttler and so a queue of its own, a request waiting
+        # for one bucket does not hold back the requests that only consume others
+        throttler = self.bucket_throttlers.get(name)
+        if throttler is None:
+            throttler = self.bucket_throttlers[name] = Throttler(self.rate_limit_bucket_config(name), self.asyncio_loop)
+        return await throttler(cost)
+
+    def adapt_rate_limit(self, headers):
+        rules = self.adaptiveRateLimit
+        headers = {key.lower(): value for key, value in headers.items()}
+        for rule in (rules if isinstance(rules, list) else [rules]):
+            name = rule.get('bucket')
+            throttler = self.throttler if name is None else self.bucket_throttlers.get(name)
+            if throttler is None:
+                continue
+            limit = rule['limit']
+            if isinstance(limit, str):
+                limit = self.safe_number(headers, limit.lower())
+            if 'used' in rule:
+                used = self.safe_number(headers, rule['used'].lower())
+            else:
+                remaining = self.safe_number(headers, rule['remaining'].lower())
+                used = None if (remaining is None or limit is None) else limit - remaining
+            if used is None or not limit:
+                continue
+            window = rule['window']
+            reset = self.safe_number(headers, rule['reset'].lower()) if 'reset' in rule else None
+            if reset is None:
+                # without a reset time the windows are taken as aligned to the clock, like binance's
+                elapsed = self.milliseconds() % window
+            else:
+                elapsed = min(max(window - (reset - self.milliseconds()), 0), window)
+            throttler.resync(used, limit, window, elapsed)
+
+    async def request_with_buckets(self, path, api='public', method='GET', params={}, config={}):
+        costs = self.rate_limit_bucket_costs(path, api, method, config) if self.enableRateLimit else []
+        if not costs:
+            return await self.request(path, api, method, params, config=config)
+        if self.safe_dict(self.options, 'requestTiming') is not None:
+            # the waits for the buckets are part of the throttle phase
+            request_timing.set({'start': time.perf_counter()})
+        for name, cost in costs:
+            await self.throttle_bucket(name, cost)
+        # the context is the task's own, the concurrent requests are not affected
+        token = bucketed_request.set(True)
+        try:
+            return await self.request(path, api, method, params, config=config)
+        finally:
+            bucketed_request.reset(token)
+
+    def is_coalesced(self, api, method):
+        settings = self.coalesceRequests if isinstance(self.coalesceRequests, dict) else {}
+        if method not in settings.get('methods', ['GET']):
+            return False
+        name = '/'.join(api) if isinstance(api, list) else api
+        apis = settings.get('apis')
+        # without a list the apis named public are, like 'public', 'fapiPublic' or ['v2', 'public']
+        return ('public' in name.lower()) if apis is None else (name in apis)
+
+    async def request_coalesced(self, path, api='public', method='GET', params={}, config={}):
+        """
+        an implicit api call with coalesceRequests, a call identical to one in flight waits for its response instead of making a request of its own
+        """
+        if not self.is_coalesced(api, method):
+            if self.rateLimitBuckets:
+                return await self.request_with_buckets(path, api, method, params, config)
+            return await self.request(path, api, method, params, config=config)
+        # the same call makes the same request, it is signed once it is made
+        key = json.dumps([path, api, method, params], sort_keys=True, default=str)
+        flight = self.inflight_requests.get(key)
+        if flight is None:
+            if self.rateLimitBuckets:
+                coroutine = self.request_with_buckets(path, api, method, params, config)
+            else:
+                coroutine = self.request(path, api, method, params, config=config)
+            flight = self.inflight_requests[key] = {'followers': 0, 'copy': None}
+            flight['task'] = asyncio.ensure_future(self.request_flight(key, flight, coroutine))
+            flight['task'].add_done_callback(self.request_landed)
+            # the callers share the task, a cancelled caller does not cancel it for the others
+            return await asyncio.shield(flight['task'])
+        flight['followers'] += 1
+        await asyncio.shield(flight['task'])
+        return flight['copy']()
+
+    async def request_flight(self, key, flight, coroutine):
+        try:
+            response = await coroutine
+        finally:
+            # no caller joins from here on
+            if self.inflight_requests.get(key) is flight:
+                del self.inflight_requests[key]
+        if flight['followers']:
+            # the first caller gets the response, the others a copy of it that they may modify freely,
+            # taken before any of them resumes, the first caller may have modified the response by then
+            try:
+                flight['copy'] = functools.partial(marshal.loads, marshal.dumps(response))
+            except ValueError:
+                flight['copy'] = functools.partial(copy.deepcopy, copy.deepcopy(response))
+        return response
+
+    def request_landed(self, task):
+        if not task.cancelled():
+            task.exception()  # retrieved here in case every caller has been cancelled
 
     def get_session(self):
         return self.session
@@ -135,11 +307,15 @@ class BaseExchange(SyncExchange):
             # happy_eyeballs_delay enables RFC 8305 Happy Eyeballs to avoid IPv6 fallback stalls
             # 0 = race the other family immediately (aiohttp minimum; not Node's 10ms floor)
             self.tcp_connector = aiohttp.TCPConnector(ssl=self.ssl_context, loop=self.asyncio_loop, enable_cleanup_closed=True, family=socket.AF_UNSPEC, happy_eyeballs_delay=0)
-            self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=self.tcp_connector, trust_env=self.aiohttp_trust_env)
+            trace_configs = None if self.safe_dict(self.options, 'requestTiming') is None else [timing_trace_config()]
+            self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=self.tcp_connector, trust_env=self.aiohttp_trust_env, trace_configs=trace_configs)
 
     async def close(self, clean_instance_data=False):
         # set before the first await, a lazy open() during close() would leak a session
         self.closed_by_user = True
+        if self.markets_revalidation is not None:
+            self.markets_revalidation.cancel()
+            self.markets_revalidation = None
         # ##### language-specific cleanup of WS & REST resources #####
         # [WS]
         await self.close_ws_clients()
@@ -172,7 +348,19 @@ class BaseExchange(SyncExchange):
 
     async def fetch(self, url, method='GET', headers=None, body=None):
         """Perform a HTTP request and return decoded JSON data"""
+        timing = self.start_request_timing()
+        if timing is None:
+            return await self.fetch_with_timing(url, method, headers, body, None)
+        error = None
+        try:
+            return await self.fetch_with_timing(url, method, headers, body, timing)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self.finish_request_timing(timing, method, url, error)
 
+    async def fetch_with_timing(self, url, method, headers, body, timing):
         # ##### PROXY & HEADERS #####
         request_headers = self.prepare_request_headers(headers)
         self.last_request_headers = request_headers
@@ -242,6 +430,8 @@ class BaseExchange(SyncExchange):
         http_status_code = None
         http_status_text = None
         json_response = None
+        if timing is not None:
+            timing['sent'] = time.perf_counter()
         try:
             async with session_method(yarl.URL(url, encoded=True),
                                       data=encoded_body,
@@ -250,8 +440,14 @@ class BaseExchange(SyncExchange):
                                       # which can hang indefinitely on stale keep-alive connections that a proxy
                                       # or cdn silently closed, see https://github.com/ccxt/ccxt/issues/27468
                                       timeout=aiohttp.ClientTimeout(total=(self.timeout / 1000), sock_connect=(self.timeout / 1000), sock_read=(self.timeout / 1000)),
-                                      proxy=final_proxy) as response:
+                                      proxy=final_proxy,
+                                      trace_request_ctx=timing) as response:
+                if timing is not None:
+                    timing['headers'] = time.perf_counter()
                 http_response = await response.text(errors='replace')
+                if timing is not None:
+                    timing['read'] = time.perf_counter()
+                    timing['status'] = response.status
                 # CIMultiDictProxy
                 raw_headers = response.headers
                 headers = {}
@@ -262,8 +458,12 @@ class BaseExchange(SyncExchange):
                         headers[header] = raw_headers[header]
                 http_status_code = response.status
                 http_status_text = response.reason
+                if self.adaptiveRateLimit:
+                    self.adapt_rate_limit(headers)
                 http_response = self.on_rest_response(http_status_code, http_status_text, url, method, headers, http_response, request_headers, request_body)
-                json_response = self.parse_json(http_response)
+                json_response = await self.parse_json_off_loop(http_response)
+                if timing is not None:
+                    timing['decoded'] = time.perf_counter()
                 if self.enableLastHttpResponse:
                     self.last_http_response = http_response
                 if self.enableLastResponseHeaders:
@@ -302,6 +502,84 @@ class BaseExchange(SyncExchange):
             return http_response
         return response.content
 
+    def endpoint_sign(self, sign):
+        # the instance attribute shadows sign() of the class, it names the endpoint of the request by its
+        # api and path template, the url holds the values of the parameters and would make one per value
+        def signed(path, api='public', method='GET', params={}, headers=None, body=None):
+            request_endpoint.set(method + ' ' + ('/'.join(api) if isinstance(api, list) else str(api)) + ' ' + path)
+            return sign(path, api, method, params, headers, body)
+        return signed
+
+    def start_request_timing(self):
+        # opt-in with options['requestTiming'] = {'callback': function}, an empty dict only aggregates
+        # the timings into request_timing_stats(), the connect phase takes a session opened with it.
+        # The phases end with the decoded response, the parsing of the unified methods comes after
+        # the request and is not timed
+        if self.safe_dict(self.options, 'requestTiming') is None:
+            return None
+        now = time.perf_counter()
+        endpoint = request_endpoint.get()
+        request_endpoint.set(None)
+        timing = request_timing.get()
+        if timing is None:
+            # without the rate limiter the request starts here, and is not signed in between
+            return {'start': now, 'throttle': 0.0, 'sign': None, 'endpoint': endpoint}
+        request_timing.set(None)  # the next request of the task starts over
+        timing['sign'] = (now - timing.pop('throttled')) * 1000
+        timing['endpoint'] = endpoint
+        return timing
+
+    def finish_request_timing(self, timing, method, url, error=None):
+        """
+        completes the timing of a request, aggregates it and passes it on to options['requestTiming']['callback']
+        """
+        end = time.perf_counter()
+        sent = timing.get('sent')
+        headers = timing.get('headers')
+        read = timing.get('read')
+        decoded = timing.get('decoded')
+        connect = timing.get('connect', 0.0 if headers is not None else None)
+        record = {
+            # a request made without sign() is named by its url
+            'endpoint': timing['endpoint'] or method + ' ' + url.split('?', 1)[0],
+            'method': method,
+            'url': url,
+            'status': timing.get('status'),
+            'error': None if error is None else type(error).__name__,
+            # milliseconds
+            'throttle': timing['throttle'],
+            'sign': timing['sign'],
+            'connect': connect,
+            'ttfb': None if headers is None else (headers - sent) * 1000 - connect,
+            'read': None if read is None else (read - headers) * 1000,
+            'decode': None if decoded is None else (decoded - read) * 1000,
+            'total': (end - timing['start']) * 1000,
+        }
+        histograms = self.request_timings.get(record['endpoint'])
+        if histograms is None:
+            histograms = self.request_timings[record['endpoint']] = {}
+        for phase in ('throttle', 'sign', 'connect', 'ttfb', 'read', 'decode', 'total'):
+            value = record[phase]
+            if value is not None:
+                histogram = histograms.get(phase)
+                if histogram is None:
+                    histogram = histograms[phase] = LatencyHistogram()
+                histogram.add(value)
+        callback = self.safe_value(self.options['requestTiming'], 'callback')
+        if callback is not None:
+            try:
+                callback(record)
+            except Exception as e:
+                # called as fetch() finishes, an error of the callback must not replace the outcome of the request
+                self.logger.warning('%s requestTiming callback failed: %s', self.id, e)
+        return record
+
+    def request_timing_stats(self):
+        """
+        :returns dict: per endpoint and phase, the count, average, min, max and percentiles of the request timings in milliseconds
+        """
+        return {endpoint: {phase: histogram.summary() for phase, histogram in histograms.items()} for endpoint, histograms in self.request_timings.items()}
+
     def get_socks_proxy_session(self, socksProxy):
         if (self.socks_proxy_sessions is None):
             self.socks_proxy_sessions = {}
@@ -329,16 +607,111 @@ class BaseExchange(SyncExchange):
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+            state = self.attach_markets_registry()
+            if state is not None:
+                return self.set_market_state(state)
+            cached = self.read_markets_cache()
+            if cached is not None:
+                markets, currencies, options, stale = cached
+                self.options.update(options)
+                await self.set_markets_off_loop(markets, currencies)
+                self.publish_markets()
+                if stale:
+                    self.markets_revalidation = asyncio.ensure_future(self.revalidate_markets_cache(params))
+                return self.markets
+        await self.set_markets_off_loop(*(await self.fetch_markets_and_currencies(params, reload)))
+        self.publish_markets()
+        return self.markets
+
+    def offload_executor(self):
+        # opt-in with options['offload'] = {'threshold': bytes, 'executor': ..., 'markets': True}, see parse_json_off_loop()
+        config = self.safe_dict(self.options, 'offload')
+        return None if config is None else self.safe_value(config, 'executor')
+
+    async def parse_json_off_loop(self, http_response):
+        """
+        decodes response bodies larger than options['offload']['threshold'] bytes (1 MB by default) in an executor
+        :param str http_response: the response body
+        :returns dict|list|None: the decoded body, as parse_json() returns it
+        """
+        config = self.safe_dict(self.options, 'offload')
+        if config is None or http_response is None or len(http_response) < self.safe_integer(config, 'threshold', 1048576):
+            return self.parse_json(http_response)
+        if not self.is_json_encoded_object(http_response):
+            return None
+        executor = self.offload_executor()
+        # a process decodes with the regular decoder, the GIL of the loop is not involved,
+        # the thread of the default executor or of a thread pool gets the interruptible one
+        decode = self.on_json_response if isinstance(executor, concurrent.futures.ProcessPoolExecutor) else interruptible_json_decoder.decode
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, decode, http_response)
+        except ValueError:
+            return None
+
+    async def set_markets_off_loop(self, markets, currencies=None):
+        """
+        set_markets() in a thread with options['offload'], which swaps the markets of the instance in at once when they are built
+        """
+        config = self.safe_dict(self.options, 'offload')
+        if config is None or not self.safe_bool(config, 'markets', True):
+            return self.set_markets(markets, currencies)
+        # set_markets() replaces the markets and their indexes one after the other, it builds
+        # them on a shallow copy of the instance here, so that the coroutines running on the
+        # loop in the meantime keep seeing the previous markets whole
+        builder = copy.copy(self)
+        builder.session = None
+        builder.socks_proxy_sessions = None
+        executor = self.offload_executor()
+        if isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+            executor = None  # the instance does not travel to another process
+        await asyncio.get_running_loop().run_in_executor(executor, builder.set_markets, markets, currencies)
+        return self.set_market_state(builder.get_market_state())
+
+    async def fetch_markets_and_currencies(self, params={}, reload=False):
+        options = dict(self.options)
         currencies = None
         if self.has['fetchCurrencies'] is True:
-            currencies = await self.fetch_currencies()
+            # a reload asks for the current currencies, not for those of the response cache
+            token = refresh_responses.set(True) if reload else None
+            try:
+                currencies = await self.fetch_currencies()
+            finally:
+                if token is not None:
+                    refresh_responses.reset(token)
             self.options['cachedCurrencies'] = currencies
         markets = await self.fetch_markets(params)
         if 'cachedCurrencies' in self.options:
             del self.options['cachedCurrencies']
-        return self.set_markets(markets, currencies)
+        self.write_markets_cache(markets, currencies, self.markets_options(options))
+        return markets, currencies
+
+    async def revalidate_markets_cache(self, params={}):
+        try:
+            await self.set_markets_off_loop(*(await self.fetch_markets_and_currencies(params, True)))
+            self.publish_markets()
+        except Exception as e:
+            # the markets from the stale cache stay in use
+            self.logger.debug('%s markets cache revalidation failed: %s', self.id, e)
 
 
+    async def reload_markets(self, params={}):
+        """
+        fetches the markets again and updates the loaded ones incrementally, see update_markets()
+        :returns dict: the symbols of the markets that were 'added', 'changed' and 'removed'
+        """
+        return self.update_markets(*(await self.fetch_markets_and_currencies(params, True)))
+
+    def cached_method(self, name, method, ttl):
+        async def cached(*args, **kwargs):
+            key = self.response_cache_key(name, args, kwargs)
+            value = None if refresh_responses.get() else self.response_cache.get(key)
+            if value is not None:
+                return marshal.loads(value)
+            result = await method(*args, **kwargs)
+            self.store_response(key, result, ttl)
+            return result
+        return cached
+
     async def load_markets(self, reload=False, params={}):
         """
         Loads and prepares the markets for trading.
@@ -445,20 +818,45 @@ class BaseExchange(SyncExchange):
     def gunzip(data):
         return gunzip(data)
 
+    def order_book_engine(self):
+        # 'list' (default) or 'chunked' for deep books with frequent mid-book updates
+        return self.handle_option('watchOrderBook', 'orderBookEngine', 'list')
+
     def order_book(self, snapshot={}, depth=None):
+        if self.order_book_engine() == 'chunked':
+            return ChunkedOrderBook(snapshot, depth)
         return OrderBook(snapshot, depth)
 
     def indexed_order_book(self, snapshot={}, depth=None):
+        if self.order_book_engine() == 'chunked':
+            return ChunkedIndexedOrderBook(snapshot, depth)
         return IndexedOrderBook(snapshot, depth)
 
     def counted_order_book(self, snapshot={}, depth=None):
+        if self.order_book_engine() == 'chunked':
+            return ChunkedCountedOrderBook(snapshot, depth)
         return CountedOrderBook(snapshot, depth)
 
-    def client(self, url):
+    def handle_deltas_bulk(self, bookside, deltas, priceKey=0, amountKey=1, countOrIdKey=None):
+        # parses a whole message worth of [price, amount(, countOrId)] levels and
+        # merges them into the side in one call, a drop-in for handle_deltas()
+        # loops that parse and store one level at a time
+        prices = [float(delta[priceKey]) for delta in deltas]
+        amounts = [float(delta[amountKey]) for delta in deltas]
+        if countOrIdKey is None:
+            bookside.store_many(prices, amounts)
+        elif isinstance(bookside, (IndexedOrderBookSide, ChunkedIndexedOrderBookSide)):
+            # order ids are kept as they come, string ids would not survive a conversion to a number
+            bookside.store_many(prices, amounts, [delta[countOrIdKey] for delta in deltas])
+        else:
+            bookside.store_many(prices, amounts, [self.safe_integer(delta, countOrIdKey) for delta in deltas])
+
+    def client(self, url, key=None):
         self.open()  # ensure self.asyncio_loop is set
         self.clients = self.clients or {}
         self.ws_dial_backoff = getattr(self, 'ws_dial_backoff', None) or {}
-        if url not in self.clients:
+        key = key or url
+        if key not in self.clients:
             on_message = self.handle_message
             on_error = self.on_error
             on_close = self.on_close
@@ -469,18 +867,84 @@ class BaseExchange(SyncExchange):
                 'log': getattr(self, 'log'),
                 'ping': getattr(self, 'ping', None),
                 'verbose': self.verbose,
-                'throttle': Throttler(self.tokenBucket, self.asyncio_loop),
+                # the rest budget of a shared tokenBucket backend is not spent on ws messages
+                'throttle': Throttler(self.omit(self.tokenBucket, 'backend'), self.asyncio_loop),
                 'asyncio_loop': self.asyncio_loop,
                 'decompressBinary': self.safe_bool(self.options, 'decompressBinary', True),
+                'key': key,
             }, ws_options)
             # we use aiohttp instead of fastClient now because of this
             # https://github.com/ccxt/ccxt/pull/25995
-            self.clients[url] = Client(url, on_message, on_error, on_close, on_connected, options)
+            self.clients[key] = Client(url, on_message, on_error, on_close, on_connected, options)
             # set http/s proxy (socks proxy should be set in other place)
             httpProxy, httpsProxy, socksProxy = self.check_ws_proxy_settings()
             if (httpProxy or httpsProxy):
-                self.clients[url].proxy = httpProxy if httpProxy else httpsProxy
-        return self.clients[url]
+                self.clients[key].proxy = httpProxy if httpProxy else httpsProxy
+        return self.clients[key]
+
+    def sharded_client(self, url, subscribe_hashes, subscription=None):
+        """
+        the connection to url that a subscription goes to, with streaming['maxSubscriptionsPerConnection'] declared the
+        subscriptions to url are spread over as many connections as they need, up to streaming['maxConnections'], a url
+        whose first connection carries a login, one of streaming['authMessageHashes'], is not spread any further, and a
+        connection that is lost is opened again under its key for the subscriptions it held, as they are made anew
+        :param [str] subscribe_hashes: the subscriptions made with one message
+        :param dict subscription: an unsubscription tells the hashes it ends in subMessageHashes
+        """
+        limit = self.safe_integer(self.streaming, 'maxSubscriptionsPerConnection')
+        if limit is None or not subscribe_hashes:
+            return self.client(url)
+        shards = [client for client in self.clients.values() if client.url == url] if self.clients else []
+        # a subscription stays on its connection, and its unsubscription follows it there
+        hashes = list(subscribe_hashes) + self.safe_list(subscription, 'subMessageHashes', [])
+        for client in shards:
+            for message_hash in hashes:
+                if message_hash in client.subscriptions or message_hash in client.futures or message_hash in client.streams:
+                    return client
+        needed = len(subscribe_hashes)
+        max_connections = self.safe_integer(self.streaming, 'maxConnections')
+        # a subscription of a connection that was lost goes back to that connection, opened anew
+        for message_hash in hashes:
+            key = self.lost_subscriptions.pop((url, message_hash), None)
+            if key is None:
+                continue
+            if key in self.clients:
+                if len(self.clients[key].subscriptions) + needed <= limit:
+                    return self.clients[key]
+            elif max_connections is None or len(shards) < max_connections:
+                return self.client(url, key)
+        # a login is made on the first connection, what it authorizes cannot go to another one, so
+        # once the first connection carries a login the subscriptions to url are no longer spread
+        first = self.clients.get(url) if self.clients else None
+        if first is not None:
+            logins = self.safe_list(self.streaming, 'authMessageHashes', ['authenticated', 'authenticate', 'auth', 'login'])
+            if any(message_hash in first.subscriptions for message_hash in logins):
+                return first
+        if needed > limit:
+            raise BadRequest(self.id + ' cannot subscribe to ' + str(needed) + ' streams with one message, ' + url + ' takes ' + str(limit) + ' subscriptions per connection')
+        # the least loaded connection with room, the connections of a url reconnected after a loss fill up first
+        shard = None
+        for client in shards:
+            subscriptions = len(client.subscriptions)
+            if subscriptions + needed <= limit and (shard is None or subscriptions < len(shard.subscriptions)):
+                shard = client
+        if shard is not None:
+            return shard
+        if max_connections is not None and len(shards) >= max_connections:
+            raise BadRequest(self.id + ' reached the limit of ' + str(limit) + ' subscriptions on each of ' + str(max_connections) + ' connections to ' + url)
+        if url not in self.clients:
+            return self.client(url)
+        index = 1
+        while url + '#' + str(index) in self.clients:
+            index += 1
+        return self.client(url, url + '#' + str(index))
+
+    def drop_client(self, key):
+        client = self.clients.pop(key)
+        if self.safe_integer(self.streaming, 'maxSubscriptionsPerConnection') is not None:
+            # the subscriptions made anew are routed back to a connection under the same key, see sharded_client()
+            for message_hash in client.subscriptions:
+                self.lost_subscriptions[(client.url, message_hash)] = key
 
     def delay(self, timeout, method, *args):
         return self.asyncio_loop.call_later(timeout / 1000, self.spawn, method, *args)
@@ -495,9 +959,13 @@ class BaseExchange(SyncExchange):
         # base exchange self.open starts the aiohttp Session in an async context
         self.open()
         backoff_delay = self.ws_dial_delay(url)
-        client = self.client(url)
+        client = self.sharded_client(url, subscribe_hashes, subscription)
+        stream = current_stream.get()
 
-        future = Future.race([client.future(message_hash) for message_hash in message_hashes])
+        if stream is None:
+            future = client.multiplex(message_hashes)
+        else:
+            future = stream.next(client, message_hashes)
 
         missing_subscriptions = []
         if subscribe_hashes is not None:
@@ -520,10 +988,8 @@ class BaseExchange(SyncExchange):
             cost = self.safe_value(options, 'cost', 1)
             if message:
                 async def send_message():
-                    if self.enableRateLimit:
-                        await client.throttle(cost)
                     try:
-                        await client.send(message)
+                        await client.send_subscription(message, cost if self.enableRateLimit else None)
                     except ConnectionError as e:
                         client.on_error(e)
                     except Exception as e:
@@ -539,10 +1005,12 @@ class BaseExchange(SyncExchange):
         # base exchange self.open starts the aiohttp Session in an async context
         self.open()
         backoff_delay = self.ws_dial_delay(url)
-        client = self.client(url)
-        if subscribe_hash is None and message_hash in client.futures:
-            return client.futures[message_hash]
-        future = client.future(message_hash)
+        client = self.sharded_client(url, None if subscribe_hash is None else [subscribe_hash], subscription)
+        stream = current_stream.get()
+        pending = client.futures.pending(message_hash) if stream is None and subscribe_hash is None else None
+        if pending is not None:
+            return pending
+        future = client.future(message_hash) if stream is None else stream.next(client, [message_hash])
 
         subscribed = client.subscriptions.get(subscribe_hash)
 
@@ -563,10 +1031,8 @@ class BaseExchange(SyncExchange):
             cost = self.safe_value(options, 'cost', 1)
             if message:
                 async def send_message():
-                    if self.enableRateLimit:
-                        await client.throttle(cost)
                     try:
-                        await client.send(message)
+                        await client.send_subscription(message, cost if self.enableRateLimit else None)
                     except ConnectionError as e:
                         client.on_error(e)
                     except Exception as e:
@@ -578,6 +1044,108 @@ class BaseExchange(SyncExchange):
 
         return future
 
+    async def stream_updates(self, method, *args, mode='conflated', maxsize=1024, overflow='dropOldest', **kwargs):
+        """
+        an async generator of the results of a watch_* method, one per update of its subscription
+        :param callable method: the watch_* method, for example exchange.watch_trades
+        :param str mode: 'conflated' yields the latest state and skips the updates in between, 'queued' yields every update
+        :param int maxsize: the number of updates a queued stream keeps while the consumer is busy
+        :param str overflow: what a full queued stream drops, 'dropOldest' or 'dropNewest'
+        """
+        # the method is called for every update as watch_* is called in a loop, but the watch() calls
+        # it makes take the updates collected by the Stream meanwhile instead of waiting on a future
+        # of the client, an update that is already there resolves right away without a wake-up
+        stream = Stream(mode, maxsize, overflow)
+        try:
+            while True:
+                token = current_stream.set(stream)
+                try:
+                    result = await method(*args, **kwargs)
+                finally:
+                    current_stream.reset(token)
+                stream.commit()
+                stream.processed()
+                # a cache without new entries since the previous update has nothing to yield
+                if isinstance(result, list) and not result:
+                    continue
+                yield result
+        finally:
+            stream.detach()
+
+    def stream_ticker(self, symbol, params={}, **options):
+        return self.stream_updates(self.watch_ticker, symbol, params, **options)
+
+    def stream_tickers(self, symbols=None, params={}, **options):
+        return self.stream_updates(self.watch_tickers, symbols, params, **options)
+
+    def stream_order_book(self, symbol, limit=None, params={}, **options):
+        return self.stream_updates(self.watch_order_book, symbol, limit, params, **options)
+
+    def stream_trades(self, symbol, since=None, limit=None, params={}, **options):
+        return self.stream_updates(self.watch_trades, symbol, since, limit, params, **options)
+
+    def stream_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}, **options):
+        return self.stream_updates(self.watch_ohlcv, symbol, timeframe, since, limit, params, **options)
+
+    def stream_balance(self, params={}, **options):
+        return self.stream_updates(self.watch_balance, params, **options)
+
+    def stream_orders(self, symbol=None, since=None, limit=None, params={}, **options):
+        return self.stream_updates(self.watch_orders, symbol, since, limit, params, **options)
+
+    def stream_my_trades(self, symbol=None, since=None, limit=None, params={}, **options):
+        return self.stream_updates(self.watch_my_trades, symbol, since, limit, params, **options)
+
+    def stream_positions(self, symbols=None, since=None, limit=None, params={}, **options):
+        return self.stream_updates(self.watch_positions, symbols, since, limit, params, **options)
+
+    async def on_update(self, method, callback, *args, on_error=None, **kwargs):
+        """
+        subscribes with a watch_* method and calls callback with every update from the message handler, without a future per update
+        :param callable method: the watch_* method, for example exchange.watch_order_book
+        :param callable callback: called with the structure the message handler resolved, the live order book, cache or ticker, it must not block
+        :param callable on_error: called with the error that ends the subscription together with its connection
+        :returns Subscription: resolved with the first update, its stats() time the callback, its close() stops it
+        """
+        subscription = Subscription(callback, on_error)
+        token = current_stream.set(subscription)
+        try:
+            await method(*args, **kwargs)
+        except BaseException:
+            subscription.detach()
+            raise
+        finally:
+            current_stream.reset(token)
+        subscription.commit()
+        return subscription
+
+    def on_ticker(self, symbol, callback, params={}, **options):
+        return self.on_update(self.watch_ticker, callback, symbol, params, **options)
+
+    def on_tickers(self, symbols, callback, params={}, **options):
+        return self.on_update(self.watch_tickers, callback, symbols, params, **options)
+
+    def on_order_book(self, symbol, callback, limit=None, params={}, **options):
+        return self.on_update(self.watch_order_book, callback, symbol, limit, params, **options)
+
+    def on_trades(self, symbol, callback, since=None, limit=None, params={}, **options):
+        return self.on_update(self.watch_trades, callback, symbol, since, limit, params, **options)
+
+    def on_ohlcv(self, symbol, callback, timeframe='1m', since=None, limit=None, params={}, **options):
+        return self.on_update(self.watch_ohlcv, callback, symbol, timeframe, since, limit, params, **options)
+
+    def on_balance(self, callback, params={}, **options):
+        return self.on_update(self.watch_balance, callback, params, **options)
+
+    def on_orders(self, callback, symbol=None, since=None, limit=None, params={}, **options):
+        return self.on_update(self.watch_orders, callback, symbol, since, limit, params, **options)
+
+    def on_my_trades(self, callback, symbol=None, since=None, limit=None, params={}, **options):
+        return self.on_update(self.watch_my_trades, callback, symbol, since, limit, params, **options)
+
+    def on_positions(self, callback, symbols=None, since=None, limit=None, params={}, **options):
+        return self.on_update(self.watch_positions, callback, symbols, since, limit, params, **options)
+
     def on_connected(self, client, message=None):
         # for user hooks
         # print('Connected to', client.url)
@@ -597,8 +1165,8 @@ class BaseExchange(SyncExchange):
         # producing test timeouts instead of noise reduction.
         # Retry-After from the failed handshake response sets the floor
         if not getattr(client, 'dial_failed', False):
-            if client.url in self.clients and self.clients[client.url].error:
-                del self.clients[client.url]
+            if client.key in self.clients and self.clients[client.key].error:
+                self.drop_client(client.key)
             return
         client.dial_failed = False
         self.ws_dial_backoff = getattr(self, 'ws_dial_backoff', None) or {}
@@ -612,8 +1180,8 @@ class BaseExchange(SyncExchange):
             'attempts': attempts,
             'until': self.milliseconds() + int(delay * 1000),
         }
-        if client.url in self.clients and self.clients[client.url].error:
-            del self.clients[client.url]
+        if client.key in self.clients and self.clients[client.key].error:
+            self.drop_client(client.key)
 
     def ws_dial_delay(self, url):
         # seconds to wait before the next dial to the given url, 0 when clear
@@ -632,8 +1200,19 @@ class BaseExchange(SyncExchange):
             pass
         else:
             # server disconnected a working connection
-            if client.url in self.clients:
-                del self.clients[client.url]
+            if client.key in self.clients:
+                self.drop_client(client.key)
+
+    def clean_unsubscription(self, client, subHash, unsubHash, subHashIsPrefix=False):
+        # the transpiled cleanup rejects the futures of the unsubscribed hashes, the
+        # watch_multiple() multiplexers and the streams following them wait on listeners instead
+        if subHash is not None:
+            listened = [message_hash for message_hash in client.streams if (message_hash.startswith(subHash) if subHashIsPrefix else message_hash == subHash)]
+            for message_hash in listened:
+                # a multiplexer fails once and leaves all of its hashes
+                if message_hash in client.streams:
+                    client.reject(UnsubscribeError(self.id + ' ' + message_hash), message_hash)
+        super(BaseExchange, self).clean_unsubscription(client, subHash, unsubHash, subHashIsPrefix)
 
     async def close_ws_clients(self):
         if self.clients:
@@ -671,8 +1250,8 @@ class BaseExchange(SyncExchange):
         # instead, reject the watcher and drop the connection and the cached
         # orderbook, so the next watch_order_book() call resubscribes cleanly
         client.reject(error, messageHash)
-        if client.url in self.clients:
-            del self.clients[client.url]
+        if client.key in self.clients:
+            self.drop_client(client.key)
         self.orderbooks[symbol] = self.order_book()  # clear the orderbook and its cache - issue https://github.com/ccxt/ccxt/issues/26753
 
     def format_scientific_notation_ftx(self, n):
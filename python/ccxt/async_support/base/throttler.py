@@ -1,6 +1,6 @@
 import asyncio
 import collections
-from time import time
+from time import monotonic
 
 
 class Throttler:
@@ -8,7 +8,7 @@ class Throttler:
         self.loop = loop
         self.config = {
             'refillRate': 1.0,              # leaky bucket refill rate in tokens per second
-            'delay': 0.001,                 # leaky bucket seconds before checking the queue after waiting
+            'delay': 0.001,                 # leaky bucket seconds to wait when the refill rate does not allow computing the wake-up time
             'capacity': 1.0,                # leaky bucket
             'tokens': 0,                    # leaky bucket
             'cost': 1.0,                    # leaky bucket and rolling window
@@ -19,69 +19,164 @@ class Throttler:
         self.config.update(config)
         if self.config['algorithm'] != 'leakyBucket':
             self.config['maxWeight'] = self.config['windowSize'] / self.config['rateLimit']
-        self.queue = collections.deque()
+        self.backend = self.config.get('backend')  # a ccxt.base.token_bucket backend to share the bucket through
+        self.queue = collections.deque()  # (future, cost, enqueued at) in the order of arrival
         self.running = False
-        self.timestamps = []
+        self.timestamps = collections.deque()  # rolling window (timestamp, cost) pairs, oldest first
+        self.window_cost = 0  # rolling window sum of the costs in self.timestamps
+        self.reset_stats()
+
+    @staticmethod
+    def milliseconds():
+        # monotonic, the schedule must not jump with wall clock adjustments
+        return monotonic() * 1000
+
+    def reset_stats(self):
+        self.requests = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.max_queue = 0
+
+    def stats(self):
+        """
+        :returns dict: the current queue depth and the wait times of the requests released so far, in milliseconds
+        """
+        return {
+            'queue': len(self.queue),
+            'maxQueue': self.max_queue,
+            'requests': self.requests,
+            'delayed': self.delayed,
+            'totalWait': self.total_wait,
+            'averageWait': self.total_wait / self.requests if self.requests else 0.0,
+            'maxWait': self.max_wait,
+        }
+
+    def resync(self, used, limit, window, elapsed):
+        """
+        aligns the bucket with the usage an exchange reports, so that several processes sharing one budget converge on it
+        :param float used: units of the budget spent so far in the current window, as reported by the exchange
+        :param float limit: units of the budget per window
+        :param float window: length of the window in milliseconds
+        :param float elapsed: milliseconds since the start of the current window
+        """
+        # the bucket is assumed to be configured for the whole budget, a window of
+        # it refills as many tokens as the exchange allows units, so the reported
+        # usage converts to tokens by that ratio
+        if self.config['algorithm'] == 'leakyBucket':
+            budget = self.config['refillRate'] * window
+            used_tokens = used * budget / limit
+            # what this process alone would have been allowed by now, anything
+            # spent beyond it by others becomes a debt to wait out
+            paced = self.config['refillRate'] * elapsed
+            self.config['tokens'] = min(self.config['tokens'], self.config['capacity'] + paced - used_tokens)
+        else:
+            used_tokens = used * self.config['maxWeight'] / limit
+            missing = used_tokens - self.window_cost
+            if missing > 0:
+                # weigh the window down with the usage it has not seen, dated back
+                # to the start of the exchange window so that it expires with it
+                timestamp = self.milliseconds() - elapsed
+                if self.timestamps and self.timestamps[-1][0] > timestamp:
+                    timestamp = self.timestamps[-1][0]
+                self.timestamps.append((timestamp, missing))
+                self.window_cost += missing
+
+    def release(self, now):
+        future, _, enqueued = self.queue.popleft()
+        if not future.done():
+            future.set_result(None)
+        wait = now - enqueued
+        self.requests += 1
+        if wait > 0:
+            self.delayed += 1
+            self.total_wait += wait
+            if wait > self.max_wait:
+                self.max_wait = wait
 
     async def leaky_bucket_loop(self):
-        last_timestamp = time() * 1000
+        last_timestamp = self.milliseconds()
         while self.running:
-            future, cost = self.queue[0]
+            cost = self.queue[0][1]
             cost = self.config['cost'] if cost is None else cost
             if self.config['tokens'] >= 0:
                 self.config['tokens'] -= cost
-                if not future.done():
-                    future.set_result(None)
-                self.queue.popleft()
+                self.release(self.milliseconds())
                 # context switch
                 await asyncio.sleep(0)
                 if len(self.queue) == 0:
                     self.running = False
             else:
-                await asyncio.sleep(self.config['delay'])
-                now = time() * 1000
+                # sleep exactly until the refill pays off the debt, instead of
+                # polling every config['delay'] seconds while the bucket is negative
+                refill_rate = self.config['refillRate']
+                wait = -self.config['tokens'] / refill_rate if refill_rate > 0 else self.config['delay'] * 1000
+                await asyncio.sleep(wait / 1000)
+                now = self.milliseconds()
                 elapsed = now - last_timestamp
                 last_timestamp = now
-                self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
+                if elapsed > 0:  # an infinite refill rate times zero elapsed time is nan
+                    self.config['tokens'] = min(self.config['tokens'] + elapsed * refill_rate, self.config['capacity'])
 
     async def rolling_window_loop(self):
+        timestamps = self.timestamps
         while self.running:
-            future, cost = self.queue[0]
+            cost = self.queue[0][1]
             cost = self.config['cost'] if cost is None else cost
-            now = time() * 1000
-            cutoffTime = now - self.config['windowSize']
-            totalCost = 0
-            # Remove expired timestamps & sum the remaining requests
-            timestamps = []
-            for t in self.timestamps:
-                if t['timestamp'] > cutoffTime:
-                    totalCost += t['cost']
-                    timestamps.append(t)
-            self.timestamps = timestamps
-            # handle current request
-            if totalCost + cost <= self.config['maxWeight']:
-                self.timestamps.append({'timestamp': now, 'cost': cost})
-                if not future.done():
-                    future.set_result(None)
-                self.queue.popleft()
+            now = self.milliseconds()
+            cutoff_time = now - self.config['windowSize']
+            # expire from the oldest end only, each entry is dropped exactly once
+            while timestamps and timestamps[0][0] <= cutoff_time:
+                self.window_cost -= timestamps.popleft()[1]
+            max_weight = self.config['maxWeight']
+            # a request costlier than the whole window goes through once the window is empty
+            if self.window_cost + cost <= max_weight or not timestamps:
+                timestamps.append((now, cost))
+                self.window_cost += cost
+                self.release(now)
                 # context switch
                 await asyncio.sleep(0)
                 if not self.queue:
                     self.running = False
             else:
-                wait_time = (self.timestamps[0]['timestamp'] + self.config['windowSize']) - now
+                # wake up when enough of the oldest entries expire to fit this request
+                expiring = self.window_cost + cost - max_weight
+                for timestamp, expired_cost in timestamps:
+                    expiring -= expired_cost
+                    if expiring <= 0:
+                        break
+                wait_time = timestamp + self.config['windowSize'] - now
                 if wait_time > 0:
                     await asyncio.sleep(wait_time / 1000)
 
+    async def backend_loop(self):
+        # the bucket lives in the backend, possibly shared with other processes,
+        # the reservation already charges the cost and tells how long to wait
+        while self.running:
+            cost = self.queue[0][1]
+            cost = self.config['cost'] if cost is None else cost
+            delay = self.backend.reserve(cost, self.config['refillRate'], self.config['capacity'])
+            if delay > 0:
+                await asyncio.sleep(delay / 1000)
+            self.release(self.milliseconds())
+            # context switch
+            await asyncio.sleep(0)
+            if not self.queue:
+                self.running = False
+
     async def looper(self):
-        if self.config['algorithm'] == 'leakyBucket':
+        if self.backend is not None:
+            await self.backend_loop()
+        elif self.config['algorithm'] == 'leakyBucket':
             await self.leaky_bucket_loop()
         else:
             await self.rolling_window_loop()
 
     def __call__(self, cost=None):
         future = asyncio.Future()
-        self.queue.append((future, cost))
+        self.queue.append((future, cost, self.milliseconds()))
+        if len(self.queue) > self.max_queue:
+            self.max_queue = len(self.queue)
         if not self.running:
             self.running = True
             asyncio.ensure_future(self.looper(), loop=self.loop)
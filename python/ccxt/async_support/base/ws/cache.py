@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import collections
+from operator import itemgetter
+
+from ccxt.async_support.base.ws.functions import numpy_module
 
 
 class Delegate:
@@ -69,6 +72,9 @@ class BaseCache(list):
 
 
 class ArrayCache(BaseCache):
+    # unified structure fields exported by to_numpy() when none are given
+    numpy_fields = ('timestamp', 'price', 'amount')
+
     def __init__(self, max_size: int | None = None) -> None:
         super(ArrayCache, self).__init__(max_size)
         self.hashmap = {}
@@ -111,6 +117,13 @@ class ArrayCache(BaseCache):
         else:
             return new_updates_value
 
+    def to_numpy(self, fields: tuple | list | None = None):
+        # requires numpy, a (rows, fields) float64 array, missing values become nan
+        numpy = numpy_module()
+        fields = self.numpy_fields if fields is None else fields
+        rows = list(map(itemgetter(*fields), self._deque))
+        return numpy.array(rows, dtype=numpy.float64).reshape(-1, len(fields))
+
     def append(self, item: dict) -> None:
         # the deque evicts from the left on its own when max_size is truthy
         self._deque.append(item)
@@ -145,6 +158,13 @@ class ArrayCacheByTimestamp(BaseCache):
         self._new_updates = 0
         self._clear_updates = False
 
+    def to_numpy(self):
+        # requires numpy, a (candles, 6) float64 array of [timestamp, o, h, l, c, v] rows
+        numpy = numpy_module()
+        if not self._deque:
+            return numpy.empty((0, 6), dtype=numpy.float64)
+        return numpy.array(list(self._deque), dtype=numpy.float64)
+
     def getLimit(self, symbol: str | None, limit: int | None) -> int | None:
         self._clear_updates = True
         if limit is None:
@@ -176,17 +196,59 @@ class ArrayCacheByTimestamp(BaseCache):
         self._new_updates = len(self._size_tracker)
 
 
-class ArrayCacheBySymbolById(ArrayCache):
+class ArrayCacheByToken(ArrayCache):
+    # the caches that move an updated row to the end keep their order in _index,
+    # an OrderedDict of token -> row, where moving a row and evicting the oldest
+    # one are both O(1). The deque behind the list api is appended to directly
+    # for new rows, and rebuilt from _index only on the first read after a row
+    # has moved, instead of being searched and spliced on every update
+    __len__ = Delegate('__len__', '_index')
+
+    def __init__(self, max_size: int | None = None) -> None:
+        self._stale = False
+        super(ArrayCacheByToken, self).__init__(max_size)
+        self._index = collections.OrderedDict()
+
+    def _get_deque(self) -> collections.deque:
+        if self._stale:
+            self._stale = False
+            self._rows = collections.deque(self._index.values(), self._rows.maxlen)
+        return self._rows
+
+    def _set_deque(self, rows: collections.deque) -> None:
+        self._rows = rows
+
+    _deque = property(_get_deque, _set_deque)
+
+    def clear(self) -> None:
+        super(ArrayCacheByToken, self).clear()
+        self._index.clear()
+        self._stale = False
+
+    def _store(self, token: tuple, item: dict) -> dict | None:
+        # moves a known token to the end, or appends a new one and returns the
+        # row evicted to make room for it, if the cache is bounded and full
+        index = self._index
+        if token in index:
+            index.move_to_end(token)
+            self._stale = True
+            return None
+        evicted = None
+        if len(index) == self._rows.maxlen:
+            evicted = index.popitem(last=False)[1]
+        index[token] = item
+        if not self._stale:
+            # a bounded deque drops the same oldest row on its own
+            self._rows.append(item)
+        return evicted
+
+
+class ArrayCacheBySymbolById(ArrayCacheByToken):
     def __init__(self, max_size: int | None = None) -> None:
         super(ArrayCacheBySymbolById, self).__init__(max_size)
         self._nested_new_updates_by_symbol = True
         self._key_field = 'symbol'  # first nesting level (overridden by ArrayCacheByOutcomeById)
         self.hashmap = {}
-        self._index = collections.deque([], max_size or None)
-
-    def clear(self) -> None:
-        super(ArrayCacheBySymbolById, self).clear()
-        self._index.clear()
 
     def append(self, item: dict) -> None:
         key = item[self._key_field]
@@ -204,15 +266,11 @@ class ArrayCacheBySymbolById(ArrayCache):
             if reference is not item:
                 reference.update(item)
             item = reference
-            index = self._index.index(token)
-            # move the order to the end of the deque
-            del self._deque[index]
-            del self._index[index]
         else:
             by_id[item_id] = item
-        if len(self._deque) == self._deque.maxlen:
-            delete_item = self._deque.popleft()
-            self._index.popleft()
+        # moves an updated order to the end
+        delete_item = self._store(token, item)
+        if delete_item is not None:
             delete_key = delete_item[self._key_field]
             delete_by_id = self.hashmap[delete_key]
             del delete_by_id[delete_item['id']]
@@ -234,8 +292,6 @@ class ArrayCacheBySymbolById(ArrayCache):
                 self._all_new_updates = self._all_new_updates - 1
                 if not all_seen:
                     del self._seen_updates_all[delete_key]
-        self._deque.append(item)
-        self._index.append(token)
         if self._clear_all_updates:
             self._clear_all_updates = False
             # the global poll consumes only the global scope: the symbol-scoped
@@ -268,7 +324,9 @@ class ArrayCacheByOutcomeById(ArrayCacheBySymbolById):
         self._key_field = 'outcome'
 
 
-class ArrayCacheBySymbolBySide(ArrayCache):
+class ArrayCacheBySymbolBySide(ArrayCacheByToken):
+    numpy_fields = ('timestamp', 'contracts', 'entryPrice')
+
     def __init__(self, max_size: int | None = None) -> None:
         # positions are unbounded - the number of (symbol, side) pairs is naturally
         # capped by the account, so max_size is accepted and ignored the way the
@@ -276,11 +334,6 @@ class ArrayCacheBySymbolBySide(ArrayCache):
         super(ArrayCacheBySymbolBySide, self).__init__()
         self._nested_new_updates_by_symbol = True
         self.hashmap = {}
-        self._index = collections.deque()
-
-    def clear(self) -> None:
-        super(ArrayCacheBySymbolBySide, self).clear()
-        self._index.clear()
 
     def append(self, item: dict) -> None:
         symbol = item['symbol']
@@ -292,14 +345,10 @@ class ArrayCacheBySymbolBySide(ArrayCache):
             if reference is not item:
                 reference.update(item)
             item = reference
-            index = self._index.index(token)
-            # move the position to the end of the deque
-            del self._deque[index]
-            del self._index[index]
         else:
             by_side[side] = item
-        self._deque.append(item)
-        self._index.append(token)
+        # moves an updated position to the end, positions are never evicted
+        self._store(token, item)
         if self._clear_all_updates:
             self._clear_all_updates = False
             # the global poll consumes only the global scope: the symbol-scoped
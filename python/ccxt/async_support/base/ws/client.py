@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import json
+import zlib
 
 # use orjson if importable, otherwise default to the stdlib json
 try:
@@ -15,10 +16,11 @@ except ImportError:
         return json.dumps(message, separators=(',', ':'))
 
 from asyncio import sleep, ensure_future, wait_for, TimeoutError, BaseEventLoop, Future as asyncioFuture
-from .functions import milliseconds, iso8601, deep_extend, is_json_encoded_object
+from .functions import milliseconds, iso8601, deep_extend, is_json_encoded_object, is_json_encoded_bytes
 from ccxt import NetworkError, RequestTimeout
 from ccxt.async_support.base.ws.future import Future
-from ccxt.async_support.base.ws.functions import gunzip, inflate
+from ccxt.async_support.base.ws.stream import Futures, Multiplexer
+from ccxt.async_support.base.ws.functions import gunzip_bytes, inflate
 from typing import Dict
 
 from aiohttp import WSMsgType
@@ -27,8 +29,11 @@ from aiohttp import WSMsgType
 class Client(object):
 
     url = None
+    key = None  # the key of the client in exchange.clients, the url but for the extra connections of a sharded url
     ws = None
     futures: Dict[str, Future] = {}
+    streams = {}  # message hash -> the Stream, Subscription and Multiplexer instances following it
+    multiplexers = {}  # the frozenset of the message hashes of watch_multiple() -> their Multiplexer
     options = {}  # ws-specific options
     subscriptions = {}
     rejections = {}
@@ -52,7 +57,18 @@ class Client(object):
     verbose = False  # verbose output
     gunzip = False
     inflate = False
+    inflateStream = False  # raw deflate with the context kept from one message to the next (context takeover)
+    inflater = None  # the zlib decompressor of the current connection with inflateStream
     throttle = None
+    # streaming['subscribeBatch'] of an exchange that takes several subscriptions in one message, for example
+    # {'field': 'args', 'match': {'op': 'subscribe'}, 'ignore': ['req_id'], 'maxItems': 10, 'delay': 10}:
+    # the messages matching it within delay milliseconds that differ only in field and in the ignored
+    # keys are sent as one, with the lists in field joined up to maxItems and the ignored keys of the first,
+    # the calls merged into a batch return once it is sent. The exchange acknowledges the batch once, with
+    # the ignored keys of the first message, an exchange that resolves its subscriptions by one of those,
+    # a req_id or an id, has to resolve them by the items in field instead, or leave the key out of ignore
+    subscribeBatch = None
+    batches = {}  # the other keys of the messages being collected -> [the message that collects them, the future of the merged calls]
     connecting = False
     asyncio_loop: BaseEventLoop = None
     ping_looper = None
@@ -61,9 +77,13 @@ class Client(object):
     def __init__(self, url, on_message_callback, on_error_callback, on_close_callback, on_connected_callback, config={}):
         defaults = {
             'url': url,
+            'key': url,
             'futures': {},
+            'streams': {},
+            'multiplexers': {},
             'subscriptions': {},
             'rejections': {},
+            'batches': {},
             'on_message_callback': on_message_callback,
             'on_error_callback': on_error_callback,
             'on_close_callback': on_close_callback,
@@ -77,6 +97,7 @@ class Client(object):
                 setattr(self, key, deep_extend(getattr(self, key), settings[key]))
             else:
                 setattr(self, key, settings[key])
+        self.futures = Futures(self, self.futures)
         # connection-related Future
         if "options" in config:
             self.options = config["options"]
@@ -102,14 +123,29 @@ class Client(object):
         self.last_message_at = None
 
     def future(self, message_hash):
-        if message_hash not in self.futures or self.futures[message_hash].cancelled():
-            self.futures[message_hash] = Future()
-        future = self.futures[message_hash]
+        future = self.futures.pending(message_hash)
+        if future is None or future.cancelled():
+            future = self.futures[message_hash] = Future()
         if message_hash in self.rejections:
             future.reject(self.rejections[message_hash])
             del self.rejections[message_hash]
         return future
 
+    def multiplex(self, message_hashes):
+        """
+        :returns Future: resolved with the first update of any of the message hashes, with the hash in its message_hash
+        """
+        if not message_hashes:
+            future = Future()
+            future.reject(Exception('watch_multiple() called without message hashes'))
+            return future
+        # the calls over the same hashes in another order share the multiplexer
+        key = frozenset(message_hashes)
+        multiplexer = self.multiplexers.get(key)
+        if multiplexer is None:
+            multiplexer = self.multiplexers[key] = Multiplexer(self, key)
+        return multiplexer.next()
+
     def reusable_future(self, message_hash):
         return self.future(message_hash)  # only used in go
 
@@ -119,24 +155,36 @@ class Client(object):
     def resolve(self, result, message_hash):
         if self.verbose and message_hash is None:
             self.log(iso8601(milliseconds()), 'resolve received None messageHash')
-        if message_hash in self.futures:
-            future = self.futures[message_hash]
+        streams = self.streams.get(message_hash)
+        if streams is not None:
+            # a callback may close its subscription
+            for stream in tuple(streams):
+                stream.push(result, message_hash)
+        future = self.futures.pop(message_hash, None)
+        if future is not None:
             future.resolve(result)
-            del self.futures[message_hash]
         return result
 
     def reject(self, result, message_hash=None):
         if message_hash is not None:
-            if message_hash in self.futures:
-                future = self.futures[message_hash]
+            streams = self.streams.get(message_hash)
+            if streams is not None:
+                for stream in tuple(streams):
+                    stream.fail(result)
+            future = self.futures.pop(message_hash, None)
+            if future is not None:
                 future.reject(result)
-                del self.futures[message_hash]
-            else:
+            elif streams is None:
                 self.rejections[message_hash] = result
         else:
-            message_hashes = list(self.futures.keys())
-            for message_hash in message_hashes:
-                self.reject(result, message_hash)
+            # a stream follows several hashes, it fails once
+            streams = set(stream for streams in self.streams.values() for stream in streams)
+            futures = list(self.futures.values())
+            self.futures.clear()
+            for future in futures:
+                future.reject(result)
+            for stream in streams:
+                stream.fail(result)
         return result
 
     def receive_loop(self):
@@ -192,6 +240,7 @@ class Client(object):
             self.connection = await wait_for(coroutine, timeout=int(self.connectionTimeout / 1000))
             self.connecting = False
             self.connectionEstablished = milliseconds()
+            self.inflater = zlib.decompressobj(-zlib.MAX_WBITS) if self.inflateStream else None
             self.isConnected = True
             if self.verbose:
                 self.log(iso8601(milliseconds()), 'connected')
@@ -276,14 +325,15 @@ class Client(object):
     def handle_text_or_binary_message(self, data):
         if self.verbose:
             self.log(iso8601(milliseconds()), 'message', data)
-        if self.decompressBinary and isinstance(data, bytes):
-            data = data.decode()
-        # decoded = json.loads(data) if is_json_encoded_object(data) else data
-        decode = None
-        if is_json_encoded_object(data):
+        decode = data
+        if isinstance(data, bytes):
+            if self.decompressBinary or self.gunzip:
+                # orjson and json read utf-8 bytes as they are, only the messages
+                # that are not json are decoded to text, gunzipped messages are
+                # always text as they have been when gunzip() returned a str
+                decode = json_parser.loads(data) if is_json_encoded_bytes(data) else data.decode()
+        elif is_json_encoded_object(data):
             decode = json_parser.loads(data)
-        else:
-            decode = data
         self.on_message_callback(self, decode)
 
     def handle_message(self, message):
@@ -296,7 +346,12 @@ class Client(object):
         elif message.type == WSMsgType.BINARY:
             data = message.data
             if self.gunzip:
-                data = gunzip(data)
+                data = gunzip_bytes(data)
+            elif self.inflater is not None:
+                # every message ends on a sync flush, which the sender may strip like permessage-deflate does
+                if not data.endswith(b'\x00\x00\xff\xff'):
+                    data += b'\x00\x00\xff\xff'
+                data = self.inflater.decompress(data)
             elif self.inflate:
                 data = inflate(data)
             self.handle_text_or_binary_message(data)
@@ -355,11 +410,75 @@ class Client(object):
             raise ConnectionError('Cannot Send Message: Connection closed before send')
         return await self.connection.send_str(send_msg)
 
+    def batch_key(self, message):
+        """
+        :returns str|None: what the messages merged with message have in common, None if it is not merged
+        """
+        batch = self.subscribeBatch
+        if batch is None or not isinstance(message, dict):
+            return None
+        field = batch['field']
+        if not isinstance(message.get(field), list):
+            return None
+        for key, value in batch.get('match', {}).items():
+            if message.get(key) != value:
+                return None
+        ignored = batch.get('ignore', [])
+        # with the keys sorted, the messages that build their keys in another order are merged too
+        return json.dumps({key: value for key, value in message.items() if key != field and key not in ignored}, sort_keys=True, default=str)
+
+    async def send_subscription(self, message, cost=None):
+        """
+        sends a subscribe message, merged with the others that come meanwhile when the exchange declares subscribeBatch
+        :param float cost: the rate limit cost of a message, None to send it right away
+        """
+        key = self.batch_key(message)
+        if key is None:
+            if cost is not None:
+                await self.throttle(cost)
+            return await self.send(message)
+        field = self.subscribeBatch['field']
+        items = message[field]
+        entry = self.batches.get(key)
+        if entry is not None and len(entry[0][field]) + len(items) <= self.subscribeBatch.get('maxItems', 10):
+            batch = entry[0]
+            for item in items:
+                if item not in batch[field]:
+                    batch[field].append(item)
+            # sent by the call that started the batch, the others wait for it
+            if entry[1] is None:
+                entry[1] = Future()
+            return await entry[1]
+        # a full batch is sent as it is, the next messages start another one
+        batch = dict(message)
+        batch[field] = list(items)
+        entry = self.batches[key] = [batch, None]
+        await sleep(self.subscribeBatch.get('delay', 10) / 1000)
+        if self.batches.get(key) is entry:
+            del self.batches[key]
+        try:
+            if cost is not None:
+                await self.throttle(cost)
+            result = await self.send(batch)
+        except Exception as e:
+            if entry[1] is not None:
+                entry[1].reject(e)
+            raise
+        except BaseException:
+            if entry[1] is not None:
+                entry[1].cancel()
+            raise
+        if entry[1] is not None:
+            entry[1].resolve(result)
+        return result
+
     async def close(self, code=1000):
         if self.verbose:
             self.log(iso8601(milliseconds()), 'closing', code)
         for future in self.futures.values():
             future.cancel()
+        for stream in set(stream for streams in self.streams.values() for stream in streams):
+            stream.cancel()
         await self.aiohttp_close()
 
     async def aiohttp_close(self):
@@ -1,18 +1,39 @@
 # -*- coding: utf-8 -*-
 
-from zlib import decompress, MAX_WBITS
-from gzip import GzipFile
-from io import BytesIO
+from zlib import decompress, decompressobj, MAX_WBITS
 import time
 import datetime
+from ccxt.base.errors import NotSupported
+from ccxt.base.exchange import optional_numpy
 
 
 def inflate(data):
     return decompress(data, -MAX_WBITS)
 
 
+def gunzip_bytes(data):
+    # zlib reads the gzip header itself with 16 + MAX_WBITS, without the two file
+    # objects GzipFile wraps around every message, a second gzip member is rare but
+    # GzipFile reads it, so the rest of the data is read on as long as there is any
+    decompressor = decompressobj(16 + MAX_WBITS)
+    result = decompressor.decompress(data)
+    while decompressor.unused_data:
+        data = decompressor.unused_data
+        decompressor = decompressobj(16 + MAX_WBITS)
+        result += decompressor.decompress(data)
+    return result
+
+
 def gunzip(data):
-    return GzipFile('', 'rb', 9, BytesIO(data)).read().decode('utf-8')
+    return gunzip_bytes(data).decode('utf-8')
+
+
+def numpy_module():
+    # numpy is an optional dependency, only the to_numpy() exports need it
+    numpy = optional_numpy()
+    if numpy is None:
+        raise NotSupported('to_numpy() requires numpy, install it with `pip install numpy`')
+    return numpy
 
 
 #  Tmp : added methods below to avoid circular imports between exchange.py and aiohttp.py
@@ -41,6 +62,12 @@ def is_json_encoded_object(input):
             ((input[0] == '{') or (input[0] == '[')))
 
 
+def is_json_encoded_bytes(input):
+    return (isinstance(input, bytes) and
+            (len(input) >= 2) and
+            ((input[0] == 123) or (input[0] == 91)))  # { or [
+
+
 def deep_extend(*args):
     result = None
     for arg in args:
@@ -2,6 +2,7 @@
 
 from ccxt.async_support.base.ws import order_book_side
 from ccxt import Exchange
+from itertools import islice
 import sys
 
 
@@ -19,9 +20,9 @@ class OrderBook(dict):
         }
         # do not mutate snapshot
         defaults.update(snapshot)
-        if not isinstance(defaults['asks'], order_book_side.OrderBookSide):
+        if not isinstance(defaults['asks'], (order_book_side.OrderBookSide, order_book_side.ChunkedOrderBookSide)):
             defaults['asks'] = order_book_side.Asks(defaults['asks'], depth)
-        if not isinstance(defaults['bids'], order_book_side.OrderBookSide):
+        if not isinstance(defaults['bids'], (order_book_side.OrderBookSide, order_book_side.ChunkedOrderBookSide)):
             defaults['bids'] = order_book_side.Bids(defaults['bids'], depth)
         defaults['datetime'] = Exchange.iso8601(defaults.get('timestamp'))
         # merge to self
@@ -33,11 +34,9 @@ class OrderBook(dict):
         return self
 
     def reset(self, snapshot={}):
-        self['asks']._index.clear()
         self['asks'].clear()
         for ask in snapshot.get('asks', []):
             self['asks'].storeArray(ask)
-        self['bids']._index.clear()
         self['bids'].clear()
         for bid in snapshot.get('bids', []):
             self['bids'].storeArray(bid)
@@ -69,12 +68,57 @@ class OrderBook(dict):
         copy['datetime'] = self.get('datetime')
         return copy
 
+    def to_numpy(self, depth=None):
+        # requires numpy, one (levels, columns) float64 array per side
+        return {
+            'bids': self['bids'].to_numpy(depth),
+            'asks': self['asks'].to_numpy(depth),
+        }
+
+    def snapshot(self, depth=None):
+        # a read-only copy of the top depth levels, see OrderBookSnapshot
+        return OrderBookSnapshot(self, depth)
+
     def update(self, snapshot):
         nonce = snapshot.get('nonce')
         if nonce is not None and self['nonce'] is not None and nonce < self['nonce']:
             return self
         self.reset(snapshot)
 
+# -----------------------------------------------------------------------------
+# a consistent read of an order book that only materialises the requested
+# depth: the top levels are frozen into tuples at the time of the call, so the
+# snapshot stays valid while the live book keeps receiving deltas, without
+# copying every level of a deep book like copy() does
+
+
+class OrderBookSnapshot(dict):
+    def __init__(self, orderbook, depth=None):
+        values = {}
+        for key in orderbook:
+            if key == 'bids' or key == 'asks':
+                levels = orderbook[key] if depth is None else islice(orderbook[key], depth)
+                values[key] = tuple(tuple(level) for level in levels)
+            else:
+                values[key] = orderbook[key]
+        super(OrderBookSnapshot, self).__init__(values)
+        self.depth = depth
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('order book snapshots are read-only')
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # pickled as the plain dict of its values, the levels are cut to the depth already
+        return (OrderBookSnapshot, (dict(self), self.depth))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
 # -----------------------------------------------------------------------------
 # overwrites absolute volumes at price levels
 # or deletes price levels based on order counts (3rd value in a bidask delta)
@@ -99,3 +143,33 @@ class IndexedOrderBook(OrderBook):
             'bids': order_book_side.IndexedBids(snapshot.get('bids', []), depth),
         })
         super(IndexedOrderBook, self).__init__(copy, depth)
+
+# -----------------------------------------------------------------------------
+# same books backed by the chunked sides, for deep books with frequent updates
+
+
+class ChunkedOrderBook(OrderBook):
+    def __init__(self, snapshot={}, depth=None):
+        copy = Exchange.extend(snapshot, {
+            'asks': order_book_side.ChunkedAsks(snapshot.get('asks', []), depth),
+            'bids': order_book_side.ChunkedBids(snapshot.get('bids', []), depth),
+        })
+        super(ChunkedOrderBook, self).__init__(copy, depth)
+
+
+class ChunkedCountedOrderBook(OrderBook):
+    def __init__(self, snapshot={}, depth=None):
+        copy = Exchange.extend(snapshot, {
+            'asks': order_book_side.ChunkedCountedAsks(snapshot.get('asks', []), depth),
+            'bids': order_book_side.ChunkedCountedBids(snapshot.get('bids', []), depth),
+        })
+        super(ChunkedCountedOrderBook, self).__init__(copy, depth)
+
+
+class ChunkedIndexedOrderBook(OrderBook):
+    def __init__(self, snapshot={}, depth=None):
+        copy = Exchange.extend(snapshot, {
+            'asks': order_book_side.ChunkedIndexedAsks(snapshot.get('asks', []), depth),
+            'bids': order_book_side.ChunkedIndexedBids(snapshot.get('bids', []), depth),
+        })
+        super(ChunkedIndexedOrderBook, self).__init__(copy, depth)
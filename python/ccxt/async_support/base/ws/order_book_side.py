@@ -2,6 +2,8 @@
 
 import sys
 from bisect import bisect_left
+from itertools import chain, islice
+from ccxt.async_support.base.ws.functions import numpy_module
 
 """Author: Carlo Revelli"""
 """Fast bisect bindings"""
@@ -9,8 +11,26 @@ from bisect import bisect_left
 """Performs a binary search when inserting keys in sorted order"""
 
 
+def levels_to_numpy(levels, columns):
+    # a (levels, columns) float64 array, filled by numpy in a single C-level pass
+    numpy = numpy_module()
+    try:
+        array = numpy.array(levels, dtype=numpy.float64)
+    except ValueError:  # levels of different widths
+        array = None
+    if array is None or (len(array) and (array.ndim != 2 or array.shape[1] != columns)):
+        # levels that carry more than the exported columns are cut down to them
+        array = numpy.array([level[:columns] for level in levels], dtype=numpy.float64)
+    return array.reshape(-1, columns)
+
+
 class OrderBookSide(list):
     side = None  # set to True for bids and False for asks
+    # store_many() falls back to a plain storeArray() loop for messages that
+    # are too small to pay for rebuilding the whole side
+    _bulk_threshold = 32
+    _bulk_ratio = 4
+    _numpy_columns = 2  # [price, amount] rows in to_numpy()
 
     def __init__(self, deltas=[], depth=None):
         super(OrderBookSide, self).__init__()
@@ -42,6 +62,32 @@ class OrderBookSide(list):
     def store(self, price, size):
         self.storeArray([price, size])
 
+    def store_many(self, prices, sizes):
+        # applies a whole message worth of levels at once: the side is turned
+        # into a price -> level map, every incoming level becomes a single dict
+        # operation, and the side is rebuilt with one sort that only has to
+        # merge the already sorted levels with the new ones, instead of paying
+        # an insert or delete on the full list for every level
+        count = len(prices)
+        if count < self._bulk_threshold or count * self._bulk_ratio < len(self):
+            for i in range(count):
+                self.storeArray([prices[i], sizes[i]])
+            return
+        levels = dict(zip(self._index, self))
+        index_prices = [-price for price in prices] if self.side else prices
+        for index_price, price, size in zip(index_prices, prices, sizes):
+            if size:
+                level = levels.get(index_price)
+                if level is None:
+                    levels[index_price] = [price, size]
+                else:
+                    level[1] = size
+            else:
+                levels.pop(index_price, None)
+        keys = sorted(levels)
+        self._index[:] = keys
+        self[:] = [levels[key] for key in keys]
+
     def limit(self):
         difference = len(self) - self._depth
         for _ in range(difference):
@@ -51,6 +97,13 @@ class OrderBookSide(list):
     def remove_index(self, order):
         pass
 
+    def clear(self):
+        self._index.clear()
+        super(OrderBookSide, self).clear()
+
+    def to_numpy(self, depth=None):
+        return levels_to_numpy(list(self) if depth is None else self[:depth], self._numpy_columns)
+
     # no __getitem__ override: list.__getitem__ already returns a plain list
     # when slicing a subclass, and overriding it made every access ~3x slower
 
@@ -72,6 +125,8 @@ class OrderBookSide(list):
 
 
 class CountedOrderBookSide(OrderBookSide):
+    _numpy_columns = 3  # [price, amount, count]
+
     def __init__(self, deltas=[], depth=None):
         super(CountedOrderBookSide, self).__init__(deltas, depth)
 
@@ -97,6 +152,10 @@ class CountedOrderBookSide(OrderBookSide):
     def store(self, price, size, count):
         self.storeArray([price, size, count])
 
+    def store_many(self, prices, sizes, counts):
+        for i in range(len(prices)):
+            self.storeArray([prices[i], sizes[i], counts[i]])
+
 # -----------------------------------------------------------------------------
 # indexed by order ids (3rd value in a bidask delta)
 
@@ -163,6 +222,259 @@ class IndexedOrderBookSide(OrderBookSide):
     def store(self, price, size, order_id):
         self.storeArray([price, size, order_id])
 
+    def store_many(self, prices, sizes, order_ids):
+        for i in range(len(prices)):
+            self.storeArray([prices[i], sizes[i], order_ids[i]])
+
+    def to_numpy(self, depth=None):
+        # order ids are not numeric, only [price, amount] is exported
+        levels = self if depth is None else self[:depth]
+        return levels_to_numpy([level[:2] for level in levels], 2)
+
+# -----------------------------------------------------------------------------
+# same store/storeArray/limit api as OrderBookSide, but the levels are kept in
+# a list of bounded chunks instead of one contiguous list, so that inserting or
+# deleting a level in the middle of a deep book moves at most one chunk rather
+# than every level below it: O(log n) to locate plus O(_load) to shift.
+# reads are list-like (len, iteration, indexing, slicing, ==) but the side is
+# not a list instance, selected with options['watchOrderBook']['orderBookEngine'] = 'chunked'
+
+
+class ChunkedOrderBookSide(object):
+    side = None  # set to True for bids and False for asks
+    _load = 256  # a chunk is split in two once it grows past twice this size
+    _numpy_columns = 2
+
+    def __init__(self, deltas=[], depth=None):
+        self._depth = depth or sys.maxsize
+        self._chunks = []  # lists of deltas
+        self._keys = []  # lists of index prices, parallel to self._chunks
+        self._maxes = []  # the last index price of every chunk
+        self._len = 0
+        for delta in deltas:
+            self.storeArray(list(delta))
+
+    def _find(self, key):
+        # returns (chunk, position) of the first key >= key, chunk is len(self._chunks) past the end
+        maxes = self._maxes
+        chunk = bisect_left(maxes, key)
+        if chunk == len(maxes):
+            return chunk, 0
+        return chunk, bisect_left(self._keys[chunk], key)
+
+    def _found(self, chunk, position, key):
+        return chunk < len(self._keys) and self._keys[chunk][position] == key
+
+    def _insert(self, chunk, position, key, delta):
+        if chunk == len(self._chunks):
+            if chunk == 0:
+                self._chunks.append([delta])
+                self._keys.append([key])
+                self._maxes.append(key)
+                self._len += 1
+                return
+            chunk -= 1
+            position = len(self._keys[chunk])
+        keys = self._keys[chunk]
+        deltas = self._chunks[chunk]
+        keys.insert(position, key)
+        deltas.insert(position, delta)
+        self._maxes[chunk] = keys[-1]
+        self._len += 1
+        if len(keys) > self._load * 2:
+            half = self._load
+            self._keys.insert(chunk + 1, keys[half:])
+            self._chunks.insert(chunk + 1, deltas[half:])
+            del keys[half:]
+            del deltas[half:]
+            self._maxes.insert(chunk, keys[-1])
+
+    def _delete(self, chunk, position):
+        keys = self._keys[chunk]
+        deltas = self._chunks[chunk]
+        del keys[position]
+        del deltas[position]
+        self._len -= 1
+        if keys:
+            self._maxes[chunk] = keys[-1]
+        else:
+            del self._keys[chunk]
+            del self._chunks[chunk]
+            del self._maxes[chunk]
+
+    def store_array(self, delta):
+        return self.storeArray(delta)
+
+    def storeArray(self, delta):
+        price = delta[0]
+        size = delta[1]
+        index_price = -price if self.side else price
+        chunk, position = self._find(index_price)
+        if self._found(chunk, position, index_price):
+            if size:
+                self._chunks[chunk][position][1] = size
+            else:
+                self._delete(chunk, position)
+        elif size:
+            self._insert(chunk, position, index_price, delta)
+
+    def store(self, price, size):
+        self.storeArray([price, size])
+
+    def store_many(self, prices, sizes):
+        # updates are already logarithmic here, so there is nothing to gain from a merge
+        for i in range(len(prices)):
+            self.storeArray([prices[i], sizes[i]])
+
+    def limit(self):
+        while self._len > self._depth:
+            chunk = len(self._chunks) - 1
+            order = self._chunks[chunk][-1]
+            self._delete(chunk, len(self._chunks[chunk]) - 1)
+            self.remove_index(order)
+
+    def remove_index(self, order):
+        pass
+
+    def clear(self):
+        self._chunks = []
+        self._keys = []
+        self._maxes = []
+        self._len = 0
+
+    def to_numpy(self, depth=None):
+        return levels_to_numpy(list(self) if depth is None else self[:depth], self._numpy_columns)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return chain.from_iterable(self._chunks)
+
+    def __reversed__(self):
+        for deltas in reversed(self._chunks):
+            yield from reversed(deltas)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.start, index.stop, index.step
+            if (start is None or start >= 0) and (stop is not None and stop >= 0) and (step is None or step > 0):
+                # top of book slices only walk the chunks they need
+                return list(islice(self, start, stop, step))
+            return list(self)[index]
+        if index < 0:
+            index += self._len
+        if index < 0 or index >= self._len:
+            raise IndexError('order book side index out of range')
+        for deltas in self._chunks:
+            length = len(deltas)
+            if index < length:
+                return deltas[index]
+            index -= length
+
+    def __eq__(self, other):
+        if isinstance(other, (list, ChunkedOrderBookSide)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return str(list(self))
+
+    def copy(self):
+        return self.__class__([delta[:] for delta in self], self._depth)
+
+# -----------------------------------------------------------------------------
+# chunked counterpart of CountedOrderBookSide
+
+
+class ChunkedCountedOrderBookSide(ChunkedOrderBookSide):
+    _numpy_columns = 3
+
+    def storeArray(self, delta):
+        price = delta[0]
+        size = delta[1]
+        count = delta[2]
+        index_price = -price if self.side else price
+        chunk, position = self._find(index_price)
+        if self._found(chunk, position, index_price):
+            if size and count:
+                order = self._chunks[chunk][position]
+                order[1] = size
+                order[2] = count
+            else:
+                self._delete(chunk, position)
+        elif size and count:
+            self._insert(chunk, position, index_price, delta)
+
+    def store(self, price, size, count):
+        self.storeArray([price, size, count])
+
+    def store_many(self, prices, sizes, counts):
+        for i in range(len(prices)):
+            self.storeArray([prices[i], sizes[i], counts[i]])
+
+# -----------------------------------------------------------------------------
+# chunked counterpart of IndexedOrderBookSide, keyed by (price, order id) so
+# that orders resting at the same price keep the order id ordering
+
+
+class ChunkedIndexedOrderBookSide(ChunkedOrderBookSide):
+    def __init__(self, deltas=[], depth=None):
+        self._hashmap = {}
+        super(ChunkedIndexedOrderBookSide, self).__init__(deltas, depth)
+
+    def storeArray(self, delta):
+        price = delta[0]
+        if price is not None:
+            index_price = -price if self.side else price
+        else:
+            index_price = None
+        size = delta[1]
+        order_id = delta[2]
+        hashmap = self._hashmap
+        if size:
+            if order_id in hashmap:
+                old_price = hashmap[order_id]
+                index_price = index_price or old_price
+                # in case the price is not defined
+                delta[0] = abs(index_price)
+                chunk, position = self._find((old_price, order_id))
+                if index_price == old_price:
+                    # just overwrite the old level
+                    self._chunks[chunk][position] = delta
+                    return
+                # remove old price level
+                self._delete(chunk, position)
+            # insert new price level
+            hashmap[order_id] = index_price
+            key = (index_price, order_id)
+            chunk, position = self._find(key)
+            self._insert(chunk, position, key, delta)
+        elif order_id in hashmap:
+            chunk, position = self._find((hashmap[order_id], order_id))
+            self._delete(chunk, position)
+            del hashmap[order_id]
+
+    def remove_index(self, order):
+        order_id = order[2]
+        if order_id in self._hashmap:
+            del self._hashmap[order_id]
+
+    def clear(self):
+        self._hashmap = {}
+        super(ChunkedIndexedOrderBookSide, self).clear()
+
+    def to_numpy(self, depth=None):
+        levels = self if depth is None else self[:depth]
+        return levels_to_numpy([level[:2] for level in levels], 2)
+
+    def store(self, price, size, order_id):
+        self.storeArray([price, size, order_id])
+
+    def store_many(self, prices, sizes, order_ids):
+        for i in range(len(prices)):
+            self.storeArray([prices[i], sizes[i], order_ids[i]])
+
 # -----------------------------------------------------------------------------
 # a more elegant syntax is possible here, but native inheritance is portable
 
@@ -172,3 +484,9 @@ class CountedAsks(CountedOrderBookSide): side = False                       # no
 class CountedBids(CountedOrderBookSide): side = True                        # noqa
 class IndexedAsks(IndexedOrderBookSide): side = False                       # noqa
 class IndexedBids(IndexedOrderBookSide): side = True                        # noqa
+class ChunkedAsks(ChunkedOrderBookSide): side = False                       # noqa
+class ChunkedBids(ChunkedOrderBookSide): side = True                        # noqa
+class ChunkedCountedAsks(ChunkedCountedOrderBookSide): side = False         # noqa
+class ChunkedCountedBids(ChunkedCountedOrderBookSide): side = True          # noqa
+class ChunkedIndexedAsks(ChunkedIndexedOrderBookSide): side = False         # noqa
+class ChunkedIndexedBids(ChunkedIndexedOrderBookSide): side = True          # noqa
@@ -0,0 +1,401 @@
+import collections
+import contextvars
+import time
+
+from ccxt.base.errors import NotSupported
+from ccxt.base.latency_histogram import LatencyHistogram
+from ccxt.async_support.base.ws.future import Future
+
+# the Stream or Subscription on whose behalf a watch_* method is called, the watch() and
+# watch_multiple() calls it makes take their updates from it instead of a client future each
+current_stream = contextvars.ContextVar('current_stream', default=None)
+
+
+class Listener:
+    """
+    registers on the clients for the message hashes of a watch_* method, Client.resolve() and Client.reject() call
+    push() and fail() of the listeners of a message hash, Client.close() calls cancel()
+    """
+
+    def __init__(self):
+        self.subscriptions = []  # [client, message_hash] pairs the listener is registered for
+
+    def attach(self, client, message_hashes):
+        for message_hash in message_hashes:
+            streams = client.streams.get(message_hash)
+            if streams is None:
+                streams = client.streams[message_hash] = []
+            if self not in streams:
+                streams.append(self)
+                self.subscriptions.append((client, message_hash))
+            if message_hash in client.rejections:
+                self.fail(client.rejections.pop(message_hash))
+
+    def detach(self, keep=()):
+        """
+        :param [str] keep: the message hashes to stay registered for
+        """
+        subscriptions = []
+        for client, message_hash in self.subscriptions:
+            if message_hash in keep:
+                subscriptions.append((client, message_hash))
+                continue
+            streams = client.streams.get(message_hash)
+            if streams is not None and self in streams:
+                streams.remove(self)
+                if not streams:
+                    del client.streams[message_hash]
+        self.subscriptions = subscriptions
+
+
+class Feed(Listener):
+    """
+    a listener of the data of a watch_* method, the method may watch other hashes on the way, like the login of
+    authenticate(), those are answered to the watch that asked for them, each call waits for its own hashes, and
+    the listener keeps the hashes of the last watch of the method, its subscription, once the method returns
+    """
+
+    def __init__(self):
+        super(Feed, self).__init__()
+        self.message_hashes = set()  # the hashes of the subscription, known once the method has returned
+        self.watched = set()  # the hashes of the last watch of the method in progress
+        self.waiters = []  # [future, message_hashes] of the watches waiting
+
+    def wait(self, client, message_hashes):
+        self.attach(client, message_hashes)
+        self.watched = set(message_hashes)
+        future = Future()
+        self.waiters.append((future, self.watched))
+        return future
+
+    def answer(self, result, message_hash):
+        """
+        :returns bool: whether the update was handed to a watch waiting for its hash
+        """
+        answered = False
+        for waiter in list(self.waiters):
+            future, message_hashes = waiter
+            if future.done():
+                self.waiters.remove(waiter)
+            elif message_hash in message_hashes:
+                self.waiters.remove(waiter)
+                future.resolve(result)
+                answered = True
+        return answered
+
+    def follows(self, message_hash):
+        return message_hash in self.message_hashes or message_hash in self.watched
+
+    def commit(self):
+        # the watches the method did not wait for, like the one of a login, leave nothing behind
+        self.message_hashes = self.watched
+        self.waiters = []
+        self.detach(self.message_hashes)
+
+    def reject_waiters(self, error):
+        """
+        :returns bool: whether a watch waiting took the error
+        """
+        waiters, self.waiters = self.waiters, []
+        rejected = False
+        for future, message_hashes in waiters:
+            if not future.done():
+                future.reject(error)
+                rejected = True
+        return rejected
+
+    def cancel_waiters(self):
+        waiters, self.waiters = self.waiters, []
+        for future, message_hashes in waiters:
+            future.cancel()
+
+
+class Stream(Feed):
+    """
+    the updates of the message hashes followed by a stream_* generator, collected by Client.resolve() while the consumer is busy
+    - conflated: only the latest update is kept, the consumer always gets the current state
+    - queued: up to maxsize updates are kept, when full the overflow policy drops the oldest ('dropOldest') or the newest ('dropNewest')
+    """
+
+    def __init__(self, mode='conflated', maxsize=1024, overflow='dropOldest'):
+        if mode not in ('conflated', 'queued'):
+            raise NotSupported('stream mode must be conflated or queued, got ' + str(mode))
+        if overflow not in ('dropOldest', 'dropNewest'):
+            raise NotSupported('stream overflow must be dropOldest or dropNewest, got ' + str(overflow))
+        self.conflated = mode == 'conflated'
+        self.maxsize = 1 if self.conflated else max(maxsize, 1)
+        self.overflow = overflow
+        self.updates = collections.deque()  # [message_hash, update] pairs
+        self.error = None
+        self.cancelled = False
+        self.delivered = None  # the update handed to the consumer and not processed yet
+        self.dropped = 0  # updates lost to conflation or to the overflow policy
+        super(Stream, self).__init__()
+
+    def next(self, client, message_hashes):
+        """
+        :returns Future: resolved with the next update of any of the message_hashes, right away if one is waiting
+        """
+        for update in self.updates:
+            if update[0] in message_hashes:
+                self.attach(client, message_hashes)
+                self.watched = set(message_hashes)
+                self.updates.remove(update)
+                self.delivered = update[1]
+                future = Future()
+                future.resolve(self.delivered)
+                return future
+        future = self.wait(client, message_hashes)
+        if self.error is not None:
+            error, self.error = self.error, None
+            self.reject_waiters(error)
+        elif self.cancelled:
+            self.cancel_waiters()
+        return future
+
+    def push(self, result, message_hash):
+        # caches and order books are resolved again and again as they are updated in place,
+        # while the consumer has yet to process one, the consumer sees what they add anyway
+        if result is self.delivered or (self.updates and self.updates[-1][1] is result):
+            return
+        if self.answer(result, message_hash):
+            self.delivered = result
+            return
+        if not self.follows(message_hash):
+            return
+        if len(self.updates) >= self.maxsize:
+            self.dropped += 1
+            if self.overflow == 'dropNewest' and not self.conflated:
+                return
+            self.updates.popleft()
+        self.updates.append((message_hash, result))
+
+    def fail(self, error):
+        if not self.reject_waiters(error):
+            self.error = error
+
+    def commit(self):
+        super(Stream, self).commit()
+        self.updates = collections.deque(update for update in self.updates if update[0] in self.message_hashes)
+
+    def processed(self):
+        self.delivered = None
+
+    def cancel(self):
+        self.cancelled = True
+        self.cancel_waiters()
+
+
+class Subscription(Feed):
+    """
+    the callback of an on_* subscription, called from Client.resolve() with every update right where the message
+    handler resolves it, an exception of the callback is counted and kept, it does not reach the message handler
+    """
+
+    def __init__(self, callback, on_error=None):
+        super(Subscription, self).__init__()
+        self.callback = callback
+        self.on_error = on_error  # called with the rejection that ends the subscription
+        self.latency = LatencyHistogram()  # milliseconds spent in the callback
+        self.exceptions = 0
+        self.last_exception = None
+        self.error = None
+        self.committed = False
+        self.pending = []  # the updates of the last watch that came before the on_* call returned
+
+    def next(self, client, message_hashes):
+        future = self.wait(client, message_hashes)
+        self.pending = []
+        if self.error is not None:
+            self.reject_waiters(self.error)
+        return future
+
+    def push(self, result, message_hash):
+        self.answer(result, message_hash)
+        if not self.follows(message_hash):
+            return
+        if self.committed:
+            self.call(result)
+        else:
+            # it is not known yet whether the hash is of the subscription or of a login on the way
+            self.pending.append(result)
+
+    def call(self, result):
+        start = time.perf_counter()
+        try:
+            self.callback(result)
+        except Exception as e:
+            self.exceptions += 1
+            self.last_exception = e
+        self.latency.add((time.perf_counter() - start) * 1000)
+
+    def commit(self):
+        super(Subscription, self).commit()
+        self.committed = True
+        pending, self.pending = self.pending, []
+        for result in pending:
+            self.call(result)
+
+    def fail(self, error):
+        # the subscription ends with its connection, a new on_* call subscribes again
+        self.error = error
+        self.detach()
+        self.reject_waiters(error)
+        if self.on_error is not None:
+            try:
+                self.on_error(error)
+            except Exception as e:
+                self.exceptions += 1
+                self.last_exception = e
+
+    def cancel(self):
+        self.close()
+        self.cancel_waiters()
+
+    def close(self):
+        """stops the callbacks, the exchange stays subscribed as it does after a watch_* call"""
+        self.detach()
+
+    def stats(self):
+        """
+        :returns dict: the number of updates, the time the callback took per update in milliseconds and the exceptions it raised
+        """
+        summary = self.latency.summary()
+        summary['exceptions'] = self.exceptions
+        summary['lastException'] = self.last_exception
+        return summary
+
+
+class Multiplexer(Listener):
+    """
+    the waiter of the watch_multiple() calls over the same message hashes, registered on the client by the first call
+    and reused by the next ones, instead of a race over a future per message hash set up and torn down on every call,
+    the future of a call is resolved with the update of whichever hash comes first and tells that hash in message_hash
+    """
+
+    def __init__(self, client, message_hashes):
+        super(Multiplexer, self).__init__()
+        self.client = client
+        self.message_hashes = message_hashes
+        self.updates = {}  # message hash -> the latest update that came while no call was waiting, in order of arrival
+        self.error = None
+        self.waiter = None  # the future shared by the calls waiting
+
+    def next(self):
+        """
+        :returns Future: resolved with the next update of any of the message hashes, right away if one came meanwhile
+        """
+        if not self.subscriptions:
+            self.attach(self.client, self.message_hashes)
+        if self.error is not None:
+            # the next call over the hashes makes a multiplexer of its own
+            error, self.error = self.error, None
+            self.detach()
+            self.remove()
+            future = Future()
+            future.reject(error)
+            return future
+        if self.updates:
+            message_hash = next(iter(self.updates))
+            future = Future()
+            future.message_hash = message_hash
+            future.resolve(self.updates.pop(message_hash))
+            return future
+        waiter = self.waiter
+        if waiter is None or waiter.done():
+            waiter = self.waiter = Future()
+        return waiter
+
+    def push(self, result, message_hash):
+        waiter = self.waiter
+        if waiter is not None:
+            self.waiter = None
+            if not waiter.done():
+                waiter.message_hash = message_hash
+                waiter.resolve(result)
+                return
+        self.updates[message_hash] = result
+
+    def fail(self, error):
+        # the hashes are unsubscribed or the connection is lost, the multiplexer leaves the client
+        # once the error has reached a call, the next call over the hashes attaches a new one
+        self.detach()
+        self.updates = {}
+        waiter = self.waiter
+        if waiter is not None:
+            self.waiter = None
+            if not waiter.done():
+                waiter.reject(error)
+                self.remove()
+                return
+        self.error = error
+
+    def remove(self):
+        if self.client.multiplexers.get(self.message_hashes) is self:
+            del self.client.multiplexers[self.message_hashes]
+
+    def cancel(self):
+        if self.waiter is not None:
+            self.waiter.cancel()
+            self.waiter = None
+
+
+class Relay:
+    """
+    stands for the future of a message hash that only listeners follow, settling it settles the listeners
+    """
+
+    def __init__(self, client, message_hash):
+        self.client = client
+        self.message_hash = message_hash
+
+    def resolve(self, result=None):
+        self.client.resolve(result, self.message_hash)
+
+    def reject(self, error=None):
+        self.client.reject(error, self.message_hash)
+
+    def done(self):
+        return False
+
+    def cancelled(self):
+        return False
+
+
+class Futures(dict):
+    """
+    Client.futures, the futures of the plain watch() calls, the exchange handlers look up the hashes waited on
+    in it, so the hashes the listeners follow show in it too, with a Relay instead of a future
+    """
+
+    def __init__(self, client, futures=None):
+        super(Futures, self).__init__(futures or {})
+        self.client = client
+
+    def pending(self, message_hash):
+        """
+        :returns Future|None: the future of a plain watch() of the message hash
+        """
+        return dict.get(self, message_hash)
+
+    def __missing__(self, message_hash):
+        if message_hash in self.client.streams:
+            return Relay(self.client, message_hash)
+        raise KeyError(message_hash)
+
+    def __contains__(self, message_hash):
+        return dict.__contains__(self, message_hash) or message_hash in self.client.streams
+
+    def __delitem__(self, message_hash):
+        # the handlers delete the future they have settled, a relay has nothing to delete
+        if dict.__contains__(self, message_hash):
+            dict.__delitem__(self, message_hash)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def keys(self):
+        return list(dict.keys(self)) + [message_hash for message_hash in self.client.streams if not dict.__contains__(self, message_hash)]
+
+    def get(self, message_hash, default=None):
+        return self[message_hash] if message_hash in self else default
@@ -33,6 +33,8 @@ from ccxt.base.decimal_to_precision import decimal_to_precision
 from ccxt.base.decimal_to_precision import DECIMAL_PLACES, TICK_SIZE, NO_PADDING, TRUNCATE, ROUND, ROUND_UP, ROUND_DOWN, SIGNIFICANT_DIGITS
 from ccxt.base.decimal_to_precision import number_to_string
 from ccxt.base.precise import Precise
+from ccxt.base.market_registry import MARKET_PROPERTIES, markets_registry
+from ccxt.base.response_cache import LRUResponseCache, refresh_responses, write_file
 from ccxt.base.types import ConstructorArgs, BalanceAccount, Currency, IndexType, NullableIndexType, OrderSide, OrderType, Trade, OrderRequest, Market, MarketType, Str, Num, NumType, Strings, CancellationRequest, Bool, Order
 
 # -----------------------------------------------------------------------------
@@ -61,11 +63,14 @@ __all__ = [
 # -----------------------------------------------------------------------------
 
 import types
+import inspect
 import logging
 import base64
 import binascii
 import calendar
 import collections
+import contextvars
+import copy
 import datetime
 from email.utils import parsedate
 # import functools
@@ -73,6 +78,7 @@ import gzip
 import hashlib
 import hmac
 import io
+import marshal
 import tempfile
 
 import json
@@ -89,8 +95,41 @@ except ImportError:
     def json_dumps(data):
         return json.dumps(data, separators=(',', ':'))
 
+# set while an implicit api request that is charged to named rateLimitBuckets is made, its
+# throttle() in fetch2() then skips the tokenBucket, so that it does not queue behind the rest,
+# and clears it, the requests made on the way, like a nonce or a token fetch, are throttled
+bucketed_request = contextvars.ContextVar('bucketed_request', default=False)
+
+# numpy is optional and only looked up on first use, so that it never adds to
+# the import time of ccxt itself
+_numpy = None
+
+
+def optional_numpy():
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+class InstanceMethod:
+    # a method of the exchange instance, as the describe() cached by the exchange class holds it
+    __slots__ = ['function']
+
+    def __init__(self, function):
+        self.function = function
+
+
+SETTINGS_CONTAINERS = (dict, list, InstanceMethod, types.MethodType)
+
+
 import math
 import random
+from itertools import islice
 from numbers import Number
 import re
 from requests import Session
@@ -98,7 +137,7 @@ from requests.utils import default_user_agent
 from requests.exceptions import HTTPError, Timeout, TooManyRedirects, RequestException, ConnectionError as requestsConnectionError
 # import socket
 from ssl import SSLError
-# import sys
+import sys
 import time
 import uuid
 import zlib
@@ -144,6 +183,17 @@ class BaseExchange(object):
     tokenBucket = None
     rollingWindowSize = 0.0  # set to 0.0 to use leaky bucket rate limiter
     rateLimiterAlgorithm = 'leakyBucket'
+    # named rate limit buckets consumed instead of the tokenBucket by the implicit api calls they list, for example
+    # {'orders': {'rateLimit': 100, 'capacity': 10, 'endpoints': [{'method': 'POST', 'path': 'order'}]}}
+    rateLimitBuckets = None
+    # async only, resynchronises the throttlers from the usage reported in the response headers, for example
+    # {'used': 'X-MBX-USED-WEIGHT-1M', 'limit': 6000, 'window': 60000} or
+    # {'remaining': 'X-Bapi-Limit-Status', 'limit': 'X-Bapi-Limit', 'reset': 'X-Bapi-Limit-Reset-Timestamp', 'window': 5000}
+    # or a list of those, a 'bucket' key applies a rule to one of the rateLimitBuckets instead of the tokenBucket
+    adaptiveRateLimit = None
+    # async only, concurrent identical public GET requests share one response, True or
+    # {'methods': ['GET'], 'apis': ['public', ...]} to choose what is coalesced
+    coalesceRequests = False
 
     fees = {
         'trading': {
@@ -210,6 +260,7 @@ class BaseExchange(object):
     returnResponseHeaders = False
     origin = '*'  # CORS origin
     MAX_VALUE = float('inf')
+    ohlcvc_bulk_threshold = 1000  # build_ohlcvc_columns() switches to numpy from this many trades
     #
     proxies = None
 
@@ -393,8 +444,11 @@ class BaseExchange(object):
 
         self.origin = self.uuid()
         self.userAgent = default_user_agent()
+        self.bucket_throttlers = {}
+        self.bucket_costs_cache = {}
+        self.markets_registry = None  # the key of the markets this instance shares through the markets registry
 
-        settings = self.deep_extend(self.describe(), config)
+        settings = self.deep_extend(self.class_describe(), config)
 
         for key in settings:
             if hasattr(self, key) and isinstance(getattr(self, key), dict):
@@ -408,22 +462,20 @@ class BaseExchange(object):
             self.set_sandbox_mode(True)
 
         # convert all properties from underscore notation foo_bar to camelcase notation fooBar
-        cls = type(self)
-        for name in dir(self):
+        # the attributes the instance has set itself are aliased with the instance ones
+        aliases = [alias for alias in self.camelcase_aliases() if alias[0] not in self.__dict__]
+        for name in self.__dict__:
             if name[0] != '_' and name[-1] != '_' and '_' in name:
-                parts = name.split('_')
-                # fetch_ohlcv → fetchOHLCV (not fetchOhlcv!)
-                exceptions = {'ohlcv': 'OHLCV', 'le': 'LE', 'be': 'BE', 'adl': 'ADL'}
-                camelcase = parts[0] + ''.join(exceptions.get(i, self.capitalize(i)) for i in parts[1:])
-                attr = getattr(self, name)
-                if isinstance(attr, types.MethodType):
-                    setattr(cls, camelcase, getattr(cls, name))
-                else:
-                    if hasattr(self, camelcase):
-                        if attr is not None:
-                            setattr(self, camelcase, attr)
-                    else:
-                        setattr(self, camelcase, attr)
+                aliases.append((name, self.camelcase(name)))
+        for name, camelcase in aliases:
+            attr = getattr(self, name)
+            if hasattr(self, camelcase):
+                if attr is not None:
+                    setattr(self, camelcase, attr)
+            else:
+                setattr(self, camelcase, attr)
+
+        self.init_response_cache()
 
         if not self.session and self.synchronous:
             # requests/urllib3 connects via socket.create_connection, which resolves
@@ -433,6 +485,81 @@ class BaseExchange(object):
             self.session.trust_env = self.requests_trust_env
         self.logger = self.logger if self.logger else logging.getLogger(__name__)
 
+    def class_describe(self):
+        """
+        :returns dict: describe() of the exchange class, built once per class, with everything but the api and error tables copied for the instance
+        """
+        cls = type(self)
+        described = cls.__dict__.get('_described')
+        if described is None:
+            settings = self.copy_settings(self.describe())
+            # the implicit api methods are generated from the api tree when the class is
+            # defined, and the error tables are lookups only, so they are shared as they
+            # are, the rest is for the instance to modify
+            shared = {key: settings.pop(key) for key in ('api', 'exceptions', 'httpExceptions') if key in settings}
+            plain = {}
+            for key in list(settings):
+                try:
+                    # marshal copies plain dicts, lists and scalars in C, several times faster than describe()
+                    marshal.dumps(settings[key])
+                    plain[key] = settings.pop(key)
+                except ValueError:
+                    pass  # methods of the instance
+            described = (marshal.dumps(plain), settings, shared)
+            cls._described = described
+        frozen, settings, shared = described
+        result = marshal.loads(frozen)
+        for key, value in settings.items():
+            result[key] = self.copy_settings(value)
+        result.update(shared)
+        return result
+
+    def copy_settings(self, value):
+        # copies describe() in both directions, the methods of this instance are put in the
+        # cache of the class as InstanceMethod, and are taken out of it bound to this instance
+        if isinstance(value, dict):
+            # most values are scalars or error classes, which are taken as they are without a call
+            return {key: self.copy_settings(item) if isinstance(item, SETTINGS_CONTAINERS) else item for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.copy_settings(item) if isinstance(item, SETTINGS_CONTAINERS) else item for item in value]
+        if isinstance(value, InstanceMethod):
+            return types.MethodType(value.function, self)
+        if isinstance(value, types.MethodType) and value.__self__ is self:
+            return InstanceMethod(value.__func__)
+        return value
+
+    @staticmethod
+    def camelcase(name):
+        parts = name.split('_')
+        # fetch_ohlcv → fetchOHLCV (not fetchOhlcv!)
+        exceptions = {'ohlcv': 'OHLCV', 'le': 'LE', 'be': 'BE', 'adl': 'ADL'}
+        return parts[0] + ''.join(exceptions.get(i, Exchange.capitalize(i)) for i in parts[1:])
+
+    def camelcase_aliases(self):
+        """
+        :returns [[str, str]]: the snake_case attributes of the exchange class that every instance aliases in camelcase
+        """
+        # walking dir() takes longer than the rest of the constructor, so it happens
+        # once per class: methods are aliased on the class right away, attributes
+        # are left to each instance, their values differ between instances. The
+        # table is read from the class alone, whatever the instance has set
+        cls = type(self)
+        aliases = cls.__dict__.get('_camelcase_attributes')
+        if aliases is None:
+            aliases = []
+            for name in dir(cls):
+                if name[0] != '_' and name[-1] != '_' and '_' in name:
+                    camelcase = self.camelcase(name)
+                    attr = inspect.getattr_static(cls, name)
+                    if hasattr(type(attr), '__get__'):
+                        attr = attr.__get__(self, cls)
+                    if isinstance(attr, types.MethodType):
+                        setattr(cls, camelcase, getattr(cls, name))
+                    else:
+                        aliases.append((name, camelcase))
+            cls._camelcase_attributes = aliases
+        return list(aliases)
+
     def __del__(self):
         self.close()
 
@@ -447,6 +574,16 @@ class BaseExchange(object):
         pass
 
     def throttle(self, cost=None):
+        if bucketed_request.get():
+            bucketed_request.set(False)
+            return
+        backend = self.tokenBucket.get('backend') if self.tokenBucket else None
+        if backend is not None:
+            cost = self.tokenBucket['cost'] if cost is None else cost
+            delay = backend.reserve(cost, self.tokenBucket['refillRate'], self.tokenBucket['capacity'])
+            if delay > 0:
+                time.sleep(delay / 1000.0)
+            return
         now = float(self.milliseconds())
         elapsed = now - self.lastRestRequestTimestamp
         cost = 1 if cost is None else cost
@@ -455,6 +592,77 @@ class BaseExchange(object):
             delay = sleep_time - elapsed
             time.sleep(delay / 1000.0)
 
+    def rate_limit_bucket_config(self, name):
+        bucket = self.rateLimitBuckets[name]
+        rate_limit = bucket.get('rateLimit', self.rateLimit)
+        window_size = bucket.get('windowSize', 0)
+        return self.extend({
+            'delay': 0.001,
+            'capacity': 1,
+            'cost': 1,
+            'refillRate': 1 / rate_limit if rate_limit > 0 else self.MAX_VALUE,
+            'algorithm': 'rollingWindow' if window_size else 'leakyBucket',
+            'windowSize': window_size,
+            'rateLimit': rate_limit,
+        }, self.omit(bucket, 'endpoints'))
+
+    def rate_limit_bucket_costs(self, path, api, method, config={}):
+        """
+        :returns [[str, float]]: the named rateLimitBuckets an implicit api endpoint consumes and at what cost
+        """
+        # an endpoint config can list its buckets as {'buckets': {'orders': 1}}, otherwise the
+        # 'endpoints' rules of each bucket are matched on api, method and path, where a rule
+        # leaves out whatever it does not filter on
+        if 'buckets' in config:
+            return list(config['buckets'].items())
+        key = (str(api), method, path)
+        costs = self.bucket_costs_cache.get(key)
+        if costs is None:
+            costs = []
+            for name, bucket in self.rateLimitBuckets.items():
+                for rule in bucket.get('endpoints', []):
+                    if rule.get('path', path) == path and rule.get('method', method) == method and rule.get('api', api) == api:
+                        costs.append((name, rule.get('cost', 1)))
+                        break
+            self.bucket_costs_cache[key] = costs
+        return costs
+
+    def throttle_bucket(self, name, cost=None):
+        # a blocking leaky bucket with the token arithmetics of the async Throttler,
+        # the sync exchange has no rolling window variant
+        bucket = self.bucket_throttlers.get(name)
+        now = float(self.milliseconds())
+        if bucket is None:
+            bucket = self.bucket_throttlers[name] = self.extend({'tokens': 0, 'timestamp': now}, self.rate_limit_bucket_config(name))
+        bucket['tokens'] = min(bucket['tokens'] + (now - bucket['timestamp']) * bucket['refillRate'], bucket['capacity'])
+        bucket['timestamp'] = now
+        if bucket['tokens'] < 0:
+            delay = -bucket['tokens'] / bucket['refillRate']
+            time.sleep(delay / 1000.0)
+            bucket['tokens'] = 0
+            bucket['timestamp'] = now + delay
+        bucket['tokens'] -= bucket['cost'] if cost is None else cost
+
+    def request_with_buckets(self, path, api='public', method='GET', params={}, config={}):
+        # called by the implicit api methods when rateLimitBuckets is set, an endpoint that
+        # consumes named buckets skips the tokenBucket, the others are throttled by it in fetch2()
+        costs = self.rate_limit_bucket_costs(path, api, method, config) if self.enableRateLimit else []
+        if not costs:
+            return self.request(path, api, method, params, config=config)
+        for name, cost in costs:
+            self.throttle_bucket(name, cost)
+        token = bucketed_request.set(True)
+        try:
+            return self.request(path, api, method, params, config=config)
+        finally:
+            bucketed_request.reset(token)
+
+    def request_coalesced(self, path, api='public', method='GET', params={}, config={}):
+        # a synchronous instance has no concurrent requests to share a response between
+        if self.rateLimitBuckets:
+            return self.request_with_buckets(path, api, method, params, config)
+        return self.request(path, api, method, params, config=config)
+
     def read_file(self, path: str, encoding: str = 'utf-8'):
         """
         Read file contents (synchronous)
@@ -1867,6 +2075,325 @@ class BaseExchange(object):
     def safe_map_to_map(self, dictionary):
         return dictionary  # wrapper for go
 
+    def markets_key(self, options=[]):
+        """
+        :param [str] options: names of the options, beside fetchMarkets, that shape the parsed markets
+        :returns str: a digest of everything that makes the markets of two instances of the exchange differ
+        """
+        key = json.dumps([
+            __version__,
+            sys.version_info[:2],  # the marshal format changes between python versions
+            self.isSandboxModeEnabled,
+            self.urls.get('api'),
+            # the currencies and with them the markets of some exchanges depend on the account
+            self.apiKey,
+            self.uid,
+            self.options.get('fetchMarkets'),
+            [self.options.get(option) for option in options],
+        ], sort_keys=True, default=str)
+        return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+    def markets_cache_path(self):
+        # opt-in with options['marketsCache'] = {'directory': ..., 'ttl': milliseconds}, an empty dict
+        # caches in ~/.cache/ccxt/markets for an hour, entries are keyed by everything that shapes the
+        # parsed markets, so that the sandbox, another version or other market types never share one
+        config = self.safe_dict(self.options, 'marketsCache')
+        if config is None:
+            return None
+        directory = self.safe_string(config, 'directory', os.path.join(os.path.expanduser('~'), '.cache', 'ccxt', 'markets'))
+        return os.path.join(directory, self.id + '-' + self.markets_key(self.safe_list(config, 'options', [])) + '.marshal')
+
+    def read_markets_cache(self):
+        """
+        :returns [dict, dict, dict, bool]|None: the cached fetch_markets() and fetch_currencies() results, the options they set and whether they are past the ttl
+        """
+        path = self.markets_cache_path()
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as file:
+                cached = marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        ttl = self.safe_integer(self.options['marketsCache'], 'ttl', 3600000)
+        return cached['markets'], cached['currencies'], cached.get('options', {}), self.milliseconds() - cached['timestamp'] > ttl
+
+    def write_markets_cache(self, markets, currencies, options={}):
+        path = self.markets_cache_path()
+        if path is None:
+            return
+        try:
+            data = marshal.dumps({'timestamp': self.milliseconds(), 'markets': markets, 'currencies': currencies, 'options': options})
+        except ValueError:
+            # markets holding values marshal does not know are simply not cached
+            return
+        error = write_file(path, data)
+        if error is not None:
+            # the markets were loaded, a cache that cannot be written only costs the next load a request
+            self.logger.warning('%s markets cache %s could not be written: %s', self.id, path, error)
+
+    def markets_options(self, options):
+        """
+        :param dict options: the options before the markets were fetched
+        :returns dict: the options of marketHelperProps and those that fetching the markets has set, a cache hit sets them again
+        """
+        helpers = self.safe_list(self.options, 'marketHelperProps', [])
+        return {name: value for name, value in self.options.items() if name != 'cachedCurrencies' and (name in helpers or options.get(name) is not value)}
+
+    def fetch_markets_and_currencies(self, params={}, reload=False):
+        options = dict(self.options)
+        currencies = None
+        if self.has['fetchCurrencies'] is True:
+            # a reload asks for the current currencies, not for those of the response cache
+            token = refresh_responses.set(True) if reload else None
+            try:
+                currencies = self.fetch_currencies()
+            finally:
+                if token is not None:
+                    refresh_responses.reset(token)
+            self.options['cachedCurrencies'] = currencies
+        markets = self.fetch_markets(params)
+        if 'cachedCurrencies' in self.options:
+            del self.options['cachedCurrencies']
+        self.write_markets_cache(markets, currencies, self.markets_options(options))
+        return markets, currencies
+
+    def markets_registry_key(self):
+        # opt-in with options['marketsRegistry'] = True, or {'options': [...]} to tell apart
+        # instances that differ in options which shape the markets, see ccxt/base/market_registry.py
+        config = self.safe_value(self.options, 'marketsRegistry')
+        if not config:
+            return None
+        options = self.safe_list(config, 'options', []) if isinstance(config, dict) else []
+        return self.id + '-' + self.markets_key(options)
+
+    def get_market_state(self):
+        state = {name: getattr(self, name) for name in MARKET_PROPERTIES}
+        helpers = self.safe_list(self.options, 'marketHelperProps', [])
+        state['options'] = {helper: self.options[helper] for helper in helpers if self.options.get(helper) is not None}
+        return state
+
+    def set_market_state(self, state):
+        for name in MARKET_PROPERTIES:
+            setattr(self, name, state[name])
+        self.options.update(state['options'])
+        return self.markets
+
+    def attach_markets_registry(self):
+        """
+        :returns dict|None: the markets other instances published to the markets registry, if the instance takes part in it
+        """
+        key = self.markets_registry_key()
+        if key != self.markets_registry:
+            # the sandbox mode, the credentials or the options changed since the instance attached
+            if self.markets_registry is not None:
+                markets_registry.detach(self, self.markets_registry)
+            self.markets_registry = key
+        return None if key is None else markets_registry.attach(self, key)
+
+    def publish_markets(self):
+        self.attach_markets_registry()
+        if self.markets_registry is not None:
+            markets_registry.publish(self.markets_registry, self.get_market_state(), self)
+
+    def detach_markets(self):
+        """
+        takes the instance out of the markets registry with a copy of the shared markets, to modify them in place
+        :returns dict: the markets of the instance
+        """
+        if self.markets_registry is not None:
+            markets_registry.detach(self, self.markets_registry)
+            self.markets_registry = None
+            if self.markets:
+                self.set_market_state(copy.deepcopy(self.get_market_state()))
+        return self.markets
+
+    def build_market(self, value):
+        # the market that set_markets() builds from a parsed market, see there
+        valueDefined = {key: item for key, item in value.items() if item is not None}
+        market = self.deep_extend(self.safe_market_structure(), {
+            'precision': self.precision,
+            'limits': self.limits,
+        }, self.fees['trading'], valueDefined)
+        if market['linear']:
+            market['subType'] = 'linear'
+        elif market['inverse']:
+            market['subType'] = 'inverse'
+        else:
+            market['subType'] = None
+        return market
+
+    def update_markets(self, markets, currencies=None):
+        """
+        brings the loaded markets up to date with freshly fetched ones in place, rebuilding only the markets that differ
+        :param dict|[dict] markets: the parsed markets, as fetch_markets() returns them
+        :param dict|None currencies: the parsed currencies, as fetch_currencies() returns them
+        :returns dict: the symbols of the markets that were 'added', 'changed' and 'removed'
+        """
+        if not self.markets or self.markets_by_id is None:
+            self.set_markets(markets, currencies)
+            return {'added': list(self.symbols), 'changed': [], 'removed': []}
+        # the structures are updated in place, other instances may share them through the
+        # markets registry or set_markets_from_exchange()
+        state = {name: getattr(self, name) for name in MARKET_PROPERTIES}
+        # markets_by_id keeps the parsed markets the current ones were built from, which
+        # makes the comparison a plain == of two parsed markets instead of a rebuild, the
+        # entries an exchange adds under other ids in its set_markets() are not compared
+        previous = {}
+        for id, entries in self.markets_by_id.items():
+            for entry in entries:
+                if entry.get('id') == id:
+                    previous[entry['symbol']] = entry
+        fetched = {}
+        for value in self.to_array(markets):
+            fetched[value['symbol']] = value
+        added = []
+        changed = []
+        removed = [symbol for symbol in self.markets if symbol not in fetched]
+        for symbol, value in fetched.items():
+            if symbol not in self.markets:
+                added.append(symbol)
+            elif previous.get(symbol) != value:
+                changed.append(symbol)
+        if type(self).set_markets is not Exchange.set_markets:
+            # the exchange adds to what set_markets() builds, the markets are built again with it
+            if added or removed or changed or currencies:
+                self.set_markets(markets, currencies)
+        else:
+            for symbol in removed + changed:
+                entry = previous.get(symbol)
+                if entry is not None:
+                    entries = self.markets_by_id[entry['id']]
+                    entries[:] = [other for other in entries if other is not entry]
+                    if not entries:
+                        del self.markets_by_id[entry['id']]
+            for symbol in removed:
+                del self.markets[symbol]
+            for symbol in added + changed:
+                value = fetched[symbol]
+                self.markets[symbol] = self.build_market(value)
+                entries = self.markets_by_id.setdefault(value['id'], [])
+                if value.get('spot', True):
+                    # spot markets come first on an id conflict, as in set_markets()
+                    position = 0
+                    while position < len(entries) and entries[position].get('spot', True):
+                        position += 1
+                    entries.insert(position, value)
+                else:
+                    entries.append(value)
+            if added or removed or changed:
+                # updated in place, the lists may be shared through the markets registry
+                self.symbols[:] = sorted(self.markets)
+                self.ids[:] = sorted(self.markets_by_id)
+            if currencies:
+                self.currencies = self.map_to_safe_map(self.deep_extend(self.currencies, currencies))
+            elif added or removed or any(previous[symbol].get(key) != fetched[symbol].get(key) for symbol in changed for key in ('base', 'baseId', 'baseNumericId', 'quote', 'quoteId', 'quoteNumericId', 'precision')):
+                # the derived currencies depend on these fields of the markets only, and on the
+                # order of the markets, which breaks ties between markets of equal precision
+                ordered = [self.markets[value['symbol']] for value in self.sort_by(list(fetched.values()), 'spot', True, True)]
+                self.currencies = self.map_to_safe_map(self.deep_extend(self.currencies, self.derive_currencies(ordered)))
+            self.currencies_by_id = self.index_by_safe(self.currencies, 'id')
+            self.codes = sorted(self.currencies)
+        for name, value in state.items():
+            current = getattr(self, name)
+            if current is not value and value is not None:
+                if isinstance(value, list):
+                    value[:] = current
+                else:
+                    value.clear()
+                    value.update(current)
+                setattr(self, name, value)
+        self.publish_markets()
+        return {'added': added, 'changed': changed, 'removed': removed}
+
+    def derive_currencies(self, values):
+        # the currencies that set_markets() derives from the markets when the exchange has no
+        # fetch_currencies(), the structures are built for the picked currencies only
+        defaultCurrencyPrecision = 8 if (self.precisionMode == DECIMAL_PLACES) else self.parse_number('1e-8')
+        bases = {}
+        quotes = {}
+        candidates = {}  # code -> base candidates then quote candidates, in the order of the markets
+        for side, found in (('base', bases), ('quote', quotes)):
+            for market in values:
+                if side in market:
+                    marketPrecision = self.safe_dict(market, 'precision', {})
+                    candidate = {
+                        'id': self.safe_string_2(market, side + 'Id', side),
+                        'numericId': self.safe_integer(market, side + 'NumericId'),
+                        'code': self.safe_string(market, side),
+                        'precision': self.safe_value_2(marketPrecision, side, 'amount' if side == 'base' else 'price', defaultCurrencyPrecision),
+                    }
+                    found[candidate['code']] = candidate
+                    candidates.setdefault(candidate['code'], []).append(candidate)
+        self.baseCurrencies = self.map_to_safe_map(self.index_by(self.sort_by([self.safe_currency_structure(currency) for currency in bases.values()], 'code', False, ''), 'code'))
+        self.quoteCurrencies = self.map_to_safe_map(self.index_by(self.sort_by([self.safe_currency_structure(currency) for currency in quotes.values()], 'code', False, ''), 'code'))
+        result = []
+        for grouped in candidates.values():
+            highestPrecisionCurrency = grouped[0]
+            for currentCurrency in grouped[1:]:
+                if self.precisionMode == TICK_SIZE:
+                    highestPrecisionCurrency = currentCurrency if (currentCurrency['precision'] < highestPrecisionCurrency['precision']) else highestPrecisionCurrency
+                else:
+                    highestPrecisionCurrency = currentCurrency if (currentCurrency['precision'] > highestPrecisionCurrency['precision']) else highestPrecisionCurrency
+            result.append(self.safe_currency_structure(highestPrecisionCurrency))
+        return self.index_by(self.sort_by(result, 'code'), 'code')
+
+    def reload_markets(self, params={}):
+        """
+        fetches the markets again and updates the loaded ones incrementally, see update_markets()
+        :returns dict: the symbols of the markets that were 'added', 'changed' and 'removed'
+        """
+        return self.update_markets(*self.fetch_markets_and_currencies(params, True))
+
+    def init_response_cache(self):
+        # opt-in with options['responseCache'] = {'ttl': {'fetchCurrencies': milliseconds, ...}, 'maxEntries': ...,
+        # 'maxBytes': ..., 'backend': ...}, an empty dict keeps the results of the methods below in memory for
+        # their default ttl, a ttl of 0 leaves a method out, see ccxt.base.response_cache for the backends
+        config = self.safe_dict(self.options, 'responseCache')
+        self.response_cache = None
+        if config is None:
+            return
+        ttls = self.extend({
+            'fetchCurrencies': 3600000,
+            'fetchTradingFees': 600000,
+            'fetchLeverageTiers': 3600000,
+            'fetchDepositWithdrawFees': 3600000,
+            'fetchFundingIntervals': 3600000,
+        }, self.safe_dict(config, 'ttl', {}))
+        self.response_cache = config.get('backend') or LRUResponseCache(self.safe_integer(config, 'maxEntries', 1024), self.safe_integer(config, 'maxBytes', 64 * 1024 * 1024))
+        for name, ttl in ttls.items():
+            name = self.un_camel_case(name)
+            method = getattr(self, name, None)
+            if ttl and callable(method):
+                # the instance attributes shadow the methods of the class under both names
+                cached = self.cached_method(name, method, ttl)
+                setattr(self, name, cached)
+                setattr(self, self.camelcase(name), cached)
+
+    def response_cache_key(self, name, args, kwargs):
+        # the credentials take part in the key, the results of private methods are per account
+        key = json.dumps([self.markets_key(), self.apiKey, self.uid, args, kwargs], sort_keys=True, default=str)
+        return self.id + '-' + name + '-' + hashlib.sha256(key.encode()).hexdigest()
+
+    def cached_method(self, name, method, ttl):
+        def cached(*args, **kwargs):
+            key = self.response_cache_key(name, args, kwargs)
+            value = None if refresh_responses.get() else self.response_cache.get(key)
+            if value is not None:
+                return marshal.loads(value)
+            result = method(*args, **kwargs)
+            self.store_response(key, result, ttl)
+            return result
+        return cached
+
+    def store_response(self, key, result, ttl):
+        try:
+            value = marshal.dumps(result)
+        except ValueError:
+            # results holding values marshal does not know are simply not cached
+            return
+        self.response_cache.set(key, value, ttl)
+
     def load_markets(self, reload=False, params={}):
         """
         Loads and prepares the markets for trading.
@@ -1892,14 +2419,26 @@ class BaseExchange(object):
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
-        currencies = None
-        if self.has['fetchCurrencies'] is True:
-            currencies = self.fetch_currencies()
-            self.options['cachedCurrencies'] = currencies
-        markets = self.fetch_markets(params)
-        if 'cachedCurrencies' in self.options:
-            del self.options['cachedCurrencies']
-        return self.set_markets(markets, currencies)
+            state = self.attach_markets_registry()
+            if state is not None:
+                return self.set_market_state(state)
+            cached = self.read_markets_cache()
+            if cached is not None:
+                markets, currencies, options, stale = cached
+                self.options.update(options)
+                if stale:
+                    # a blocking instance has no background to revalidate in, its session is not
+                    # shared with another thread, so a stale entry is only the fallback of a failed load
+                    try:
+                        markets, currencies = self.fetch_markets_and_currencies(params, True)
+                    except Exception as e:
+                        self.logger.debug('%s markets cache revalidation failed, the stale markets are used: %s', self.id, e)
+                self.set_markets(markets, currencies)
+                self.publish_markets()
+                return self.markets
+        self.set_markets(*self.fetch_markets_and_currencies(params, reload))
+        self.publish_markets()
+        return self.markets
 
     def fetch_markets(self, params={}):
         # markets are returned as a list
@@ -1956,6 +2495,104 @@ class BaseExchange(object):
         offset = timestamp % ms
         return timestamp - offset + (ms if direction == ROUND_UP else 0)
 
+    def build_ohlcvc_columns(self, timestamps, prices, amounts, timeframe='1m', since=0, limit=2147483647, ohlcvs=None):
+        """
+        columnar build_ohlcvc(), takes parallel sequences (lists or numpy arrays) of trade timestamps, prices and amounts
+        instead of a list of trade dicts, recent last
+        :param str timeframe: the length of time each candle represents
+        :param int since: candles opening earlier than this timestamp are skipped
+        :param int limit: only the first *limit* trades are aggregated, like in build_ohlcvc()
+        :param list ohlcvs: an existing list of candles to extend in place, trades falling into its last candle update that candle
+        :returns [[int|float]]: [timestamp, open, high, low, close, volume, count] rows, the same as build_ohlcvc() returns
+        """
+        # numpy is optional, the bulk path is only taken when it is importable and
+        # there are enough trades to amortize building the arrays, missing amounts
+        # count as zero volume in both paths
+        ms = self.parse_timeframe(timeframe) * 1000
+        if ohlcvs is None:
+            ohlcvs = []
+        options = self.safe_dict(self.options, 'buildOHLCVC', {})
+        skipZeroPrices = self.safe_bool(options, 'skipZeroPrices', True)
+        length = min(len(timestamps), len(prices), len(amounts), limit)
+        numpy = optional_numpy()
+        if numpy is not None and (length >= self.ohlcvc_bulk_threshold or isinstance(prices, numpy.ndarray)):
+            self._build_ohlcvc_numpy(numpy, ohlcvs, timestamps[:length], prices[:length], amounts[:length], ms, since, skipZeroPrices)
+            return ohlcvs
+        candle = ohlcvs[-1] if ohlcvs else None
+        end = candle[0] + ms if candle else None
+        for ts, price, amount in zip(islice(timestamps, length), prices, amounts):
+            if ts is None or price is None or ts < since:
+                continue
+            openingTime = int(ts // ms) * ms
+            if openingTime < since:
+                continue
+            if skipZeroPrices and not (price > 0) and not (price < 0):
+                continue
+            if candle is None or openingTime >= end:
+                candle = [openingTime, price, price, price, price, amount or 0, 1]
+                ohlcvs.append(candle)
+                end = openingTime + ms
+            else:
+                if price > candle[2]:
+                    candle[2] = price
+                if price < candle[3]:
+                    candle[3] = price
+                candle[4] = price
+                if amount:
+                    candle[5] += amount
+                candle[6] += 1
+        return ohlcvs
+
+    @staticmethod
+    def _build_ohlcvc_numpy(numpy, ohlcvs, timestamps, prices, amounts, ms, since, skipZeroPrices):
+        ts = numpy.asarray(timestamps, dtype=numpy.float64)
+        price = numpy.asarray(prices, dtype=numpy.float64)
+        amount = numpy.asarray(amounts, dtype=numpy.float64)
+        opening = numpy.floor(ts / ms) * ms
+        # None becomes nan here and fails every comparison below
+        keep = (ts >= since) & (opening >= since) & ~numpy.isnan(price)
+        if skipZeroPrices:
+            keep &= price != 0
+        opening = opening[keep]
+        price = price[keep]
+        amount = numpy.nan_to_num(amount[keep])
+        if not len(price):
+            return
+        # build_ohlcvc() only opens a new candle for a trade past the end of the
+        # current one, so the candle a trade goes to is the running maximum of
+        # the opening times, and candles start wherever that maximum grows
+        last = ohlcvs[-1] if ohlcvs else None
+        current = numpy.maximum.accumulate(opening)
+        if last is not None:
+            current = numpy.maximum(current, last[0] + ms - 1)
+        previous = numpy.empty_like(current)
+        previous[0] = -numpy.inf if last is None else last[0] + ms - 1
+        previous[1:] = current[:-1]
+        starts = numpy.flatnonzero(current > previous)
+        head = starts[0] if len(starts) else len(price)
+        if head:
+            # the trades before the first new candle still belong to the last one
+            last[2] = max(last[2], float(price[:head].max()))
+            last[3] = min(last[3], float(price[:head].min()))
+            last[4] = float(price[head - 1])
+            last[5] = (last[5] or 0) + float(amount[:head].sum())
+            last[6] += int(head)
+        if not len(starts):
+            return
+        price = price[head:]
+        amount = amount[head:]
+        offsets = starts - head
+        ends = numpy.append(offsets[1:], len(price))
+        ohlcvs.extend([list(row) for row in zip(
+            current[starts].astype(numpy.int64).tolist(),
+            price[offsets].tolist(),
+            numpy.maximum.reduceat(price, offsets).tolist(),
+            numpy.minimum.reduceat(price, offsets).tolist(),
+            price[ends - 1].tolist(),
+            numpy.add.reduceat(amount, offsets).tolist(),
+            (ends - offsets).tolist(),
+        )])
+
     def check_required_dependencies(self):
         pass
 
@@ -0,0 +1,55 @@
+import bisect
+
+# The async Exchange aggregates the timings of its requests per endpoint and phase into these
+# histograms when options['requestTiming'] is set, see Exchange.request_timing_stats()
+
+
+class LatencyHistogram:
+    """counts latencies in fixed buckets, from which percentiles are estimated to the upper bound of their bucket"""
+
+    __slots__ = ['counts', 'count', 'total', 'min', 'max']
+
+    bounds = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000, 60000)  # milliseconds
+
+    def __init__(self):
+        self.counts = [0] * (len(self.bounds) + 1)  # the last bucket counts what is beyond the last bound
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, milliseconds):
+        self.counts[bisect.bisect_left(self.bounds, milliseconds)] += 1
+        self.count += 1
+        self.total += milliseconds
+        if self.min is None or milliseconds < self.min:
+            self.min = milliseconds
+        if self.max is None or milliseconds > self.max:
+            self.max = milliseconds
+
+    def percentile(self, q):
+        """
+        :param float q: the percentile, between 0 and 100
+        :returns float|None: the upper bound of the bucket the percentile falls in, at most the largest latency seen
+        """
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(self.bounds[index], self.max) if index < len(self.bounds) else self.max
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'average': self.total / self.count if self.count else None,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'buckets': dict(zip(self.bounds + (float('inf'),), self.counts)),
+        }
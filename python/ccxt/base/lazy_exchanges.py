@@ -0,0 +1,40 @@
+import importlib
+import sys
+from types import ModuleType
+
+
+class ExchangesModule(ModuleType):
+    # the import system binds every submodule on its package under the name of the
+    # submodule, which for an exchange is also the name of its class - with eager
+    # imports the package __init__ rebinds the class right after, with lazy ones
+    # nothing does, so `import ccxt.pro.binance` (that imports the async binance
+    # module) would leave ccxt.async_support.binance pointing at a module
+    def __setattr__(self, name, value):
+        if isinstance(value, ModuleType) and value.__name__ == self.__name__ + '.' + name and name in self.__dict__['exchanges']:
+            value = getattr(value, name)
+        super(ExchangesModule, self).__setattr__(name, value)
+
+
+def lazy_exchanges(package):
+    """
+    PEP 562 module __getattr__ and __dir__ for a package that imports its exchange classes on first access
+    :param str package: the __name__ of the package, its `exchanges` list names the exchanges it provides
+    :returns [function, function]: the __getattr__ and __dir__ of the package
+    """
+    module = sys.modules[package]
+    module.__class__ = ExchangesModule
+    namespace = module.__dict__
+    ids = frozenset(namespace['exchanges'])
+
+    def __getattr__(name):
+        if name not in ids:
+            raise AttributeError('module ' + repr(package) + ' has no attribute ' + repr(name))
+        # rebinding an already imported submodule is harmless, ExchangesModule.__setattr__
+        # turns it into the class either way
+        setattr(module, name, importlib.import_module(package + '.' + name))
+        return namespace[name]
+
+    def __dir__():
+        return sorted(ids.union(namespace))
+
+    return __getattr__, __dir__
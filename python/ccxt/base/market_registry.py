@@ -0,0 +1,88 @@
+import threading
+import weakref
+
+# The market registry lets the exchange instances of a process that connect to the same venue
+# with the same settings and account hold one copy of the loaded markets instead of one each:
+#
+#     exchange = ccxt.binance({'apiKey': ..., 'options': {'marketsRegistry': True}})
+#
+# The first instance to load the markets publishes them, the others attach to them on their
+# load_markets() without a request. A reload of any attached instance is published to all of
+# them, reload_markets() updates the shared markets in place for all of them at once. An
+# instance that sets markets of its own with set_markets() or detach_markets() keeps them to
+# itself.
+
+MARKET_PROPERTIES = ['markets', 'markets_by_id', 'symbols', 'ids', 'currencies', 'currencies_by_id', 'baseCurrencies', 'quoteCurrencies', 'codes']
+
+
+class MarketRegistryEntry:
+    __slots__ = ['state', 'instances', 'references']
+
+    def __init__(self):
+        self.state = None  # the values of MARKET_PROPERTIES and of the marketHelperProps options
+        self.instances = weakref.WeakKeyDictionary()  # instance -> the finalizer that releases it once collected
+        self.references = 0
+
+
+class MarketRegistry:
+    """markets shared by the exchange instances of a process, counted by reference and dropped with the last instance"""
+
+    def __init__(self):
+        self.lock = threading.RLock()  # finalizers may run in a garbage collection while the lock is held
+        self.entries = {}
+
+    def attach(self, exchange, key):
+        """
+        :param ccxt.Exchange exchange: the instance that takes part in the markets registered under key
+        :param str key: the markets identity, see Exchange.markets_key()
+        :returns dict|None: the markets published under key so far
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = self.entries[key] = MarketRegistryEntry()
+            if exchange not in entry.instances:
+                # collected instances let go of their reference on their own
+                entry.instances[exchange] = weakref.finalize(exchange, self.release, key)
+                entry.references += 1
+            return entry.state
+
+    def detach(self, exchange, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            finalizer = None if entry is None else entry.instances.pop(exchange, None)
+        if finalizer is not None:
+            finalizer()
+
+    def release(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return
+            entry.references -= 1
+            if entry.references <= 0:
+                del self.entries[key]
+
+    def publish(self, key, state, source):
+        """
+        makes state the markets under key and passes it on to the attached instances that still share the previous markets
+        :returns [ccxt.Exchange]: the instances the state was passed on to
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return []
+            previous = entry.state
+            entry.state = state
+            instances = [exchange for exchange in entry.instances if exchange is not source and (previous is None or exchange.markets is previous['markets'])]
+        for exchange in instances:
+            exchange.set_market_state(state)
+        return instances
+
+    def references(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            return 0 if entry is None else entry.references
+
+
+markets_registry = MarketRegistry()
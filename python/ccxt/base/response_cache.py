@@ -0,0 +1,122 @@
+import abc
+import collections
+import contextvars
+import hashlib
+import marshal
+import os
+import tempfile
+import threading
+import time
+
+# Response caches hold the results of the unified methods listed in options['responseCache'],
+# so that repeated calls of slow-changing endpoints are answered without a request:
+#
+#     exchange = ccxt.binance({'options': {'responseCache': {'ttl': {'fetchCurrencies': 3600000}}}})
+#
+# A cache only has to implement get() and set(). Values are stored marshalled, so that every
+# hit returns a copy the caller is free to modify, and results that marshal does not know are
+# not cached at all.
+
+
+# set while the markets are reloaded, the cached methods skip the cache and store their fresh results
+refresh_responses = contextvars.ContextVar('refresh_responses', default=False)
+
+
+def write_file(path, data):
+    """
+    writes data to path aside and renames it, so that a concurrent reader never sees half a file
+    :returns OSError|None: the error that kept the file from being written, a cache that cannot be written is not fatal
+    """
+    directory = os.path.dirname(path)
+    temporary = None
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=directory)
+        with os.fdopen(fd, 'wb') as file:
+            file.write(data)
+        os.replace(temporary, path)
+    except OSError as e:
+        if temporary is not None and os.path.exists(temporary):
+            os.remove(temporary)
+        return e
+    return None
+
+
+class ResponseCache(abc.ABC):
+
+    @abc.abstractmethod
+    def get(self, key):
+        """
+        :param str key: the method and the arguments of the call, see Exchange.response_cache_key()
+        :returns bytes|None: the marshalled result stored under key, unless it has expired
+        """
+
+    @abc.abstractmethod
+    def set(self, key, value, ttl):
+        """
+        :param str key: the method and the arguments of the call
+        :param bytes value: the marshalled result
+        :param int ttl: milliseconds the result stays valid
+        """
+
+    @staticmethod
+    def milliseconds():
+        return time.time() * 1000
+
+
+class LRUResponseCache(ResponseCache):
+    """a cache in memory, bounded in entries and in bytes, that evicts the least recently used entries first"""
+
+    def __init__(self, max_entries=1024, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries = collections.OrderedDict()  # key -> (expires at, value), the most recently used last
+        self.size = 0
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= self.milliseconds():
+                self.size -= len(self.entries.pop(key)[1])
+                return None
+            self.entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ttl):
+        if len(value) > self.max_bytes:
+            return
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous[1])
+            self.entries[key] = (self.milliseconds() + ttl, value)
+            self.size += len(value)
+            while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+                self.size -= len(self.entries.popitem(last=False)[1][1])
+
+
+class FileResponseCache(ResponseCache):
+    """a cache on disk, shared by the processes that use the same directory, expired entries are replaced on the next set()"""
+
+    def __init__(self, directory=None):
+        self.directory = directory or os.path.join(os.path.expanduser('~'), '.cache', 'ccxt', 'responses')
+
+    def path(self, key):
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest() + '.marshal')
+
+    def get(self, key):
+        try:
+            with open(self.path(key), 'rb') as file:
+                expires, stored, value = marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        # the digest names the file, the key itself tells a collision apart
+        if stored != key or expires <= self.milliseconds():
+            return None
+        return value
+
+    def set(self, key, value, ttl):
+        write_file(self.path(key), marshal.dumps((self.milliseconds() + ttl, key, value)))
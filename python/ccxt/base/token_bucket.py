@@ -0,0 +1,116 @@
+import abc
+import mmap
+import os
+import struct
+import threading
+import time
+
+from ccxt.base.errors import NotSupported
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Rate limit backends hold the leaky bucket state that the async Throttler and the sync
+# Exchange.throttle() draw from when tokenBucket['backend'] is set, so that several exchange
+# instances, threads or processes spend from one budget:
+#
+#     bucket = SharedTokenBucket('/dev/shm/ccxt-binance')
+#     exchange = ccxt.binance({'tokenBucket': {'backend': bucket}})
+#
+# A backend only has to implement reserve(), which takes the cost of a request and returns how
+# many milliseconds the caller has to wait before sending it. The cost is charged right away,
+# so concurrent callers line up behind each other in the order of their reservations.
+
+
+class TokenBucketBackend(abc.ABC):
+    state = struct.Struct('dd')  # tokens, timestamp in milliseconds
+
+    @abc.abstractmethod
+    def reserve(self, cost, refill_rate, capacity):
+        """
+        :param float cost: the cost of the request, charged right away
+        :param float refill_rate: tokens per millisecond
+        :param float capacity: the most tokens the bucket holds
+        :returns float: milliseconds to wait before sending the request
+        """
+
+    @staticmethod
+    def take(tokens, timestamp, cost, refill_rate, capacity, now):
+        # the arithmetics of the Throttler leaky bucket: a request goes once the
+        # tokens are back to zero and then charges its cost, possibly into debt
+        if timestamp == 0:
+            tokens = 0
+            timestamp = now
+        if now > timestamp:
+            tokens = min(tokens + (now - timestamp) * refill_rate, capacity)
+            timestamp = now
+        delay = 0 if tokens >= 0 else -tokens / refill_rate
+        return tokens - cost, timestamp, delay
+
+    @staticmethod
+    def milliseconds():
+        # the wall clock, the only clock all processes on a host agree on
+        return time.time() * 1000
+
+
+class LocalTokenBucket(TokenBucketBackend):
+    """a bucket shared by the exchange instances and threads of one process"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tokens = 0
+        self.timestamp = 0
+
+    def reserve(self, cost, refill_rate, capacity):
+        with self.lock:
+            self.tokens, self.timestamp, delay = self.take(self.tokens, self.timestamp, cost, refill_rate, capacity, self.milliseconds())
+        return delay
+
+
+class SharedTokenBucket(TokenBucketBackend):
+    """a bucket shared by all processes on a host that open the same file, put it on a tmpfs like /dev/shm to keep it in memory"""
+
+    def __init__(self, path):
+        if fcntl is None:
+            raise NotSupported('SharedTokenBucket requires fcntl file locks, which are not available on this platform')
+        self.path = path
+        self.open()
+
+    def open(self):
+        # flock() locks belong to the open file description, which a forked child
+        # shares with its parent, so every process has to open the file itself
+        self.pid = os.getpid()
+        self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self.fd).st_size < self.state.size:
+                os.ftruncate(self.fd, self.state.size)
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+        self.memory = mmap.mmap(self.fd, self.state.size)
+
+    def close(self):
+        self.memory.close()
+        os.close(self.fd)
+
+    def reserve(self, cost, refill_rate, capacity):
+        if self.pid != os.getpid():
+            self.open()
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            tokens, timestamp = self.state.unpack_from(self.memory)
+            tokens, timestamp, delay = self.take(tokens, timestamp, cost, refill_rate, capacity, self.milliseconds())
+            self.state.pack_into(self.memory, 0, tokens, timestamp)
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+        return delay
+
+    def __getstate__(self):
+        # multiprocessing pickles the bucket by its path, the other process opens the file anew
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.path = state['path']
+        self.open()
@@ -40,6 +40,10 @@ class Entry(Generic[_EntryReturns]):
         self.config = config
 
         def unbound_method(_self, params={}) -> _EntryReturns:
+            if _self.coalesceRequests:
+                return _self.request_coalesced(self.path, self.api, self.method, params, config=self.config)
+            if _self.rateLimitBuckets:
+                return _self.request_with_buckets(self.path, self.api, self.method, params, config=self.config)
             return _self.request(self.path, self.api, self.method, params, config=self.config)
 
         self.unbound_method = unbound_method
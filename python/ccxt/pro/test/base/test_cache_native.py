@@ -1,5 +1,6 @@
 import os
 import sys
+import random
 
 root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 sys.path.append(root)
@@ -426,6 +427,42 @@ def test_eviction_drops_the_empty_outer_bucket():
     assert sorted(list(multi.hashmap['BTC/USDT'].keys())) == ['1', '3']
 
 
+def test_updates_move_rows_in_constant_time():
+    # invariant guard as a whole - the by-id and by-side caches keep their order
+    # in an OrderedDict and only rebuild the deque on a read after a move, so
+    # random updates are replayed against a plain list model of the move-to-end
+    # and evict-oldest semantics, reading in between at random so that both the
+    # stale and the in-sync paths are taken
+    rng = random.Random(6)
+    for max_size in (None, 5):
+        cache = ArrayCacheBySymbolById(max_size)
+        model = []
+        for step in range(2000):
+            symbol = rng.choice(['BTC/USDT', 'ETH/USDT'])
+            order_id = str(rng.randint(0, 12))
+            row = next((row for row in model if row['symbol'] == symbol and row['id'] == order_id), None)
+            if row is not None:
+                model.remove(row)
+            elif max_size is not None and len(model) == max_size:
+                model.pop(0)
+            model.append({'symbol': symbol, 'id': order_id})
+            cache.append({'symbol': symbol, 'id': order_id, 'step': step})
+            assert len(cache) == len(model)
+            if rng.random() < 0.3:
+                assert [(row['symbol'], row['id']) for row in cache] == [(row['symbol'], row['id']) for row in model]
+                assert cache[-1]['step'] == step
+        assert [(row['symbol'], row['id']) for row in cache[:]] == [(row['symbol'], row['id']) for row in model]
+        assert sum(len(by_id) for by_id in cache.hashmap.values()) == len(model)
+    positions = ArrayCacheBySymbolBySide()
+    positions.append({'symbol': 'BTC/USDT', 'side': 'long', 'contracts': 1})
+    positions.append({'symbol': 'BTC/USDT', 'side': 'short', 'contracts': 2})
+    positions.append({'symbol': 'BTC/USDT', 'side': 'long', 'contracts': 3})
+    positions.append({'symbol': 'ETH/USDT', 'side': 'long', 'contracts': 4})
+    assert [row['contracts'] for row in positions] == [2, 3, 4]
+    assert positions.getLimit('BTC/USDT', None) == 2
+    assert positions.getLimit(None, None) == 3  # invariant guard
+
+
 def test_ws_cache_python_regressions():
     test_max_size_zero_is_unbounded()
     test_index_token_does_not_collide_across_the_field_boundary()
@@ -434,6 +471,7 @@ def test_ws_cache_python_regressions():
     test_by_symbol_by_side_does_not_evict()
     test_partial_update_merges_into_the_cached_row()
     test_eviction_drops_the_empty_outer_bucket()
+    test_updates_move_rows_in_constant_time()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,127 @@
+import os
+import sys
+import json
+import asyncio
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+import ccxt.pro  # noqa: F402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - the handlers of the exchanges
+# look up the message hashes waited on in client.futures, the watch_multiple()
+# multiplexers are found there too. The connection only records the messages
+# sent on it, the updates are handled by the exchange directly.
+# ----------------------------------------------------------------------------
+
+MARKETS = [
+    {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'baseId': 'BTC', 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'active': True},
+    {'id': 'ETHUSDT', 'symbol': 'ETH/USDT', 'base': 'ETH', 'quote': 'USDT', 'baseId': 'ETH', 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'active': True},
+]
+
+
+class RecordingConnection:
+    closed = False
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_str(self, message):
+        self.sent.append(json.loads(message))
+
+    async def close(self):
+        self.closed = True
+
+
+def coinex_state(market_id, last):
+    return {
+        'method': 'state.update',
+        'data': {
+            'state_list': [
+                {'market': market_id, 'last': last, 'open': last, 'close': last, 'high': last, 'low': last, 'volume': '1', 'value': last, 'period': 86400},
+            ],
+        },
+        'id': None,
+    }
+
+
+def connect(exchange, url):
+    client = exchange.client(url)
+    client.connection = RecordingConnection()
+    client.connected.resolve(url)  # skips connecting
+    return client
+
+
+async def test_ws_handlers_watch_multiple(exchange, client):
+    # coinex watch_tickers() waits on the hashes of its symbols with watch_multiple(),
+    # handle_ticker() resolves the ones find_message_hashes() returns
+    future = asyncio.ensure_future(exchange.watch_tickers(['BTC/USDT', 'ETH/USDT']))
+    await asyncio.sleep(0)
+    assert sorted(exchange.find_message_hashes(client, 'tickers::')) == ['tickers::BTC/USDT', 'tickers::ETH/USDT']
+    assert 'tickers::ETH/USDT' in client.futures and client.futures == {}
+    exchange.handle_message(client, coinex_state('ETHUSDT', '2000'))
+    tickers = await asyncio.wait_for(future, 1)
+    assert list(tickers) == ['ETH/USDT'] and tickers['ETH/USDT']['last'] == 2000.0
+    # the multiplexer stays registered between the calls, an update that comes meanwhile goes to the next call
+    exchange.handle_message(client, coinex_state('BTCUSDT', '30000'))
+    tickers = await asyncio.wait_for(exchange.watch_tickers(['BTC/USDT', 'ETH/USDT']), 1)
+    assert tickers['BTC/USDT']['last'] == 30000.0
+    # the future a handler takes from client.futures settles the multiplexer
+    future = asyncio.ensure_future(exchange.watch_tickers(['BTC/USDT', 'ETH/USDT']))
+    await asyncio.sleep(0)
+    exchange.safe_value(client.futures, 'tickers::BTC/USDT').resolve({'BTC/USDT': {'symbol': 'BTC/USDT'}})
+    del client.futures['tickers::BTC/USDT']
+    assert await asyncio.wait_for(future, 1) == {'BTC/USDT': {'symbol': 'BTC/USDT'}}
+    assert client.futures == {} and 'tickers::BTC/USDT' in client.futures
+
+
+async def test_ws_handlers_stream(exchange, client):
+    # the watch_multiple() of a stream follows the hashes on the stream, handle_ticker() finds them all the same
+    stream = exchange.stream_tickers(['BTC/USDT'])
+    pending = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)
+    # the multiplexer of the calls above follows the hash as well
+    assert len(client.streams['tickers::BTC/USDT']) == 2 and client.futures == {}
+    assert 'tickers::BTC/USDT' in exchange.find_message_hashes(client, 'tickers::')
+    exchange.handle_message(client, coinex_state('BTCUSDT', '31000'))
+    assert (await asyncio.wait_for(pending, 1))['BTC/USDT']['last'] == 31000.0
+    # the updates that come while the consumer is busy are conflated into the next one
+    exchange.handle_message(client, coinex_state('BTCUSDT', '32000'))
+    exchange.handle_message(client, coinex_state('BTCUSDT', '33000'))
+    assert (await asyncio.wait_for(stream.__anext__(), 1))['BTC/USDT']['last'] == 33000.0
+    await stream.aclose()
+
+
+async def test_ws_handlers_subscription(exchange, client):
+    # the callback of on_tickers() is called from handle_ticker() with every update of its symbols
+    updates = []
+    pending = asyncio.ensure_future(exchange.on_tickers(['ETH/USDT'], lambda tickers: updates.append(tickers['ETH/USDT']['last'])))
+    await asyncio.sleep(0)
+    assert 'tickers::ETH/USDT' in exchange.find_message_hashes(client, 'tickers::')
+    exchange.handle_message(client, coinex_state('ETHUSDT', '2100'))
+    subscription = await asyncio.wait_for(pending, 1)
+    exchange.handle_message(client, coinex_state('ETHUSDT', '2200'))
+    exchange.handle_message(client, coinex_state('BTCUSDT', '34000'))
+    exchange.handle_message(client, coinex_state('ETHUSDT', '2300'))
+    assert updates == [2100.0, 2200.0, 2300.0]
+    subscription.close()
+    assert all(subscription not in streams for streams in client.streams.values())
+
+
+async def test_ws_exchange_handlers_native():
+    exchange = ccxt.pro.coinex()
+    try:
+        exchange.set_markets(MARKETS)
+        client = connect(exchange, exchange.urls['api']['ws']['spot'])
+        await test_ws_handlers_watch_multiple(exchange, client)
+        await test_ws_handlers_stream(exchange, client)
+        await test_ws_handlers_subscription(exchange, client)
+        assert client.connection.sent[0]['method'] == 'state.subscribe'
+    finally:
+        await exchange.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_ws_exchange_handlers_native())
+    print('test_ws_exchange_handlers_native passed')
@@ -0,0 +1,104 @@
+import os
+import sys
+import asyncio
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.base.errors import NetworkError, UnsubscribeError  # noqa: F402
+from ccxt.async_support.base.exchange import Exchange  # noqa: F402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - the watch_multiple() calls
+# over the same message hashes share one multiplexer registered on the client.
+# The client is never connected, the updates are resolved on it directly.
+# ----------------------------------------------------------------------------
+
+URL = 'wss://localhost/ws'
+SYMBOLS = ['BTC/USDT', 'ETH/USDT', 'LTC/USDT']
+MESSAGE_HASHES = ['ticker:' + symbol for symbol in SYMBOLS]
+
+
+class MultiplexingExchange(Exchange):
+    def describe(self):
+        return self.deep_extend(super(MultiplexingExchange, self).describe(), {'id': 'multiplextest'})
+
+
+async def test_ws_multiplex_updates(exchange, client):
+    future = exchange.watch_multiple(URL, MESSAGE_HASHES, None, MESSAGE_HASHES)
+    client.resolve({'symbol': 'ETH/USDT'}, 'ticker:ETH/USDT')
+    assert (await future)['symbol'] == 'ETH/USDT' and future.message_hash == 'ticker:ETH/USDT'
+    # no future per message hash is left behind, the multiplexer stays registered for the next calls
+    assert client.futures == {}
+    assert list(client.multiplexers) == [frozenset(MESSAGE_HASHES)]
+    assert all(len(client.streams[message_hash]) == 1 for message_hash in MESSAGE_HASHES)
+    # the calls waiting at the same time share the next update
+    first = exchange.watch_multiple(URL, MESSAGE_HASHES)
+    second = exchange.watch_multiple(URL, MESSAGE_HASHES)
+    assert first is second
+    client.resolve({'symbol': 'LTC/USDT'}, 'ticker:LTC/USDT')
+    assert (await first)['symbol'] == 'LTC/USDT'
+    # the updates that come while no call waits are returned by the next calls, the latest per hash
+    client.resolve({'symbol': 'BTC/USDT', 'last': 1}, 'ticker:BTC/USDT')
+    client.resolve({'symbol': 'ETH/USDT'}, 'ticker:ETH/USDT')
+    client.resolve({'symbol': 'BTC/USDT', 'last': 2}, 'ticker:BTC/USDT')
+    assert await exchange.watch_multiple(URL, MESSAGE_HASHES) == {'symbol': 'BTC/USDT', 'last': 2}
+    assert (await exchange.watch_multiple(URL, MESSAGE_HASHES))['symbol'] == 'ETH/USDT'
+    # the calls over the same hashes in another order share the multiplexer
+    reordered = exchange.watch_multiple(URL, list(reversed(MESSAGE_HASHES)))
+    assert reordered is exchange.watch_multiple(URL, MESSAGE_HASHES) and len(client.multiplexers) == 1
+    client.resolve({'symbol': 'ETH/USDT'}, 'ticker:ETH/USDT')
+    assert (await reordered)['symbol'] == 'ETH/USDT'
+    # a plain watch() of one of the hashes is resolved alongside
+    watched = exchange.watch(URL, 'ticker:BTC/USDT')
+    multiplexed = exchange.watch_multiple(URL, MESSAGE_HASHES)
+    client.resolve({'symbol': 'BTC/USDT'}, 'ticker:BTC/USDT')
+    assert (await watched) is (await multiplexed)
+
+
+async def test_ws_multiplex_errors(exchange, client):
+    future = exchange.watch_multiple(URL, MESSAGE_HASHES)
+    client.reject(NetworkError('subscription rejected'), 'ticker:LTC/USDT')
+    try:
+        await future
+        assert False, 'the rejection must reach the caller'
+    except NetworkError:
+        pass
+    # the failed multiplexer leaves its hashes and the client, the next call attaches a new one
+    assert client.streams == {} and client.rejections == {} and client.multiplexers == {}
+    future = exchange.watch_multiple(URL, MESSAGE_HASHES)
+    assert len(client.streams) == 3
+    # the unsubscription of the hashes rejects the call waiting on them
+    exchange.clean_unsubscription(client, 'ticker:', 'unsubscribe:tickers', True)
+    try:
+        await future
+        assert False, 'the unsubscription must reach the caller'
+    except UnsubscribeError:
+        pass
+    assert client.streams == {} and client.rejections == {} and client.multiplexers == {}
+    # an error that comes while no call waits goes to the next call, which leaves the multiplexer behind
+    exchange.watch_multiple(URL, MESSAGE_HASHES).cancel()
+    exchange.clean_unsubscription(client, 'ticker:', 'unsubscribe:tickers', True)
+    assert client.streams == {} and len(client.multiplexers) == 1
+    try:
+        await exchange.watch_multiple(URL, MESSAGE_HASHES)
+        assert False, 'the unsubscription must reach the next call'
+    except UnsubscribeError:
+        pass
+    assert client.streams == {} and client.rejections == {} and client.multiplexers == {}
+
+
+async def test_ws_multiplex_native():
+    exchange = MultiplexingExchange()
+    try:
+        client = exchange.client(URL)
+        client.connected.resolve(URL)  # skips connecting, there is no subscription message to send
+        await test_ws_multiplex_updates(exchange, client)
+        await test_ws_multiplex_errors(exchange, client)
+    finally:
+        await exchange.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_ws_multiplex_native())
+    print('test_ws_multiplex_native passed')
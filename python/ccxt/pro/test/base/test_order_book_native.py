@@ -0,0 +1,242 @@
+import os
+import sys
+import copy
+import pickle
+import random
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+import ccxt.async_support as ccxt  # noqa: F402
+from ccxt.async_support.base.ws import order_book_side  # noqa: F402
+from ccxt.async_support.base.ws.order_book import OrderBook, OrderBookSnapshot, ChunkedOrderBook, ChunkedCountedOrderBook, ChunkedIndexedOrderBook  # noqa: F402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - the chunked order book
+# sides and the bulk store_many() path exist only in the python port, so the
+# generated test_order_book.py never exercises them. Every chunked side is
+# replayed against its list-backed counterpart with a tiny chunk size, so that
+# chunk splits, chunk removals and cross-chunk reads happen within a few
+# hundred deltas.
+# ----------------------------------------------------------------------------
+
+
+class TinyAsks(order_book_side.ChunkedAsks): _load = 2                      # noqa
+class TinyBids(order_book_side.ChunkedBids): _load = 2                      # noqa
+class TinyCountedAsks(order_book_side.ChunkedCountedAsks): _load = 2        # noqa
+class TinyCountedBids(order_book_side.ChunkedCountedBids): _load = 2        # noqa
+class TinyIndexedAsks(order_book_side.ChunkedIndexedAsks): _load = 2        # noqa
+class TinyIndexedBids(order_book_side.ChunkedIndexedBids): _load = 2        # noqa
+
+
+def replay(reference, chunked, deltas):
+    for delta in deltas:
+        reference.storeArray(list(delta))
+        chunked.storeArray(list(delta))
+        assert len(chunked) == len(reference)
+    assert chunked == list(reference)
+    assert list(chunked) == list(reference)
+    assert list(reversed(chunked)) == list(reversed(reference))
+    for i in range(-len(reference), len(reference)):
+        assert chunked[i] == reference[i]
+    assert chunked[:5] == reference[:5]
+    assert chunked[1:7:2] == reference[1:7:2]
+    assert chunked[-3:] == reference[-3:]
+
+
+def test_chunked_side_matches_the_list_side():
+    rng = random.Random(42)
+    prices = [round(100 + i * 0.5, 1) for i in range(60)]
+    for reference_class, chunked_class in [(order_book_side.Asks, TinyAsks), (order_book_side.Bids, TinyBids)]:
+        deltas = [[rng.choice(prices), rng.choice([0, 0, 1, 2.5, 3])] for _ in range(1000)]
+        replay(reference_class(), chunked_class(), deltas)
+    for reference_class, chunked_class in [(order_book_side.CountedAsks, TinyCountedAsks), (order_book_side.CountedBids, TinyCountedBids)]:
+        deltas = [[rng.choice(prices), rng.choice([0, 1, 2.5]), rng.choice([0, 1, 4])] for _ in range(1000)]
+        replay(reference_class(), chunked_class(), deltas)
+    for reference_class, chunked_class in [(order_book_side.IndexedAsks, TinyIndexedAsks), (order_book_side.IndexedBids, TinyIndexedBids)]:
+        # a handful of ids moving between a handful of prices, including updates without a price
+        deltas = []
+        resting = set()
+        for _ in range(1000):
+            order_id = 'id' + str(rng.randint(0, 20))
+            size = rng.choice([0, 1, 2.5])
+            price = rng.choice(prices[:8] + [None]) if order_id in resting else rng.choice(prices[:8])
+            if size:
+                resting.add(order_id)
+            else:
+                resting.discard(order_id)
+            deltas.append([price, size, order_id])
+        replay(reference_class(), chunked_class(), deltas)
+
+
+def test_chunked_side_limit_and_clear():
+    asks = TinyAsks([[float(price), 1] for price in range(20, 0, -1)], 5)
+    assert len(asks) == 20
+    asks.limit()
+    assert asks == [[1.0, 1], [2.0, 1], [3.0, 1], [4.0, 1], [5.0, 1]]
+    bids = TinyIndexedBids([[float(price), 1, 'id' + str(price)] for price in range(10)], 3)
+    bids.limit()
+    assert [delta[2] for delta in bids] == ['id9', 'id8', 'id7']
+    # ids trimmed by limit() are forgotten, a later delete for them is a no-op
+    assert sorted(bids._hashmap.keys()) == ['id7', 'id8', 'id9']
+    bids.store(1.0, 0, 'id1')
+    assert len(bids) == 3
+    bids.clear()
+    assert len(bids) == 0
+    assert bids == []
+    assert bids._hashmap == {}
+    bids.store(4.0, 2, 'id4')
+    assert bids == [[4.0, 2, 'id4']]
+    try:
+        bids[1]
+        assert False, 'out of range access must raise'
+    except IndexError:
+        pass
+
+
+def test_chunked_order_book():
+    snapshot = {
+        'bids': [[10, 10], [9.1, 11], [8.2, 12], [7.3, 13], [6.4, 14]],
+        'asks': [[16.6, 10], [15.5, 11], [14.4, 12], [13.3, 13], [12.2, 14], [11.1, 13]],
+        'timestamp': 1574827239000,
+        'nonce': 69,
+        'symbol': None,
+    }
+    reference = OrderBook(snapshot, 4)
+    chunked = ChunkedOrderBook(snapshot, 4)
+    assert isinstance(chunked['asks'], order_book_side.ChunkedAsks)
+    assert chunked['asks'] == list(reference['asks'])
+    assert chunked['bids'] == list(reference['bids'])
+    reference.limit()
+    chunked.limit()
+    assert chunked['asks'] == list(reference['asks'])
+    assert chunked['bids'] == list(reference['bids'])
+    copy = chunked.copy()
+    chunked['bids'].store(9.5, 3)
+    assert len(copy['bids']) == 4
+    assert isinstance(copy, ChunkedOrderBook)
+    chunked.reset({'bids': [[1, 1]], 'asks': [[2, 2]], 'nonce': 70})
+    assert chunked['bids'] == [[1, 1]]
+    assert chunked['asks'] == [[2, 2]]
+    assert chunked['nonce'] == 70
+    counted = ChunkedCountedOrderBook({'bids': [[1, 1, 1]], 'asks': [[2, 2, 2]]})
+    counted['bids'].store(1, 5, 0)
+    assert counted['bids'] == []
+    indexed = ChunkedIndexedOrderBook({'bids': [[1, 1, 'a']], 'asks': [[2, 2, 'b']]})
+    indexed['asks'].store(None, 3, 'b')
+    assert indexed['asks'] == [[2, 3, 'b']]
+
+
+def test_store_many_matches_store_array():
+    rng = random.Random(7)
+    prices = [round(100 + i * 0.5, 1) for i in range(400)]
+    side_classes = [
+        (order_book_side.Asks, order_book_side.Asks),
+        (order_book_side.Bids, order_book_side.Bids),
+        (order_book_side.Asks, TinyAsks),
+        (order_book_side.Bids, TinyBids),
+    ]
+    for reference_class, bulk_class in side_classes:
+        reference = reference_class()
+        bulk = bulk_class()
+        # messages from a single level up to snapshot size, with repeated prices
+        # inside one message, where the last level at a price has to win
+        for size in [1, 3, 8, 50, 400, 20, 1000]:
+            message_prices = [rng.choice(prices) for _ in range(size)]
+            message_sizes = [rng.choice([0, 0, 1, 2.5]) for _ in range(size)]
+            for i in range(size):
+                reference.storeArray([message_prices[i], message_sizes[i]])
+            bulk.store_many(message_prices, message_sizes)
+            assert bulk == list(reference)
+            if isinstance(bulk, list):
+                # the merge has to keep the parallel index in step
+                assert bulk._index == reference._index
+    counted = order_book_side.CountedBids()
+    counted.store_many([1.0, 2.0, 1.0], [1, 1, 3], [1, 1, 0])
+    assert counted == [[2.0, 1, 1]]
+    indexed = order_book_side.IndexedAsks()
+    indexed.store_many([1.0, 2.0, 1.5], [1, 1, 3], ['a', 'b', 'a'])
+    assert indexed == [[1.5, 3, 'a'], [2.0, 1, 'b']]
+
+
+def test_handle_deltas_bulk():
+    exchange = ccxt.Exchange({
+        'id': 'sampleexchange',
+    })
+    orderbook = exchange.order_book({}, 10)
+    exchange.handle_deltas_bulk(orderbook['bids'], [['10.5', '1'], ['10.7', '2'], ['9.9', '0'], ['10.6', '3'], ['10.4', '4'], ['10.3', '5'], ['10.2', '6'], ['10.1', '7'], ['10.7', '0']])
+    assert orderbook['bids'] == [[10.6, 3.0], [10.5, 1.0], [10.4, 4.0], [10.3, 5.0], [10.2, 6.0], [10.1, 7.0]]
+    exchange.handle_deltas_bulk(orderbook['asks'], [{'p': '11', 'q': '1'}, {'p': '12', 'q': '2'}], 'p', 'q')
+    assert orderbook['asks'] == [[11.0, 1.0], [12.0, 2.0]]
+    counted = exchange.counted_order_book()
+    exchange.handle_deltas_bulk(counted['asks'], [['11', '1', '3'], ['12', '2', '0']], 0, 1, 2)
+    assert counted['asks'] == [[11.0, 1.0, 3]]
+    indexed = exchange.indexed_order_book()
+    exchange.handle_deltas_bulk(indexed['asks'], [['1', '2', 'ord-a'], ['1.5', '3', 'ord-b']], 0, 1, 2)
+    assert indexed['asks'] == [[1.0, 2.0, 'ord-a'], [1.5, 3.0, 'ord-b']]
+
+
+def test_order_book_snapshot():
+    for book_class in (OrderBook, ChunkedOrderBook):
+        orderbook = book_class({
+            'bids': [[10, 10], [9.1, 11], [8.2, 12], [7.3, 13], [6.4, 14]],
+            'asks': [[11.1, 13], [12.2, 14], [13.3, 13]],
+            'timestamp': 1574827239000,
+            'nonce': 69,
+            'symbol': 'BTC/USDT',
+        })
+        top = orderbook.snapshot(2)
+        assert isinstance(top, OrderBookSnapshot)
+        assert top['bids'] == ((10, 10), (9.1, 11))
+        assert top['asks'] == ((11.1, 13), (12.2, 14))
+        assert top['nonce'] == 69
+        assert top['symbol'] == 'BTC/USDT'
+        assert top['datetime'] == orderbook['datetime']
+        full = orderbook.snapshot()
+        assert len(full['bids']) == 5
+        assert len(full['asks']) == 3
+        # later deltas, including in-place size updates of a shared level, do not leak in
+        orderbook['bids'].store(10, 1)
+        orderbook['bids'].store(10.5, 3)
+        orderbook['asks'].store(11.1, 0)
+        orderbook['nonce'] = 70
+        assert top['bids'] == ((10, 10), (9.1, 11))
+        assert top['asks'] == ((11.1, 13), (12.2, 14))
+        assert top['nonce'] == 69
+        assert full['bids'][0] == (10, 10)
+        assert orderbook.snapshot(1)['bids'] == ((10.5, 3),)
+        try:
+            top['nonce'] = 71
+            assert False, 'snapshots must be read-only'
+        except TypeError:
+            pass
+        try:
+            top.update({'nonce': 71})
+            assert False, 'snapshots must be read-only'
+        except TypeError:
+            pass
+        try:
+            top |= {'nonce': 71}
+            assert False, 'snapshots must be read-only'
+        except TypeError:
+            pass
+        assert top['nonce'] == 69
+        # a read-only snapshot is its own copy, it pickles as a snapshot
+        assert copy.copy(top) is top and copy.deepcopy(top) is top
+        restored = pickle.loads(pickle.dumps(top))
+        assert isinstance(restored, OrderBookSnapshot)
+        assert restored == top and restored.depth == 2
+
+
+def test_ws_order_book_native():
+    test_chunked_side_matches_the_list_side()
+    test_chunked_side_limit_and_clear()
+    test_chunked_order_book()
+    test_store_many_matches_store_array()
+    test_handle_deltas_bulk()
+    test_order_book_snapshot()
+
+
+if __name__ == '__main__':
+    test_ws_order_book_native()
+    print('test_order_book_native passed')
@@ -0,0 +1,111 @@
+import os
+import sys
+import asyncio
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.base.errors import BadRequest  # noqa: F402
+from ccxt.async_support.base.exchange import Exchange  # noqa: F402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - with a limit of subscriptions
+# per connection declared in streaming, the subscriptions to a url are spread
+# over several clients. The clients are never connected.
+# ----------------------------------------------------------------------------
+
+URL = 'wss://localhost/ws'
+
+
+class ShardingExchange(Exchange):
+    def describe(self):
+        return self.deep_extend(super(ShardingExchange, self).describe(), {
+            'id': 'shardtest',
+            'streaming': {
+                'maxSubscriptionsPerConnection': 2,
+                'maxConnections': 3,
+            },
+        })
+
+    def client(self, url, key=None):
+        client = super(ShardingExchange, self).client(url, key)
+        if not client.connected.done():
+            client.connected.resolve(url)  # skips connecting, there is no subscription message to send
+        return client
+
+
+def subscribed(exchange):
+    return {key: sorted(client.subscriptions) for key, client in exchange.clients.items()}
+
+
+async def test_ws_shard_subscriptions(exchange):
+    exchange.watch_multiple(URL, ['a', 'b'], None, ['a', 'b'])
+    exchange.watch(URL, 'c', None, 'c')
+    exchange.watch(URL, 'd', None, 'd')
+    exchange.watch(URL, 'e', None, 'e')
+    assert subscribed(exchange) == {URL: ['a', 'b'], URL + '#1': ['c', 'd'], URL + '#2': ['e']}
+    assert all(client.url == URL for client in exchange.clients.values())
+    # a subscription made already stays on its connection
+    future = exchange.watch(URL, 'c', None, 'c')
+    exchange.clients[URL + '#1'].resolve(1, 'c')
+    assert await future == 1
+    # an unsubscription goes to the connection of what it unsubscribes
+    exchange.watch(URL, 'unsubscribe:c', None, 'unsubscribe:c', {'unsubscribe': True, 'subMessageHashes': ['c']})
+    assert 'unsubscribe:c' in exchange.clients[URL + '#1'].subscriptions
+    exchange.watch(URL, 'f', None, 'f')
+    assert subscribed(exchange)[URL + '#2'] == ['e', 'f']
+    # all of the connections are full
+    for subscribe_hashes in (['g'], ['g', 'h', 'i']):
+        try:
+            exchange.watch_multiple(URL, subscribe_hashes, None, subscribe_hashes)
+            assert False, 'the limits must be enforced'
+        except BadRequest:
+            pass
+    # a connection that is lost is opened again, the subscriptions it held go back to it as they are made anew
+    lost = exchange.clients[URL + '#1']
+    exchange.on_close(lost, 1006)
+    assert URL + '#1' not in exchange.clients and URL in exchange.clients
+    exchange.watch(URL, 'c', None, 'c')
+    assert subscribed(exchange)[URL + '#1'] == ['c']
+    assert exchange.clients[URL + '#1'] is not lost
+    exchange.watch(URL, 'd', None, 'd')
+    assert subscribed(exchange) == {URL: ['a', 'b'], URL + '#1': ['c', 'd'], URL + '#2': ['e', 'f']}
+
+
+async def test_ws_shard_login():
+    # the login is made on the first connection, the private subscriptions that follow go there too
+    exchange = ShardingExchange({'streaming': {'maxSubscriptionsPerConnection': 1}})
+    try:
+        client = exchange.client(URL)
+        future = client.future('authenticated')
+        exchange.watch(URL, 'authenticated', {'op': 'login'}, 'authenticated')
+        client.resolve(True, 'authenticated')
+        assert await future
+        exchange.watch(URL, 'orders', None, 'orders')
+        exchange.watch(URL, 'balance', None, 'balance')
+        assert subscribed(exchange) == {URL: ['authenticated', 'balance', 'orders']}
+    finally:
+        await exchange.close()
+
+
+async def test_ws_shard_native():
+    exchange = ShardingExchange()
+    try:
+        await test_ws_shard_subscriptions(exchange)
+    finally:
+        await exchange.close()
+    await test_ws_shard_login()
+    # without a limit every subscription goes to the one client of the url
+    exchange = Exchange({'id': 'shardtest'})
+    try:
+        exchange.client(URL).connected.resolve(URL)
+        for message_hash in 'abcde':
+            exchange.watch(URL, message_hash, None, message_hash)
+        assert list(exchange.clients) == [URL] and len(exchange.clients[URL].subscriptions) == 5
+    finally:
+        await exchange.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_ws_shard_native())
+    print('test_ws_shard_native passed')
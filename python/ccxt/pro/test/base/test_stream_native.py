@@ -0,0 +1,186 @@
+import os
+import sys
+import asyncio
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.base.errors import NetworkError  # noqa: F402
+from ccxt.async_support.base.exchange import Exchange  # noqa: F402
+from ccxt.async_support.base.ws.cache import ArrayCache  # noqa: F402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - the stream_* generators call
+# the watch_* methods for every update of their subscription, with the updates
+# in between conflated or queued. The client is never connected, the updates
+# are resolved on it directly.
+# ----------------------------------------------------------------------------
+
+URL = 'wss://localhost/ws'
+PRIVATE_URL = 'wss://localhost/private'
+
+
+class StreamingExchange(Exchange):
+    def describe(self):
+        return self.deep_extend(super(StreamingExchange, self).describe(), {'id': 'streamtest'})
+
+    async def watch_ticker(self, symbol, params={}):
+        ticker = await self.watch(URL, 'ticker:' + symbol, None, 'ticker:' + symbol)
+        return self.extend(ticker, {'symbol': symbol})
+
+    async def watch_tickers(self, symbols=None, params={}):
+        message_hashes = ['ticker:' + symbol for symbol in symbols]
+        ticker = await self.watch_multiple(URL, message_hashes, None, message_hashes)
+        return {ticker['symbol']: ticker}
+
+    async def watch_trades(self, symbol, since=None, limit=None, params={}):
+        trades = await self.watch(URL, 'trades:' + symbol, None, 'trades:' + symbol)
+        if self.newUpdates:
+            limit = trades.getLimit(symbol, limit)
+        return self.filter_by_since_limit(trades, since, limit, 'timestamp', True)
+
+    async def authenticate(self):
+        # the login is sent once per connection, its result is awaited on a client future
+        client = self.client(PRIVATE_URL)
+        if 'authenticated' in client.subscriptions:
+            return True
+        future = client.future('authenticated')
+        self.watch(PRIVATE_URL, 'authenticated', None, 'authenticated')
+        return await future
+
+    async def login(self):
+        # the login is sent once per connection, the future of its watch is awaited
+        client = self.client(PRIVATE_URL)
+        future = self.safe_value(client.subscriptions, 'login')
+        if future is None:
+            future = client.subscriptions['login'] = self.watch(PRIVATE_URL, 'login', None, 'login')
+        return await future
+
+    async def watch_orders(self, symbol=None, since=None, limit=None, params={}):
+        await self.authenticate()
+        return await self.watch(PRIVATE_URL, 'orders', None, 'orders')
+
+    async def watch_balance(self, params={}):
+        await self.login()
+        return await self.watch(PRIVATE_URL, 'balance', None, 'balance')
+
+
+async def next_of(generator):
+    # the consumer waits on the stream, the updates are resolved after it has caught up
+    pending = asyncio.ensure_future(generator.__anext__())
+    await asyncio.sleep(0)
+    return pending
+
+
+async def test_ws_stream_conflated(exchange, client):
+    stream = exchange.stream_ticker('BTC/USDT')
+    pending = await next_of(stream)
+    client.resolve({'last': 1}, 'ticker:BTC/USDT')
+    assert await pending == {'last': 1, 'symbol': 'BTC/USDT'}
+    # the consumer is busy while three updates arrive, it gets the latest only
+    for last in (2, 3, 4):
+        client.resolve({'last': last}, 'ticker:BTC/USDT')
+    assert await stream.__anext__() == {'last': 4, 'symbol': 'BTC/USDT'}
+    # no client future is created for the updates of a stream
+    assert client.futures == {}
+    # a watch_* call next to the stream still gets the updates
+    watched = asyncio.ensure_future(exchange.watch_ticker('BTC/USDT'))
+    pending = await next_of(stream)
+    client.resolve({'last': 5}, 'ticker:BTC/USDT')
+    assert (await watched)['last'] == 5 and (await pending)['last'] == 5
+    await stream.aclose()
+    assert client.streams == {}
+
+
+async def test_ws_stream_queued(exchange, client):
+    for overflow, expected in (('dropOldest', [3, 4, 5]), ('dropNewest', [1, 2, 3])):
+        stream = exchange.stream_ticker('ETH/USDT', mode='queued', maxsize=3, overflow=overflow)
+        pending = await next_of(stream)
+        client.resolve({'last': 0}, 'ticker:ETH/USDT')
+        assert (await pending)['last'] == 0
+        for last in range(1, 6):
+            client.resolve({'last': last}, 'ticker:ETH/USDT')
+        assert [(await stream.__anext__())['last'] for _ in range(3)] == expected
+        await stream.aclose()
+    # several message hashes feed one stream
+    stream = exchange.stream_tickers(['BTC/USDT', 'ETH/USDT'], mode='queued')
+    pending = await next_of(stream)
+    client.resolve({'symbol': 'BTC/USDT'}, 'ticker:BTC/USDT')
+    client.resolve({'symbol': 'ETH/USDT'}, 'ticker:ETH/USDT')
+    assert list(await pending) == ['BTC/USDT'] and list(await stream.__anext__()) == ['ETH/USDT']
+    await stream.aclose()
+    # a cache resolved several times yields its new entries once
+    trades = ArrayCache(100)
+    stream = exchange.stream_trades('BTC/USDT', mode='queued')
+    pending = await next_of(stream)
+    for i in range(3):
+        trades.append({'id': str(i), 'symbol': 'BTC/USDT', 'timestamp': i})
+        client.resolve(trades, 'trades:BTC/USDT')
+    # the cache is filled in place, the consumer wakes up to all of its new entries
+    assert [trade['id'] for trade in await pending] == ['0', '1', '2']
+    pending = await next_of(stream)
+    await asyncio.sleep(0)
+    assert not pending.done()  # the two queued repetitions of the cache had nothing new
+    trades.append({'id': '3', 'symbol': 'BTC/USDT', 'timestamp': 3})
+    client.resolve(trades, 'trades:BTC/USDT')
+    assert [trade['id'] for trade in await pending] == ['3']
+    await stream.aclose()
+
+
+async def test_ws_stream_errors(exchange, client):
+    stream = exchange.stream_ticker('BTC/USDT')
+    pending = await next_of(stream)
+    client.reject(NetworkError('connection lost'))
+    try:
+        await pending
+        assert False, 'the rejection must reach the consumer'
+    except NetworkError:
+        pass
+    assert client.streams == {}  # a generator that raised is closed
+    # a client that is closed cancels the consumers that wait
+    stream = exchange.stream_ticker('BTC/USDT')
+    pending = await next_of(stream)
+    await client.close()
+    await asyncio.sleep(0)
+    assert pending.cancelled()
+
+
+async def test_ws_stream_private(exchange, client):
+    # the stream follows the hashes of the data, not those of the login watched on the way
+    for generator, login, data in ((exchange.stream_orders(), 'authenticated', 'orders'), (exchange.stream_balance(), 'login', 'balance')):
+        pending = await next_of(generator)
+        client.resolve(True, login)
+        while data not in client.streams:
+            await asyncio.sleep(0)  # the data is watched once the login is through
+        assert not pending.done()
+        client.resolve([data], data)
+        assert await pending == [data]
+        assert list(client.streams) == [data]
+        # a login made again later does not reach the consumer
+        client.resolve(['login', True], login)
+        pending = await next_of(generator)
+        assert not pending.done()
+        client.resolve([data, 2], data)
+        assert await pending == [data, 2]
+        await generator.aclose()
+    assert client.streams == {}
+
+
+async def test_ws_stream_native():
+    exchange = StreamingExchange()
+    try:
+        client = exchange.client(URL)
+        client.connected.resolve(URL)  # skips connecting, there is no subscription message to send
+        await test_ws_stream_conflated(exchange, client)
+        await test_ws_stream_queued(exchange, client)
+        await test_ws_stream_errors(exchange, client)
+        client = exchange.client(PRIVATE_URL)
+        client.connected.resolve(PRIVATE_URL)
+        await test_ws_stream_private(exchange, client)
+    finally:
+        await exchange.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_ws_stream_native())
+    print('test_ws_stream_native passed')
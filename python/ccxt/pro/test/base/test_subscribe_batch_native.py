@@ -0,0 +1,107 @@
+import os
+import sys
+import json
+import asyncio
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.async_support.base.exchange import Exchange  # noqa: F402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - the subscribe messages of an
+# exchange that declares subscribeBatch in streaming are merged into one message
+# per batch. The connection only records the messages sent on it.
+# ----------------------------------------------------------------------------
+
+URL = 'wss://localhost/ws'
+
+
+class RecordingConnection:
+    closed = False
+    failing = False
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_str(self, message):
+        if self.failing:
+            raise ConnectionError('connection lost')
+        self.sent.append(json.loads(message))
+
+    async def close(self):
+        self.closed = True
+
+
+class BatchingExchange(Exchange):
+    def describe(self):
+        return self.deep_extend(super(BatchingExchange, self).describe(), {
+            'id': 'batchtest',
+            'rateLimit': 1,  # every message is throttled, without waiting long
+            'streaming': {
+                'subscribeBatch': {
+                    'field': 'args',
+                    'match': {'op': 'subscribe'},
+                    'ignore': ['req_id'],
+                    'maxItems': 3,
+                    'delay': 10,
+                },
+            },
+        })
+
+
+async def test_ws_subscribe_batch(exchange, client):
+    for i in range(5):
+        topic = 'tickers.' + str(i)
+        exchange.watch(URL, topic, {'op': 'subscribe', 'req_id': str(i), 'args': [topic]}, topic)
+    topics = ['trades.0', 'trades.1']
+    exchange.watch_multiple(URL, topics, {'op': 'subscribe', 'req_id': '5', 'args': topics}, topics)
+    # the messages that are not subscriptions are sent on their own right away, ahead of the batches
+    exchange.watch(URL, 'auth', {'op': 'auth', 'args': ['key', 'signature']}, 'auth')
+    await asyncio.sleep(0.05)
+    assert client.connection.sent[0] == {'op': 'auth', 'args': ['key', 'signature']}
+    assert client.connection.sent[1:] == [
+        {'op': 'subscribe', 'req_id': '0', 'args': ['tickers.0', 'tickers.1', 'tickers.2']},
+        {'op': 'subscribe', 'req_id': '3', 'args': ['tickers.3', 'tickers.4']},
+        {'op': 'subscribe', 'req_id': '5', 'args': ['trades.0', 'trades.1']},
+    ]
+    assert client.batches == {}
+    # the messages that differ in more than the ignored keys are not merged
+    client.connection.sent = []
+    exchange.watch(URL, 'spot', {'op': 'subscribe', 'category': 'spot', 'args': ['spot']}, 'spot')
+    exchange.watch(URL, 'linear', {'op': 'subscribe', 'category': 'linear', 'args': ['linear']}, 'linear')
+    await asyncio.sleep(0.05)
+    assert sorted(message['category'] for message in client.connection.sent) == ['linear', 'spot']
+    # the messages that build their keys in another order are merged, the merged calls return once the batch is sent
+    client.connection.sent = []
+    first = asyncio.ensure_future(client.send_subscription({'op': 'subscribe', 'category': 'spot', 'args': ['a']}))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(client.send_subscription({'args': ['b'], 'category': 'spot', 'op': 'subscribe'}))
+    await asyncio.sleep(0)
+    assert not second.done()
+    await asyncio.gather(first, second)
+    assert client.connection.sent == [{'op': 'subscribe', 'category': 'spot', 'args': ['a', 'b']}]
+    # an error of the send reaches the merged calls too
+    client.connection.failing = True
+    first = asyncio.ensure_future(client.send_subscription({'op': 'subscribe', 'args': ['a']}))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(client.send_subscription({'op': 'subscribe', 'args': ['b']}))
+    results = await asyncio.gather(first, second, return_exceptions=True)
+    assert all(isinstance(result, ConnectionError) for result in results)
+    client.connection.failing = False
+
+
+async def test_ws_subscribe_batch_native():
+    exchange = BatchingExchange()
+    try:
+        client = exchange.client(URL)
+        client.connection = RecordingConnection()
+        client.connected.resolve(URL)  # skips connecting
+        await test_ws_subscribe_batch(exchange, client)
+    finally:
+        await exchange.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_ws_subscribe_batch_native())
+    print('test_ws_subscribe_batch_native passed')
@@ -0,0 +1,159 @@
+import os
+import sys
+import asyncio
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.base.errors import NetworkError  # noqa: F402
+from ccxt.async_support.base.exchange import Exchange  # noqa: F402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - the on_* subscriptions call
+# their callback from Client.resolve() with every update. The client is never
+# connected, the updates are resolved on it directly.
+# ----------------------------------------------------------------------------
+
+URL = 'wss://localhost/ws'
+PRIVATE_URL = 'wss://localhost/private'
+
+
+class SubscribingExchange(Exchange):
+    def describe(self):
+        return self.deep_extend(super(SubscribingExchange, self).describe(), {'id': 'subscriptiontest'})
+
+    async def watch_ticker(self, symbol, params={}):
+        ticker = await self.watch(URL, 'ticker:' + symbol, None, 'ticker:' + symbol)
+        return self.extend(ticker, {'symbol': symbol})
+
+    async def watch_tickers(self, symbols=None, params={}):
+        message_hashes = ['ticker:' + symbol for symbol in symbols]
+        ticker = await self.watch_multiple(URL, message_hashes, None, message_hashes)
+        return {ticker['symbol']: ticker}
+
+    async def authenticate(self):
+        # the login is sent once per connection, its result is awaited on a client future
+        client = self.client(PRIVATE_URL)
+        if 'authenticated' in client.subscriptions:
+            return True
+        future = client.future('authenticated')
+        self.watch(PRIVATE_URL, 'authenticated', None, 'authenticated')
+        return await future
+
+    async def login(self):
+        # the login is sent once per connection, the future of its watch is awaited
+        client = self.client(PRIVATE_URL)
+        future = self.safe_value(client.subscriptions, 'login')
+        if future is None:
+            future = client.subscriptions['login'] = self.watch(PRIVATE_URL, 'login', None, 'login')
+        return await future
+
+    async def watch_orders(self, symbol=None, since=None, limit=None, params={}):
+        await self.authenticate()
+        return await self.watch(PRIVATE_URL, 'orders', None, 'orders')
+
+    async def watch_balance(self, params={}):
+        await self.login()
+        return await self.watch(PRIVATE_URL, 'balance', None, 'balance')
+
+
+async def subscribe(exchange, client, symbol, callback, **options):
+    # the subscription is made once the first update has come
+    pending = asyncio.ensure_future(exchange.on_ticker(symbol, callback, **options))
+    await asyncio.sleep(0)
+    client.resolve({'last': 0}, 'ticker:' + symbol)
+    return await pending
+
+
+async def test_ws_subscription_callbacks(exchange, client):
+    updates = []
+    subscription = await subscribe(exchange, client, 'BTC/USDT', lambda ticker: updates.append(ticker['last']))
+    for last in (1, 2, 3):
+        client.resolve({'last': last}, 'ticker:BTC/USDT')
+    # every update is handed over in the same call that resolves it, no future is created for them
+    assert updates == [0, 1, 2, 3]
+    assert client.futures == {}
+    assert subscription.stats()['count'] == 4
+    # a callback that raises does not affect the others nor the message handler
+    def failing(ticker):
+        raise ValueError('callback error')
+    failing_subscription = await subscribe(exchange, client, 'BTC/USDT', failing)
+    client.resolve({'last': 4}, 'ticker:BTC/USDT')
+    assert updates[-1] == 4
+    stats = failing_subscription.stats()
+    assert stats['exceptions'] == 2 and isinstance(stats['lastException'], ValueError)
+    failing_subscription.close()
+    subscription.close()
+    client.resolve({'last': 5}, 'ticker:BTC/USDT')
+    assert updates[-1] == 4
+    assert client.streams == {}
+    # several message hashes feed one subscription
+    symbols = []
+    pending = asyncio.ensure_future(exchange.on_tickers(['BTC/USDT', 'ETH/USDT'], lambda ticker: symbols.append(ticker['symbol'])))
+    await asyncio.sleep(0)
+    client.resolve({'symbol': 'ETH/USDT'}, 'ticker:ETH/USDT')
+    subscription = await pending
+    client.resolve({'symbol': 'BTC/USDT'}, 'ticker:BTC/USDT')
+    assert symbols == ['ETH/USDT', 'BTC/USDT']
+    # a callback may close its own subscription
+    subscription.callback = lambda ticker: subscription.close()
+    client.resolve({'symbol': 'BTC/USDT'}, 'ticker:BTC/USDT')
+    assert client.streams == {}
+
+
+async def test_ws_subscription_errors(exchange, client):
+    errors = []
+    subscription = await subscribe(exchange, client, 'BTC/USDT', lambda ticker: None, on_error=errors.append)
+    client.reject(NetworkError('connection lost'))
+    assert len(errors) == 1 and isinstance(errors[0], NetworkError)
+    assert isinstance(subscription.error, NetworkError)
+    assert client.streams == {}
+    # a rejection before the first update fails the on_* call
+    pending = asyncio.ensure_future(exchange.on_ticker('BTC/USDT', lambda ticker: None))
+    await asyncio.sleep(0)
+    client.reject(NetworkError('subscription rejected'), 'ticker:BTC/USDT')
+    try:
+        await pending
+        assert False, 'the rejection must reach the caller'
+    except NetworkError:
+        pass
+    assert client.streams == {}
+
+
+async def test_ws_subscription_private(exchange, client):
+    # the callback gets the updates of the data, not the result of the login watched on the way
+    for subscribing, login, data in ((exchange.on_orders, 'authenticated', 'orders'), (exchange.on_balance, 'login', 'balance')):
+        updates = []
+        pending = asyncio.ensure_future(subscribing(updates.append))
+        await asyncio.sleep(0)
+        client.resolve(True, login)
+        while data not in client.streams:
+            await asyncio.sleep(0)  # the data is watched once the login is through
+        client.resolve([data], data)
+        subscription = await pending
+        assert list(client.streams) == [data]
+        # a login made again later does not reach the callback
+        client.resolve(['login', True], login)
+        client.resolve([data, 2], data)
+        assert updates == [[data], [data, 2]]
+        subscription.close()
+    assert client.streams == {}
+
+
+async def test_ws_subscription_native():
+    exchange = SubscribingExchange()
+    try:
+        client = exchange.client(URL)
+        client.connected.resolve(URL)  # skips connecting, there is no subscription message to send
+        await test_ws_subscription_callbacks(exchange, client)
+        await test_ws_subscription_errors(exchange, client)
+        client = exchange.client(PRIVATE_URL)
+        client.connected.resolve(PRIVATE_URL)
+        await test_ws_subscription_private(exchange, client)
+    finally:
+        await exchange.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_ws_subscription_native())
+    print('test_ws_subscription_native passed')
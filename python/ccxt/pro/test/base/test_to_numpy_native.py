@@ -0,0 +1,92 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.base.errors import NotSupported  # noqa: F402
+from ccxt.async_support.base.ws.cache import ArrayCache, ArrayCacheByTimestamp, ArrayCacheBySymbolById, ArrayCacheBySymbolBySide  # noqa: F402
+from ccxt.async_support.base.ws.order_book import OrderBook, CountedOrderBook, IndexedOrderBook, ChunkedOrderBook, ChunkedIndexedOrderBook  # noqa: F402
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - to_numpy() exports exist
+# only in the python port. numpy is an optional dependency, so without it the
+# exports must fail with NotSupported instead of an ImportError.
+# ----------------------------------------------------------------------------
+
+
+def test_to_numpy_without_numpy():
+    try:
+        OrderBook({'bids': [[1, 1]]}).to_numpy()
+        assert False, 'to_numpy() must raise NotSupported without numpy'
+    except NotSupported:
+        pass
+
+
+def test_order_book_to_numpy():
+    snapshot = {
+        'bids': [[10, 10], [9.1, 11], [8.2, 12]],
+        'asks': [[11.1, 13], [12.2, 14]],
+    }
+    for book_class in (OrderBook, ChunkedOrderBook):
+        orderbook = book_class(snapshot)
+        arrays = orderbook.to_numpy()
+        assert arrays['bids'].dtype == numpy.float64
+        assert arrays['bids'].tolist() == [[10, 10], [9.1, 11], [8.2, 12]]
+        assert arrays['asks'].tolist() == [[11.1, 13], [12.2, 14]]
+        assert orderbook['bids'].to_numpy(2).tolist() == [[10, 10], [9.1, 11]]
+        empty = book_class({})
+        assert empty['asks'].to_numpy().shape == (0, 2)
+        # a plain side keeps whatever the levels carry past price and amount, only those two are exported
+        wide = book_class({'bids': [[10, 1, 5], [9, 2, 6]]})
+        assert wide['bids'].to_numpy().tolist() == [[10, 1], [9, 2]]
+    counted = CountedOrderBook({'bids': [[10, 1, 3]]})
+    assert counted['bids'].to_numpy().tolist() == [[10, 1, 3]]
+    for book_class in (IndexedOrderBook, ChunkedIndexedOrderBook):
+        # order ids are dropped, only price and amount are numeric
+        indexed = book_class({'asks': [[11, 1, 'a'], [12, 2, 'b']]})
+        assert indexed['asks'].to_numpy().tolist() == [[11, 1], [12, 2]]
+        assert indexed['asks'].to_numpy(1).tolist() == [[11, 1]]
+
+
+def test_cache_to_numpy():
+    ohlcv = ArrayCacheByTimestamp(2)
+    assert ohlcv.to_numpy().shape == (0, 6)
+    ohlcv.append([1000, 1, 2, 0.5, 1.5, 100])
+    ohlcv.append([2000, 1.5, 3, 1, 2, 50])
+    ohlcv.append([3000, 2, 2, 2, 2, 10])
+    assert ohlcv.to_numpy().tolist() == [[2000, 1.5, 3, 1, 2, 50], [3000, 2, 2, 2, 2, 10]]
+    trades = ArrayCache()
+    trades.append({'symbol': 'BTC/USDT', 'timestamp': 1, 'price': 10.5, 'amount': 2, 'cost': None})
+    trades.append({'symbol': 'BTC/USDT', 'timestamp': 2, 'price': 11, 'amount': 1, 'cost': 11})
+    assert trades.to_numpy().tolist() == [[1, 10.5, 2], [2, 11, 1]]
+    costs = trades.to_numpy(['cost'])
+    assert costs.shape == (2, 1)
+    assert numpy.isnan(costs[0][0])
+    assert costs[1][0] == 11
+    orders = ArrayCacheBySymbolById()
+    orders.append({'symbol': 'BTC/USDT', 'id': '1', 'timestamp': 1, 'price': 10, 'amount': 1})
+    orders.append({'symbol': 'BTC/USDT', 'id': '1', 'timestamp': 2, 'price': 11, 'amount': 1})
+    assert orders.to_numpy().tolist() == [[2, 11, 1]]
+    positions = ArrayCacheBySymbolBySide()
+    positions.append({'symbol': 'BTC/USDT', 'side': 'long', 'timestamp': 1, 'contracts': 3, 'entryPrice': 100})
+    assert positions.to_numpy().tolist() == [[1, 3, 100]]
+    assert ArrayCache().to_numpy().shape == (0, 3)
+
+
+def test_ws_to_numpy_native():
+    if numpy is None:
+        test_to_numpy_without_numpy()
+        return
+    test_order_book_to_numpy()
+    test_cache_to_numpy()
+
+
+if __name__ == '__main__':
+    test_ws_to_numpy_native()
+    print('test_to_numpy_native passed')
@@ -0,0 +1,89 @@
+import os
+import sys
+import gzip
+import zlib
+from collections import namedtuple
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from aiohttp import WSMsgType  # noqa: F402
+from ccxt.async_support.base.ws.client import Client, json_dumps  # noqa: F402
+from ccxt.async_support.base.ws.functions import gunzip, gunzip_bytes, inflate  # noqa: F402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - binary frames are decompressed
+# to bytes and handed to the json parser without decoding them to text first,
+# inflateStream keeps one decompressor for the whole connection.
+# ----------------------------------------------------------------------------
+
+Message = namedtuple('Message', ['type', 'data'])
+
+
+def decoding_client(config={}):
+    received = []
+    client = Client('wss://example.com', lambda client, message: received.append(message), None, None, None, config)
+    return client, received
+
+
+def deflate(data):
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def test_ws_decode_functions():
+    message = '{"ch":"market.btcusdt.detail","tick":{"close":63349.89,"symbol":"ß"}}'.encode('utf-8')
+    assert gunzip_bytes(gzip.compress(message)) == message
+    assert gunzip(gzip.compress(message)) == message.decode('utf-8')
+    # the members of a multi-member gzip stream are all read, as GzipFile reads them
+    assert gunzip_bytes(gzip.compress(message) + gzip.compress(b'[1]')) == message + b'[1]'
+    assert inflate(deflate(message)) == message
+
+
+def test_ws_decode_messages():
+    message = {'ch': 'market.btcusdt.detail', 'tick': {'close': 63349.89, 'symbol': 'ß'}}
+    encoded = '{"ch":"market.btcusdt.detail","tick":{"close":63349.89,"symbol":"ß"}}'.encode('utf-8')
+    client, received = decoding_client({'gunzip': True})
+    client.handle_message(Message(WSMsgType.BINARY, gzip.compress(encoded)))
+    client.handle_message(Message(WSMsgType.BINARY, gzip.compress(b'pong')))
+    client.handle_message(Message(WSMsgType.TEXT, encoded.decode('utf-8')))
+    # gunzipped messages are text even without decompressBinary, as they have always been
+    client.decompressBinary = False
+    client.handle_message(Message(WSMsgType.BINARY, gzip.compress(encoded)))
+    assert received == [message, 'pong', message, message]
+    client, received = decoding_client({'inflate': True})
+    client.handle_message(Message(WSMsgType.BINARY, deflate(encoded)))
+    assert received == [message]
+    # binary messages that are not decompressed reach the exchange as they are
+    client, received = decoding_client({'decompressBinary': False})
+    client.handle_message(Message(WSMsgType.BINARY, b'\x0a\x03abc'))
+    client.handle_message(Message(WSMsgType.BINARY, encoded))
+    assert received == [b'\x0a\x03abc', encoded]
+
+
+def test_ws_decode_inflate_stream():
+    # a sender with context takeover compresses every message against the previous ones,
+    # a message only inflates with the decompressor that inflated all the messages before it
+    messages = [{'ch': 'market.btcusdt.detail', 'ts': i, 'tick': {'close': 63349.89 + i}} for i in range(20)]
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+    frames = []
+    for i, message in enumerate(messages):
+        frame = compressor.compress(json_dumps(message).encode('utf-8')) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        # permessage-deflate strips the sync flush tail, other senders keep it
+        frames.append(frame[:-4] if i % 2 else frame)
+    client, received = decoding_client({'inflateStream': True})
+    client.inflater = zlib.decompressobj(-zlib.MAX_WBITS)  # as open() does for every connection
+    for frame in frames:
+        client.handle_message(Message(WSMsgType.BINARY, frame))
+    assert received == messages
+
+
+def test_ws_decode_native():
+    test_ws_decode_functions()
+    test_ws_decode_messages()
+    test_ws_decode_inflate_stream()
+
+
+if __name__ == '__main__':
+    test_ws_decode_native()
+    print('test_ws_decode_native passed')
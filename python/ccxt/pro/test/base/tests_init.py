@@ -7,6 +7,15 @@ sys.path.append(root)
 from ccxt.pro.test.base.test_order_book import test_ws_order_book  # noqa: F401
 from ccxt.pro.test.base.test_cache import test_ws_cache  # noqa: F401
 from ccxt.pro.test.base.test_cache_native import test_ws_cache_python_regressions  # noqa: F401  # hand-written python-only
+from ccxt.pro.test.base.test_order_book_native import test_ws_order_book_native  # noqa: F401  # hand-written python-only
+from ccxt.pro.test.base.test_to_numpy_native import test_ws_to_numpy_native  # noqa: F401  # hand-written python-only
+from ccxt.pro.test.base.test_ws_decode_native import test_ws_decode_native  # noqa: F401  # hand-written python-only
+from ccxt.pro.test.base.test_stream_native import test_ws_stream_native  # noqa: F401  # hand-written python-only
+from ccxt.pro.test.base.test_subscription_native import test_ws_subscription_native  # noqa: F401  # hand-written python-only
+from ccxt.pro.test.base.test_multiplex_native import test_ws_multiplex_native  # noqa: F401  # hand-written python-only
+from ccxt.pro.test.base.test_shard_native import test_ws_shard_native  # noqa: F401  # hand-written python-only
+from ccxt.pro.test.base.test_subscribe_batch_native import test_ws_subscribe_batch_native  # noqa: F401  # hand-written python-only
+from ccxt.pro.test.base.test_exchange_handlers_native import test_ws_exchange_handlers_native  # noqa: F401  # hand-written python-only
 # todo : from ccxt.pro.test.base.test_close import test_ws_close  # noqa: F401
 from ccxt.pro.test.base.test_future import test_ws_future  # noqa: F401
 from ccxt.pro.test.base.test_abnormal_close import test_abnormal_close  # noqa: F401
@@ -15,6 +24,15 @@ async def test_base_init_ws():
     test_ws_order_book()
     test_ws_cache()
     test_ws_cache_python_regressions()  # hand-written python-only
+    test_ws_order_book_native()  # hand-written python-only
+    test_ws_to_numpy_native()  # hand-written python-only
+    test_ws_decode_native()  # hand-written python-only
     # todo : run(test_ws_close())
     await test_ws_future()
+    await test_ws_stream_native()  # hand-written python-only
+    await test_ws_subscription_native()  # hand-written python-only
+    await test_ws_multiplex_native()  # hand-written python-only
+    await test_ws_shard_native()  # hand-written python-only
+    await test_ws_subscribe_batch_native()  # hand-written python-only
+    await test_ws_exchange_handlers_native()  # hand-written python-only
     # run(test_abnormal_close()) stays in infinite loop in travis
@@ -0,0 +1,68 @@
+import os
+import sys
+import asyncio
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt.async_support as ccxt  # noqa: E402
+from ccxt.async_support.base.throttler import Throttler  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - adaptiveRateLimit feeds the
+# usage reported in response headers back into the python Throttler, the
+# resync arithmetics are checked directly and through the header parsing of
+# the async exchange, without any network access.
+
+
+async def test_adaptive_rate_limit():
+    # a leaky bucket for a budget of 100 tokens per 1000 ms, told that a quarter
+    # of the budget is already spent at the very start of the window, waits for
+    # the pace to catch up with that usage before releasing the next request
+    leaky = Throttler({'refillRate': 0.1, 'capacity': 1, 'rateLimit': 10})
+    leaky.resync(250, 1000, 1000, 0)
+    assert leaky.config['tokens'] == -24
+    start = leaky.milliseconds()
+    await leaky()
+    assert leaky.milliseconds() - start >= 200
+    # usage below what this process alone was allowed leaves the bucket alone
+    leaky.config['tokens'] = 0.5
+    leaky.resync(10, 1000, 1000, 500)
+    assert leaky.config['tokens'] == 0.5
+    # a rolling window takes in the usage it has not seen
+    rolling = Throttler({'algorithm': 'rollingWindow', 'windowSize': 200, 'rateLimit': 50})
+    await rolling()
+    rolling.resync(3, 4, 200, 50)
+    assert rolling.window_cost == 3
+    rolling.resync(2, 4, 200, 60)
+    assert rolling.window_cost == 3
+    # the exchange picks the counters out of the headers, case-insensitively
+    exchange = ccxt.Exchange({
+        'id': 'sampleexchange',
+        'rateLimit': 10,
+        'adaptiveRateLimit': [
+            {'used': 'X-MBX-USED-WEIGHT-1M', 'limit': 6000, 'window': 60000},
+            {'bucket': 'orders', 'remaining': 'X-Bapi-Limit-Status', 'limit': 'X-Bapi-Limit', 'reset': 'X-Bapi-Limit-Reset-Timestamp', 'window': 5000},
+        ],
+        'rateLimitBuckets': {
+            'orders': {'rateLimit': 100, 'windowSize': 5000},
+        },
+    })
+    try:
+        exchange.throttler.config['tokens'] = 1
+        exchange.adapt_rate_limit({'x-mbx-used-weight-1m': '6000'})
+        # the whole minute's budget is used up, the bucket owes at least the rest of the minute
+        assert exchange.throttler.config['tokens'] < 0
+        await exchange.throttle_bucket('orders')
+        orders = exchange.bucket_throttlers['orders']
+        exchange.adapt_rate_limit({'X-Bapi-Limit-Status': '10', 'X-Bapi-Limit': '50', 'X-Bapi-Limit-Reset-Timestamp': str(exchange.milliseconds() + 1000)})
+        assert orders.window_cost == 40
+        # headers that are missing or unparsable are ignored
+        exchange.adapt_rate_limit({'X-Bapi-Limit-Status': 'n/a'})
+        assert orders.window_cost == 40
+    finally:
+        await exchange.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_adaptive_rate_limit())
@@ -0,0 +1,68 @@
+import os
+import sys
+import random
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - build_ohlcvc_columns() is a
+# python-only bulk counterpart of build_ohlcvc(), so it is replayed against the
+# transpiled method on the same trades, through the pure python path and, when
+# numpy is installed, through the vectorised one, both in one go and fed
+# incrementally in batches.
+
+import ccxt  # noqa: E402
+from ccxt.base.exchange import optional_numpy  # noqa: E402
+
+
+def make_trades(rng, count):
+    trades = []
+    timestamp = 1700000000000
+    for _ in range(count):
+        timestamp += rng.choice([0, 150, 2000, 45000, 200000])
+        # a few out-of-order trades, missing values and zero prices
+        skew = -rng.choice([0, 90000]) if rng.random() < 0.05 else 0
+        price = rng.choice([None, 0, 99.5, 100, 100.25, 101, 102.5]) if rng.random() < 0.1 else round(rng.uniform(90, 110), 2)
+        amount = round(rng.uniform(0.01, 3), 3)
+        trades.append({'timestamp': None if rng.random() < 0.01 else timestamp + skew, 'price': price, 'amount': amount})
+    return trades
+
+
+def columns(trades):
+    return [trade['timestamp'] for trade in trades], [trade['price'] for trade in trades], [trade['amount'] for trade in trades]
+
+
+def assert_same_candles(result, expected):
+    assert len(result) == len(expected), str(len(result)) + ' != ' + str(len(expected))
+    for candle, reference in zip(result, expected):
+        assert candle[0] == reference[0] and candle[6] == reference[6]
+        assert candle[1:5] == reference[1:5]
+        assert abs(candle[5] - reference[5]) < 1e-6
+
+
+def test_build_ohlcvc_columns():
+    exchange = ccxt.Exchange({'id': 'sampleexchange'})
+    numpy = optional_numpy()
+    rng = random.Random(5)
+    trades = make_trades(rng, 3000)
+    timestamps, prices, amounts = columns(trades)
+    for timeframe, since, limit in [('1m', 0, 2147483647), ('5m', 1700000600000, 2147483647), ('1h', 0, 1500)]:
+        expected = exchange.build_ohlcvc(trades, timeframe, since, limit)
+        for threshold in (2147483647, 1):  # pure python, then numpy if installed
+            exchange.ohlcvc_bulk_threshold = threshold
+            assert_same_candles(exchange.build_ohlcvc_columns(timestamps, prices, amounts, timeframe, since, limit), expected)
+            # extending an existing list batch by batch gives the same candles
+            candles = []
+            for start in range(0, min(len(trades), limit), 700):
+                end = min(start + 700, limit)
+                exchange.build_ohlcvc_columns(timestamps[start:end], prices[start:end], amounts[start:end], timeframe, since, ohlcvs=candles)
+            assert_same_candles(candles, expected)
+    exchange.ohlcvc_bulk_threshold = 1000
+    if numpy is not None:
+        arrays = [numpy.array([t if t is not None else numpy.nan for t in column], dtype=numpy.float64) for column in (timestamps, prices, amounts)]
+        assert_same_candles(exchange.build_ohlcvc_columns(*arrays, '15m'), exchange.build_ohlcvc(trades, '15m'))
+    # zero prices are kept when skipZeroPrices is disabled
+    exchange.options['buildOHLCVC'] = {'skipZeroPrices': False}
+    assert exchange.build_ohlcvc_columns([60000, 61000], [0, 5], [1, 2]) == [[60000, 0, 5, 0, 5, 3, 2]]
+    assert exchange.build_ohlcvc_columns([], [], []) == []
@@ -0,0 +1,128 @@
+import os
+import sys
+import asyncio
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa: E402
+import ccxt.async_support as ccxt_async  # noqa: E402
+from ccxt.base.errors import ExchangeNotAvailable  # noqa: E402
+from ccxt.base.types import Entry  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - with coalesceRequests the
+# concurrent identical public calls of the implicit api share one request.
+# Requests are answered locally by fetch() after a short delay.
+
+
+class CoalescingExchange(ccxt_async.Exchange):
+    public_get_ticker = publicGetTicker = Entry('ticker', 'public', 'GET', {'cost': 1})
+    fapipublic_get_depth = fapiPublicGetDepth = Entry('depth', 'fapiPublic', 'GET', {'cost': 1})
+    public_post_query = publicPostQuery = Entry('query', 'public', 'POST', {'cost': 1})
+    private_get_balance = privateGetBalance = Entry('balance', 'private', 'GET', {'cost': 1})
+
+    def describe(self):
+        return self.deep_extend(super(CoalescingExchange, self).describe(), {
+            'id': 'coalescingtest',
+            'rateLimit': 1,
+            'urls': {'api': {'public': 'https://localhost/public', 'fapiPublic': 'https://localhost/fapi', 'private': 'https://localhost/private'}},
+        })
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        self.signed += 1
+        return {'url': self.urls['api'][api] + '/' + path + '?' + self.urlencode(params), 'method': method, 'body': body, 'headers': headers}
+
+    async def fetch(self, url, method='GET', headers=None, body=None):
+        self.requests.append(url)
+        await asyncio.sleep(0.02)
+        if 'fail' in url:
+            raise ExchangeNotAvailable(url)
+        return {'url': url, 'levels': [[1, 2], [3, 4]]}
+
+
+class SyncCoalescingExchange(ccxt.Exchange):
+    public_get_ticker = publicGetTicker = Entry('ticker', 'public', 'GET', {'cost': 1})
+
+    def describe(self):
+        return self.deep_extend(super(SyncCoalescingExchange, self).describe(), {'id': 'synccoalescingtest', 'urls': {'api': {'public': 'https://localhost/public'}}})
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        return {'url': self.urls['api'][api] + '/' + path + '?' + self.urlencode(params), 'method': method, 'body': body, 'headers': headers}
+
+    def fetch(self, url, method='GET', headers=None, body=None):
+        self.requests.append(url)
+        return {'url': url}
+
+
+async def test_coalesce_requests():
+    exchange = CoalescingExchange({'coalesceRequests': True})
+    exchange.requests = []
+    exchange.signed = 0
+    try:
+        responses = await asyncio.gather(*[exchange.public_get_ticker({'symbol': 'BTCUSDT'}) for _ in range(5)], exchange.public_get_ticker({'symbol': 'ETHUSDT'}))
+        assert exchange.requests == ['https://localhost/public/ticker?symbol=BTCUSDT', 'https://localhost/public/ticker?symbol=ETHUSDT']
+        # only the requests made are signed
+        assert exchange.signed == 2
+        assert all(response == responses[0] for response in responses[:5])
+        # every caller gets a response of its own to modify
+        responses[1]['levels'].append([5, 6])
+        assert responses[0]['levels'] == [[1, 2], [3, 4]]
+        assert exchange.inflight_requests == {}
+
+        # the first caller resumes first, what it does to the response does not reach the others
+        async def modifying():
+            response = await exchange.public_get_ticker({'symbol': 'LTCUSDT'})
+            response['levels'].clear()
+            return response
+
+        responses = await asyncio.gather(modifying(), *[exchange.public_get_ticker({'symbol': 'LTCUSDT'}) for _ in range(2)])
+        assert responses[0]['levels'] == [] and all(response['levels'] == [[1, 2], [3, 4]] for response in responses[1:])
+        # the calls after the response make a request again
+        await exchange.public_get_ticker({'symbol': 'BTCUSDT'})
+        assert len(exchange.requests) == 4
+        # apis named public only, and only GET requests
+        exchange.requests = []
+        await asyncio.gather(*[exchange.fapiPublicGetDepth() for _ in range(3)])
+        await asyncio.gather(*[exchange.private_get_balance() for _ in range(3)])
+        await asyncio.gather(*[exchange.public_post_query() for _ in range(3)])
+        assert len(exchange.requests) == 1 + 3 + 3
+        # an error reaches every caller
+        results = await asyncio.gather(*[exchange.public_get_ticker({'symbol': 'fail'}) for _ in range(3)], return_exceptions=True)
+        assert len(exchange.requests) == 8
+        assert all(isinstance(result, ExchangeNotAvailable) for result in results)
+        # a cancelled caller does not cancel the request of the others
+        exchange.requests = []
+        first = asyncio.ensure_future(exchange.public_get_ticker({'symbol': 'BTCUSDT'}))
+        second = asyncio.ensure_future(exchange.public_get_ticker({'symbol': 'BTCUSDT'}))
+        await asyncio.sleep(0.005)
+        first.cancel()
+        assert (await second)['url'].endswith('BTCUSDT')
+        assert len(exchange.requests) == 1
+        # the apis to coalesce can be listed
+        exchange.coalesceRequests = {'apis': ['private']}
+        exchange.requests = []
+        await asyncio.gather(*[exchange.private_get_balance() for _ in range(3)])
+        await asyncio.gather(*[exchange.public_get_ticker() for _ in range(3)])
+        assert len(exchange.requests) == 1 + 3
+    finally:
+        await exchange.close()
+    # without coalesceRequests every call makes its request
+    exchange = CoalescingExchange()
+    exchange.requests = []
+    exchange.signed = 0
+    try:
+        await asyncio.gather(*[exchange.public_get_ticker() for _ in range(3)])
+        assert len(exchange.requests) == 3
+    finally:
+        await exchange.close()
+    # a synchronous instance makes its requests as usual
+    exchange = SyncCoalescingExchange({'coalesceRequests': True})
+    exchange.requests = []
+    assert exchange.public_get_ticker({'symbol': 'BTCUSDT'}) == {'url': 'https://localhost/public/ticker?symbol=BTCUSDT'}
+    assert len(exchange.requests) == 1
+
+
+if __name__ == '__main__':
+    asyncio.run(test_coalesce_requests())
+    print('test_coalesce_requests passed')
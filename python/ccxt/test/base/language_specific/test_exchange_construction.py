@@ -0,0 +1,93 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - the python constructor
+# builds describe() and the camelcase alias table once per exchange class, the
+# instances constructed after the first one have to come out just the same,
+# without sharing anything they could modify.
+
+
+class ConstructionExchange(ccxt.Exchange):
+    def describe(self):
+        return self.deep_extend(super(ConstructionExchange, self).describe(), {
+            'id': 'construction',
+            'options': {
+                'networks': {'ERC20': 'ETH'},
+                'types': ['spot', 'swap'],
+            },
+            'api': {
+                'public': {
+                    'get': ['ping'],
+                },
+            },
+            'streaming': {
+                'ping': self.ping,
+            },
+        })
+
+    def fetch_foo_bar(self):
+        return 'foo'
+
+    def ping(self, client):
+        return {'op': 'ping'}
+
+
+class DerivedConstructionExchange(ConstructionExchange):
+    def describe(self):
+        return self.deep_extend(super(DerivedConstructionExchange, self).describe(), {
+            'id': 'derived',
+        })
+
+
+class ConfiguredConstructionExchange(ConstructionExchange):
+    def describe(self):
+        return self.deep_extend(super(ConfiguredConstructionExchange, self).describe(), {
+            'id': 'configured',
+        })
+
+
+def test_exchange_construction():
+    first = ConstructionExchange({'options': {'types': ['spot']}})
+    second = ConstructionExchange({'some_setting': 1})
+    assert first.options['types'] == ['spot']
+    assert second.options['types'] == ['spot', 'swap']
+    # the instances modify their own copies of the settings
+    second.options['types'].append('future')
+    second.options['networks']['TRC20'] = 'TRX'
+    third = ConstructionExchange()
+    assert third.options['types'] == ['spot', 'swap']
+    assert 'TRC20' not in third.options['networks']
+    # while the api tree is read-only and shared
+    assert third.api is second.api
+    assert third.api == {'public': {'get': ['ping']}}
+    # methods of the instance in describe() are bound to the instance
+    assert third.streaming['ping'].__self__ is third
+    assert second.streaming['ping'].__self__ is second
+    # methods are aliased on the class, attributes on each instance with its own values
+    assert third.fetchFooBar() == 'foo'
+    assert second.someSetting == 1
+    assert not hasattr(third, 'someSetting')
+    assert third.requiredCredentials == ConstructionExchange.requiredCredentials
+    # each class describes itself
+    derived = DerivedConstructionExchange()
+    assert derived.id == 'derived'
+    assert ConstructionExchange().id == 'construction'
+    assert derived.fetchFooBar() == 'foo'
+    # the alias table of a class does not depend on what its first instance has set
+    configured = ConfiguredConstructionExchange({'last_http_response': 'response'})
+    assert configured.lastHttpResponse == 'response'
+    assert ConfiguredConstructionExchange().lastHttpResponse is None
+    binance = ccxt.binance()
+    assert ccxt.binance().describe() == binance.describe()
+    assert binance.fetchOHLCV.__func__ is ccxt.binance.fetch_ohlcv
+
+
+if __name__ == '__main__':
+    test_exchange_construction()
+    print('test_exchange_construction passed')
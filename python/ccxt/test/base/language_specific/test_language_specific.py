@@ -17,10 +17,38 @@ from ccxt.test.base.test_deep_extend import test_deep_extend # noqa E402
 from ccxt.test.base.language_specific.test_throttler_performance import test_throttler_performance  # noqa E402
 from ccxt.test.base.language_specific.test_close_session_leak import test_close_session_leak  # noqa E402  # hand-written python-only
 from ccxt.test.base.language_specific.test_precise_instance import test_precise_instance  # noqa E402  # hand-written python-only
+from ccxt.test.base.language_specific.test_build_ohlcvc_columns import test_build_ohlcvc_columns  # noqa E402  # hand-written python-only
+from ccxt.test.base.language_specific.test_throttler_scheduling import test_throttler_scheduling  # noqa E402  # hand-written python-only
+from ccxt.test.base.language_specific.test_rate_limit_buckets import test_rate_limit_buckets  # noqa E402  # hand-written python-only
+from ccxt.test.base.language_specific.test_adaptive_rate_limit import test_adaptive_rate_limit  # noqa E402  # hand-written python-only
+from ccxt.test.base.language_specific.test_shared_token_bucket import test_shared_token_bucket  # noqa E402  # hand-written python-only
+from ccxt.test.base.language_specific.test_markets_cache import test_markets_cache  # noqa E402  # hand-written python-only
+from ccxt.test.base.language_specific.test_lazy_exchanges import test_lazy_exchanges  # noqa E402  # hand-written python-only
+from ccxt.test.base.language_specific.test_exchange_construction import test_exchange_construction  # noqa E402  # hand-written python-only
+from ccxt.test.base.language_specific.test_markets_registry import test_markets_registry  # noqa E402  # hand-written python-only
+from ccxt.test.base.language_specific.test_update_markets import test_update_markets  # noqa E402  # hand-written python-only
+from ccxt.test.base.language_specific.test_offload import test_offload  # noqa E402  # hand-written python-only
+from ccxt.test.base.language_specific.test_coalesce_requests import test_coalesce_requests  # noqa E402  # hand-written python-only
+from ccxt.test.base.language_specific.test_response_cache import test_response_cache  # noqa E402  # hand-written python-only
+from ccxt.test.base.language_specific.test_request_timing import test_request_timing  # noqa E402  # hand-written python-only
 
 
 
 async def test_language_specific():
     test_precise_instance()  # hand-written python-only
+    test_build_ohlcvc_columns()  # hand-written python-only
     test_throttler_performance()
+    await test_throttler_scheduling()  # hand-written python-only
+    await test_rate_limit_buckets()  # hand-written python-only
+    await test_adaptive_rate_limit()  # hand-written python-only
+    await test_shared_token_bucket()  # hand-written python-only
+    await test_markets_cache()  # hand-written python-only
+    test_lazy_exchanges()  # hand-written python-only
+    test_exchange_construction()  # hand-written python-only
+    await test_markets_registry()  # hand-written python-only
+    await test_update_markets()  # hand-written python-only
+    await test_offload()  # hand-written python-only
+    await test_coalesce_requests()  # hand-written python-only
+    await test_response_cache()  # hand-written python-only
+    await test_request_timing()  # hand-written python-only
     await test_close_session_leak()  # hand-written python-only
@@ -0,0 +1,61 @@
+import os
+import sys
+import subprocess
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+import ccxt.pro  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - the python packages import
+# their exchange modules on first attribute access (PEP 562), which has to stay
+# invisible to the code that uses them. Whether importing a package really
+# leaves the exchanges alone is checked in a fresh interpreter, this one has
+# long imported them.
+
+FRESH_INTERPRETER_CHECK = '''
+import sys
+import ccxt, ccxt.async_support, ccxt.pro
+loaded = [name for name in ('ccxt.binance', 'ccxt.async_support.binance', 'ccxt.pro.binance') if name in sys.modules]
+assert not loaded, loaded
+assert isinstance(ccxt.binance, type)
+assert 'ccxt.binance' in sys.modules and 'ccxt.async_support.binance' not in sys.modules
+# the pro exchange imports its async base, which must not leave a module behind in ccxt.async_support
+import ccxt.pro.okx
+assert isinstance(ccxt.async_support.okx, type), ccxt.async_support.okx
+assert isinstance(ccxt.pro.okx, type), ccxt.pro.okx
+# star imports bring the exchange classes along
+namespace = {}
+exec('from ccxt.pro import *', namespace)
+assert isinstance(namespace['binance'], type) and 'NetworkError' in namespace and 'Exchange' in namespace
+'''
+
+
+def test_lazy_exchanges():
+    for package in (ccxt, ccxt.async_support, ccxt.pro):
+        names = dir(package)
+        for exchange_id in package.exchanges:
+            assert exchange_id in names
+        exchange_class = getattr(package, package.exchanges[0])
+        assert isinstance(exchange_class, type)
+        assert exchange_class.__module__ == package.__name__ + '.' + package.exchanges[0]
+        assert issubclass(exchange_class, package.Exchange)
+        try:
+            package.notanexchange
+            assert False, 'unknown names must raise AttributeError'
+        except AttributeError:
+            pass
+        assert not hasattr(package, 'notanexchange')
+    assert ccxt.binance is getattr(ccxt, 'binance')
+    from ccxt.async_support import kraken
+    assert kraken is ccxt.async_support.kraken
+    result = subprocess.run([sys.executable, '-c', FRESH_INTERPRETER_CHECK], cwd=os.path.dirname(os.path.dirname(ccxt.__file__)), capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+if __name__ == '__main__':
+    test_lazy_exchanges()
+    print('test_lazy_exchanges passed')
@@ -0,0 +1,118 @@
+import os
+import sys
+import asyncio
+import tempfile
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa: E402
+import ccxt.async_support as ccxt_async  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - the on-disk markets cache
+# of load_markets() is python-only, fetch_markets() is answered locally and
+# counted to tell cache hits from network loads.
+
+MARKETS = [
+    {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'baseId': 'BTC', 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'active': True, 'precision': {'amount': 0.0001, 'price': 0.01}, 'info': {}},
+    {'id': 'ETHUSDT', 'symbol': 'ETH/USDT', 'base': 'ETH', 'quote': 'USDT', 'baseId': 'ETH', 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'active': True, 'precision': {'amount': 0.001, 'price': 0.01}, 'info': {}},
+]
+
+
+class CachedMarketsExchange(ccxt.Exchange):
+    fetches = 0
+    failing = False
+
+    def describe(self):
+        return self.deep_extend(super(CachedMarketsExchange, self).describe(), {'id': 'cachedmarkets'})
+
+    def fetch_markets(self, params={}):
+        if CachedMarketsExchange.failing:
+            raise ccxt.NetworkError('markets unavailable')
+        CachedMarketsExchange.fetches += 1
+        markets = [dict(market) for market in MARKETS[:CachedMarketsExchange.fetches]]
+        self.options['marketsById'] = [market['id'] for market in markets]
+        return markets
+
+
+class AsyncCachedMarketsExchange(ccxt_async.Exchange):
+    fetches = 0
+
+    def describe(self):
+        return self.deep_extend(super(AsyncCachedMarketsExchange, self).describe(), {'id': 'cachedmarkets'})
+
+    async def fetch_markets(self, params={}):
+        AsyncCachedMarketsExchange.fetches += 1
+        return [dict(market) for market in MARKETS]
+
+
+async def test_markets_cache():
+    with tempfile.TemporaryDirectory() as directory:
+        options = {'marketsCache': {'directory': directory}}
+        # without the option nothing is cached
+        assert CachedMarketsExchange().markets_cache_path() is None
+        CachedMarketsExchange({'options': options}).load_markets()
+        assert CachedMarketsExchange.fetches == 1
+        exchange = CachedMarketsExchange({'options': options})
+        exchange.load_markets()
+        assert CachedMarketsExchange.fetches == 1
+        assert exchange.symbols == ['BTC/USDT']
+        assert exchange.markets_by_id['BTCUSDT'][0]['precision']['amount'] == 0.0001
+        # the options fetch_markets() sets come with the cached markets
+        assert exchange.options['marketsById'] == ['BTCUSDT']
+        # an account has markets of its own
+        private = CachedMarketsExchange({'apiKey': 'key', 'options': options})
+        assert private.markets_cache_path() != exchange.markets_cache_path()
+        private.load_markets()
+        assert CachedMarketsExchange.fetches == 2
+        # the sandbox is cached separately
+        sandbox = CachedMarketsExchange({'options': options})
+        sandbox.isSandboxModeEnabled = True
+        sandbox.load_markets()
+        assert CachedMarketsExchange.fetches == 3
+        # reload=True always goes to the network and refreshes the cache
+        exchange.load_markets(True)
+        assert CachedMarketsExchange.fetches == 4
+        assert exchange.symbols == ['BTC/USDT', 'ETH/USDT']
+        # a blocking instance loads over a stale entry, which only stands in when the load fails
+        stale_options = {'marketsCache': {'directory': directory, 'ttl': -1}}
+        CachedMarketsExchange({'options': stale_options}).load_markets()
+        assert CachedMarketsExchange.fetches == 5
+        CachedMarketsExchange.failing = True
+        fallback = CachedMarketsExchange({'options': stale_options})
+        fallback.load_markets()
+        assert fallback.symbols == ['BTC/USDT', 'ETH/USDT']
+        CachedMarketsExchange.failing = False
+        # a cache that cannot be written does not fail the load
+        blocker = os.path.join(directory, 'blocker')
+        with open(blocker, 'w') as file:
+            file.write('')
+        unwritable = CachedMarketsExchange({'options': {'marketsCache': {'directory': os.path.join(blocker, 'cache')}}})
+        unwritable.load_markets()
+        assert unwritable.symbols
+        # a stale entry is used at once and revalidated in the background
+        async_options = {'marketsCache': {'directory': directory, 'ttl': 0}}
+        first = AsyncCachedMarketsExchange({'options': async_options})
+        await first.load_markets()
+        await first.close()
+        assert AsyncCachedMarketsExchange.fetches == 1
+        second = AsyncCachedMarketsExchange({'options': async_options})
+        await asyncio.sleep(0.001)
+        await second.load_markets()
+        assert second.symbols == ['BTC/USDT', 'ETH/USDT']
+        assert second.markets_revalidation is not None
+        await second.markets_revalidation
+        assert AsyncCachedMarketsExchange.fetches == 2
+        await second.close()
+        # an unreadable entry falls back to the network
+        with open(second.markets_cache_path(), 'wb') as file:
+            file.write(b'garbage')
+        third = AsyncCachedMarketsExchange({'options': async_options})
+        await third.load_markets()
+        assert AsyncCachedMarketsExchange.fetches == 3
+        await third.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_markets_cache())
@@ -0,0 +1,123 @@
+import os
+import sys
+import asyncio
+import gc
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa: E402
+import ccxt.async_support as ccxt_async  # noqa: E402
+from ccxt.base.market_registry import markets_registry  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - the process-wide markets
+# registry is python-only, fetch_markets() is answered locally and counted to
+# tell shared markets from network loads.
+
+MARKETS = [
+    {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'baseId': 'BTC', 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'active': True, 'precision': {'amount': 0.0001, 'price': 0.01}, 'info': {}},
+    {'id': 'ETHUSDT', 'symbol': 'ETH/USDT', 'base': 'ETH', 'quote': 'USDT', 'baseId': 'ETH', 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'active': True, 'precision': {'amount': 0.001, 'price': 0.01}, 'info': {}},
+]
+
+OPTIONS = {'marketsRegistry': True}
+
+
+class RegistryExchange(ccxt.Exchange):
+    fetches = 0
+
+    def describe(self):
+        return self.deep_extend(super(RegistryExchange, self).describe(), {'id': 'registry'})
+
+    def fetch_markets(self, params={}):
+        RegistryExchange.fetches += 1
+        return [dict(market) for market in MARKETS[:RegistryExchange.fetches]]
+
+
+class AsyncRegistryExchange(ccxt_async.Exchange):
+    fetches = 0
+
+    def describe(self):
+        return self.deep_extend(super(AsyncRegistryExchange, self).describe(), {'id': 'asyncregistry'})
+
+    async def fetch_markets(self, params={}):
+        AsyncRegistryExchange.fetches += 1
+        return [dict(market) for market in MARKETS]
+
+
+def test_sync_markets_registry():
+    # without the option every instance loads its own markets
+    RegistryExchange().load_markets()
+    RegistryExchange().load_markets()
+    assert RegistryExchange.fetches == 2
+    RegistryExchange.fetches = 0
+    first = RegistryExchange({'options': OPTIONS})
+    first.load_markets()
+    second = RegistryExchange({'options': OPTIONS})
+    second.load_markets()
+    assert RegistryExchange.fetches == 1
+    assert second.markets is first.markets
+    assert second.markets_by_id is first.markets_by_id
+    assert second.currencies is first.currencies
+    key = first.markets_registry
+    assert markets_registry.references(key) == 2
+    # the sandbox does not share the markets of the production api
+    sandbox = RegistryExchange({'options': OPTIONS})
+    sandbox.isSandboxModeEnabled = True
+    sandbox.load_markets()
+    assert RegistryExchange.fetches == 2
+    assert sandbox.markets_registry != key
+    # nor does an account share the markets of the public instances, its currencies may differ
+    private = RegistryExchange({'apiKey': 'key', 'options': OPTIONS})
+    private.load_markets()
+    assert RegistryExchange.fetches == 3
+    assert private.markets_registry != key
+    # a reload reaches every attached instance
+    second.load_markets(True)
+    assert RegistryExchange.fetches == 4
+    assert first.symbols == ['BTC/USDT', 'ETH/USDT']
+    assert first.markets is second.markets
+    # an instance with markets of its own keeps them
+    custom = RegistryExchange({'options': OPTIONS})
+    custom.load_markets()
+    custom.set_markets(MARKETS[:1])
+    detached = RegistryExchange({'options': OPTIONS})
+    detached.load_markets()
+    detached.detach_markets()
+    detached.markets['BTC/USDT']['precision']['amount'] = 1
+    assert first.markets['BTC/USDT']['precision']['amount'] == 0.0001
+    assert markets_registry.references(key) == 3
+    first.load_markets(True)
+    assert RegistryExchange.fetches == 5
+    assert second.markets is first.markets
+    assert custom.symbols == ['BTC/USDT']
+    assert detached.markets is not first.markets
+    # the markets go with the last instance
+    del first, second, custom, detached
+    gc.collect()
+    assert markets_registry.references(key) == 0
+    assert key not in markets_registry.entries
+
+
+async def test_async_markets_registry():
+    first = AsyncRegistryExchange({'options': OPTIONS})
+    second = AsyncRegistryExchange({'options': OPTIONS})
+    await first.load_markets()
+    await second.load_markets()
+    assert AsyncRegistryExchange.fetches == 1
+    assert second.markets is first.markets
+    await second.load_markets(True)
+    assert AsyncRegistryExchange.fetches == 2
+    assert second.markets is first.markets
+    await first.close()
+    await second.close()
+
+
+async def test_markets_registry():
+    test_sync_markets_registry()
+    await test_async_markets_registry()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_markets_registry())
+    print('test_markets_registry passed')
@@ -0,0 +1,66 @@
+import os
+import sys
+import asyncio
+import concurrent.futures
+import copy
+import json
+import multiprocessing
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa: E402
+import ccxt.async_support as ccxt_async  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - options['offload'] moves the
+# decoding of large response bodies and the building of the markets into an
+# executor, which must not change what the instance ends up with.
+
+MARKETS = [
+    {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'baseId': 'BTC', 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'active': True, 'precision': {'amount': 0.0001, 'price': 0.01}, 'info': {'filters': [1, 2.5, None, True, 'x']}},
+    {'id': 'ETHUSDT', 'symbol': 'ETH/USDT', 'base': 'ETH', 'quote': 'USDT', 'baseId': 'ETH', 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'active': True, 'precision': {'amount': 0.001, 'price': 0.01}, 'info': {}},
+]
+
+
+class OffloadedExchange(ccxt_async.Exchange):
+    def describe(self):
+        return self.deep_extend(super(OffloadedExchange, self).describe(), {'id': 'offloaded'})
+
+    async def fetch_markets(self, params={}):
+        return copy.deepcopy(MARKETS)
+
+
+async def test_offload():
+    body = json.dumps({'result': MARKETS, 'unicode': 'café \\"quoted\\"', 'big': 12345678901234567890})
+    threads = concurrent.futures.ThreadPoolExecutor(1)
+    exchange = OffloadedExchange({'options': {'offload': {'threshold': 0, 'executor': threads}}})
+    assert await exchange.parse_json_off_loop(body) == json.loads(body)
+    assert await exchange.parse_json_off_loop('<html>') is None
+    assert await exchange.parse_json_off_loop('{"broken": ') is None
+    # below the threshold nothing leaves the loop
+    small = OffloadedExchange({'options': {'offload': {'executor': 'not an executor'}}})
+    assert await small.parse_json_off_loop(body) == json.loads(body)
+    processes = concurrent.futures.ProcessPoolExecutor(1, mp_context=multiprocessing.get_context('fork'))
+    forked = OffloadedExchange({'options': {'offload': {'threshold': 0, 'executor': processes}}})
+    assert await forked.parse_json_off_loop(body) == json.loads(body)
+    # the markets built in a thread are those set_markets() builds on the loop
+    await exchange.load_markets()
+    reference = ccxt.Exchange({'id': 'offloaded'})
+    reference.set_markets(copy.deepcopy(MARKETS))
+    assert exchange.markets == reference.markets
+    assert exchange.markets_by_id == reference.markets_by_id
+    assert exchange.symbols == reference.symbols
+    assert exchange.currencies == reference.currencies
+    assert exchange.codes == reference.codes
+    await forked.load_markets()
+    assert forked.symbols == reference.symbols
+    processes.shutdown()
+    threads.shutdown()
+    for instance in (exchange, small, forked):
+        await instance.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_offload())
+    print('test_offload passed')
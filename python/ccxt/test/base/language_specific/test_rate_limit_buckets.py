@@ -0,0 +1,118 @@
+import os
+import sys
+import asyncio
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa: E402
+import ccxt.async_support as ccxt_async  # noqa: E402
+from ccxt.base.types import Entry  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - rateLimitBuckets are
+# consumed by the python Entry descriptors of the implicit api, instead of the
+# tokenBucket. Requests are answered locally by fetch(), only the throttling
+# is exercised: calls that consume a slow bucket must not hold back the calls
+# that do not.
+
+
+class BucketsExchange(ccxt_async.Exchange):
+    public_get_depth = publicGetDepth = Entry('depth', 'public', 'GET', {'cost': 1})
+    private_post_order = privatePostOrder = Entry('order', 'private', 'POST', {'cost': 1})
+    private_post_batchorders = privatePostBatchOrders = Entry('batchOrders', 'private', 'POST', {'cost': 5, 'buckets': {'orders': 3}})
+
+    def describe(self):
+        return self.deep_extend(super(BucketsExchange, self).describe(), {
+            'id': 'bucketstest',
+            'rateLimit': 1,
+            'urls': {'api': {'public': 'https://localhost/public', 'private': 'https://localhost/private'}},
+        })
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        return {'url': self.urls['api'][api] + '/' + path, 'method': method, 'body': body, 'headers': headers}
+
+    async def fetch(self, url, method='GET', headers=None, body=None):
+        return {'url': url}
+
+
+class NestedBucketsExchange(BucketsExchange):
+    async def fetch(self, url, method='GET', headers=None, body=None):
+        if url.endswith('/order'):
+            # like a token an exchange fetches on the way to the request
+            await self.public_get_depth()
+        return {'url': url}
+
+
+async def timed(call, start):
+    await call
+    return time.perf_counter() - start
+
+
+async def test_rate_limit_buckets():
+    exchange = BucketsExchange({
+        'rateLimitBuckets': {
+            'orders': {'rateLimit': 40, 'endpoints': [{'method': 'POST', 'path': 'order'}]},
+        },
+    })
+    try:
+        assert exchange.rate_limit_bucket_costs('order', 'private', 'POST') == [('orders', 1)]
+        assert exchange.rate_limit_bucket_costs('depth', 'public', 'GET') == []
+        assert exchange.rate_limit_bucket_costs('batchOrders', 'private', 'POST', {'buckets': {'orders': 3}}) == [('orders', 3)]
+        start = time.perf_counter()
+        orders = [timed(exchange.private_post_order(), start) for _ in range(5)]
+        depths = [timed(exchange.public_get_depth(), start) for _ in range(5)]
+        results = await asyncio.gather(*(orders + depths))
+        # the 5th order waits 4 x 40 ms for the orders bucket, the market data calls only for the 1 ms tokenBucket
+        assert max(results[:5]) >= 0.15, results
+        assert max(results[5:]) < 0.1, results
+        # an explicit 'buckets' endpoint config charges its own cost
+        start = time.perf_counter()
+        await exchange.private_post_batchorders()
+        await exchange.private_post_order()
+        assert time.perf_counter() - start >= 0.1
+        assert exchange.bucket_throttlers['orders'].stats()['requests'] == 7
+    finally:
+        await exchange.close()
+    # with a realistic rateLimit an order does not queue behind the market data in the tokenBucket
+    exchange = BucketsExchange({
+        'rateLimit': 50,
+        'rateLimitBuckets': {
+            'orders': {'rateLimit': 100, 'endpoints': [{'method': 'POST', 'path': 'order'}]},
+        },
+    })
+    try:
+        start = time.perf_counter()
+        depths = [asyncio.ensure_future(timed(exchange.public_get_depth(), start)) for _ in range(10)]
+        await asyncio.sleep(0)
+        order = await timed(exchange.private_post_order(), start)
+        results = await asyncio.gather(*depths)
+        assert max(results) >= 0.4, results
+        assert order < 0.1, order
+        assert exchange.throttler.stats()['requests'] == 10
+    finally:
+        await exchange.close()
+    # the requests a bucketed request makes on the way are throttled by the tokenBucket
+    exchange = NestedBucketsExchange({
+        'rateLimitBuckets': {
+            'orders': {'rateLimit': 40, 'endpoints': [{'method': 'POST', 'path': 'order'}]},
+        },
+    })
+    try:
+        await exchange.private_post_order()
+        assert exchange.throttler.stats()['requests'] == 1
+        assert exchange.bucket_throttlers['orders'].stats()['requests'] == 1
+    finally:
+        await exchange.close()
+    # the blocking variant for the sync exchange
+    sync_exchange = ccxt.Exchange({'id': 'sampleexchange', 'rateLimitBuckets': {'weight': {'rateLimit': 20, 'capacity': 1}}})
+    start = time.perf_counter()
+    for _ in range(3):
+        sync_exchange.throttle_bucket('weight')
+    assert time.perf_counter() - start >= 0.035
+    assert sync_exchange.bucket_throttlers['weight']['tokens'] <= 0
+
+
+if __name__ == '__main__':
+    asyncio.run(test_rate_limit_buckets())
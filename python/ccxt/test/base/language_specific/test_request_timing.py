@@ -0,0 +1,133 @@
+import os
+import sys
+import asyncio
+
+from aiohttp import web
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt.async_support as ccxt  # noqa: E402
+from ccxt.base.errors import ExchangeNotAvailable  # noqa: E402
+from ccxt.base.latency_histogram import LatencyHistogram  # noqa: E402
+from ccxt.base.types import Entry  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - options['requestTiming']
+# times the phases of every request against a local server and aggregates
+# them per endpoint.
+
+SERVER_DELAY = 0.03
+
+
+class TimedExchange(ccxt.Exchange):
+    public_get_ticker = publicGetTicker = Entry('ticker', 'public', 'GET', {'cost': 1})
+    public_get_ticker_symbol = publicGetTickerSymbol = Entry('ticker/{symbol}', 'public', 'GET', {'cost': 1})
+    public_get_unavailable = publicGetUnavailable = Entry('unavailable', 'public', 'GET', {'cost': 1})
+
+    def describe(self):
+        return self.deep_extend(super(TimedExchange, self).describe(), {
+            'id': 'timedtest',
+            'rateLimit': 20,
+        })
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        query = self.omit(params, self.extract_params(path))
+        return {'url': self.urls['api'][api] + '/' + self.implode_params(path, params) + '?' + self.urlencode(query), 'method': method, 'body': body, 'headers': headers}
+
+
+async def timing_ticker_handler(request):
+    await asyncio.sleep(SERVER_DELAY)
+    return web.json_response({'symbol': request.query.get('symbol'), 'levels': [[i, i] for i in range(1000)]})
+
+
+async def timing_unavailable_handler(request):
+    return web.Response(status=503, text='maintenance')
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) is None
+    for milliseconds in [3, 4, 7, 15, 15, 40, 90, 120, 700, 1500]:
+        histogram.add(milliseconds)
+    summary = histogram.summary()
+    assert summary['count'] == 10 and summary['min'] == 3 and summary['max'] == 1500
+    assert summary['p50'] == 20  # the 5th latency is 15 ms, in the bucket up to 20 ms
+    assert summary['p99'] == 1500  # the last bucket is bounded by the largest latency
+    assert summary['buckets'][5] == 2 and sum(summary['buckets'].values()) == 10
+
+
+async def test_request_timing():
+    test_latency_histogram()
+    app = web.Application()
+    app.router.add_get('/ticker', timing_ticker_handler)
+    app.router.add_get('/ticker/{symbol}', timing_ticker_handler)
+    app.router.add_get('/unavailable', timing_unavailable_handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    records = []
+    exchange = TimedExchange({
+        'urls': {'api': {'public': 'http://127.0.0.1:' + str(runner.addresses[0][1])}},
+        'options': {'requestTiming': {'callback': records.append}},
+    })
+    try:
+        await asyncio.gather(*[exchange.public_get_ticker({'symbol': 'BTCUSDT'}) for _ in range(3)])
+        assert len(records) == 3
+        for record in records:
+            assert record['endpoint'] == 'GET public ticker'
+            assert record['status'] == 200 and record['error'] is None
+            assert record['sign'] is not None and record['decode'] is not None
+            assert record['ttfb'] >= SERVER_DELAY * 1000 * 0.9
+            assert record['total'] >= record['throttle'] + record['connect'] + record['ttfb'] + record['read'] + record['decode']
+        # the rate limiter holds the later requests back, and every request opens a connection of its own
+        assert max(record['throttle'] for record in records) >= 30
+        assert all(record['connect'] > 0 for record in records)
+        # the next request reuses a connection
+        await exchange.public_get_ticker({'symbol': 'ETHUSDT'})
+        assert records[-1]['connect'] == 0
+        try:
+            await exchange.public_get_unavailable()
+            assert False, 'a 503 must raise'
+        except ExchangeNotAvailable:
+            pass
+        assert records[-1]['status'] == 503 and records[-1]['error'] == 'ExchangeNotAvailable'
+        # the requests of a path template are one endpoint, whatever the values of its parameters
+        for symbol in ('BTCUSDT', 'ETHUSDT'):
+            await exchange.public_get_ticker_symbol({'symbol': symbol})
+        stats = exchange.request_timing_stats()
+        assert sorted(stats) == ['GET public ticker', 'GET public ticker/{symbol}', 'GET public unavailable']
+        assert stats['GET public ticker']['total']['count'] == 4
+        assert stats['GET public ticker/{symbol}']['total']['count'] == 2
+        assert stats['GET public ticker']['ttfb']['min'] >= SERVER_DELAY * 1000 * 0.9
+        # the waits for the rateLimitBuckets are part of the throttle phase
+        exchange.rateLimitBuckets = {'tickers': {'rateLimit': 50, 'endpoints': [{'method': 'GET', 'path': 'ticker/{symbol}'}]}}
+        await asyncio.gather(*[exchange.public_get_ticker_symbol({'symbol': 'BTCUSDT'}) for _ in range(3)])
+        assert max(record['throttle'] for record in records[-3:]) >= 90
+        exchange.rateLimitBuckets = None
+        # a callback that raises does not fail the request
+        def failing(record):
+            raise ValueError('callback error')
+        exchange.options['requestTiming']['callback'] = failing
+        assert (await exchange.public_get_ticker({'symbol': 'BTCUSDT'}))['symbol'] == 'BTCUSDT'
+        exchange.options['requestTiming']['callback'] = records.append
+        # without the rate limiter the requests start in fetch() and are not timed while signing
+        exchange.enableRateLimit = False
+        await exchange.public_get_ticker()
+        assert records[-1]['throttle'] == 0 and records[-1]['sign'] is None
+    finally:
+        await exchange.close()
+    # without the option nothing is recorded
+    exchange = TimedExchange({'urls': {'api': {'public': 'http://127.0.0.1:' + str(runner.addresses[0][1])}}})
+    try:
+        await exchange.public_get_ticker()
+        assert exchange.request_timings == {}
+    finally:
+        await exchange.close()
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_request_timing())
+    print('test_request_timing passed')
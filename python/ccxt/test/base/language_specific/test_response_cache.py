@@ -0,0 +1,153 @@
+import os
+import sys
+import asyncio
+import marshal
+import tempfile
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa: E402
+import ccxt.async_support as ccxt_async  # noqa: E402
+from ccxt.base.response_cache import ResponseCache, LRUResponseCache, FileResponseCache  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - options['responseCache']
+# answers repeated calls of the listed unified methods from a cache until their
+# ttl expires. The methods count their calls instead of making requests.
+
+
+class CachedExchange(ccxt.Exchange):
+    calls = 0
+
+    def describe(self):
+        return self.deep_extend(super(CachedExchange, self).describe(), {'id': 'cachedtest', 'has': {'fetchCurrencies': True}})
+
+    def fetch_currencies(self, params={}):
+        self.calls += 1
+        return {'BTC': {'id': 'btc', 'code': 'BTC', 'networks': {'BTC': {'fee': 0.0001}}, 'params': params}}
+
+    def fetch_markets(self, params={}):
+        return []
+
+    def fetch_trading_fees(self, params={}):
+        self.calls += 1
+        return {'BTC/USDT': {'maker': 0.001, 'taker': 0.001, 'account': self.apiKey}}
+
+
+class AsyncCachedExchange(ccxt_async.Exchange):
+    calls = 0
+
+    def describe(self):
+        return self.deep_extend(super(AsyncCachedExchange, self).describe(), {'id': 'asynccachedtest', 'has': {'fetchCurrencies': True}})
+
+    async def fetch_currencies(self, params={}):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return {'BTC': {'id': 'btc', 'code': 'BTC', 'params': params}}
+
+    async def fetch_markets(self, params={}):
+        return []
+
+
+def test_lru_response_cache():
+    cache = LRUResponseCache(max_entries=3, max_bytes=100)
+    for key in 'abc':
+        cache.set(key, key.encode() * 10, 60000)
+    assert cache.get('a') == b'a' * 10  # a is now the most recently used
+    cache.set('d', b'd' * 10, 60000)
+    assert cache.get('b') is None and cache.get('a') is not None and cache.get('d') is not None
+    # the bytes bound evicts the least recently used entries until the new one fits
+    cache.set('e', b'e' * 80, 60000)
+    assert list(cache.entries) == ['a', 'd', 'e'] and cache.size == 100
+    cache.set('f', b'f' * 101, 60000)  # larger than the whole cache
+    assert cache.get('f') is None
+    cache.set('g', b'g', 0)
+    assert cache.get('g') is None and 'g' not in cache.entries
+    # a cache has to implement get() and set()
+    try:
+        type('IncompleteResponseCache', (ResponseCache,), {'get': lambda self, key: None})()
+        assert False, 'a cache without set() must not be constructed'
+    except TypeError:
+        pass
+
+
+def test_response_cache_methods():
+    exchange = CachedExchange({'options': {'responseCache': {'ttl': {'fetchTradingFees': 0}}}})
+    first = exchange.fetch_currencies()
+    first['BTC']['networks']['BTC']['fee'] = 1  # the cached result is a copy
+    second = exchange.fetchCurrencies()
+    assert exchange.calls == 1
+    assert second['BTC']['networks']['BTC']['fee'] == 0.0001
+    # the arguments take part in the key
+    exchange.fetch_currencies({'type': 'spot'})
+    exchange.fetch_currencies(params={'type': 'spot'})
+    assert exchange.calls == 3
+    exchange.fetch_currencies({'type': 'spot'})
+    assert exchange.calls == 3
+    # a ttl of 0 leaves a method out
+    exchange.fetch_trading_fees()
+    exchange.fetch_trading_fees()
+    assert exchange.calls == 5
+    # without the option nothing is cached
+    exchange = CachedExchange()
+    exchange.fetch_currencies()
+    exchange.fetch_currencies()
+    assert exchange.calls == 2 and exchange.response_cache is None
+    # a reload of the markets fetches the currencies again, and caches them for the calls that follow
+    exchange = CachedExchange({'options': {'responseCache': {}}})
+    exchange.load_markets()
+    exchange.load_markets(True)
+    exchange.fetch_currencies()
+    assert exchange.calls == 2
+
+
+def test_file_response_cache():
+    with tempfile.TemporaryDirectory() as directory:
+        options = {'responseCache': {'backend': FileResponseCache(directory), 'ttl': {'fetchTradingFees': 50}}}
+        exchange = CachedExchange({'apiKey': 'one', 'options': options})
+        assert exchange.fetch_trading_fees()['BTC/USDT']['account'] == 'one'
+        # another instance of the same account shares the entry, another account does not
+        other = CachedExchange({'apiKey': 'one', 'options': options})
+        assert other.fetch_trading_fees()['BTC/USDT']['account'] == 'one' and other.calls == 0
+        another = CachedExchange({'apiKey': 'two', 'options': options})
+        assert another.fetch_trading_fees()['BTC/USDT']['account'] == 'two' and another.calls == 1
+        # the credentials are not written to disk in the clear
+        for name in os.listdir(directory):
+            with open(os.path.join(directory, name), 'rb') as file:
+                assert b'one' not in marshal.dumps(marshal.load(file)[1])
+        time.sleep(0.06)
+        other.fetch_trading_fees()
+        assert other.calls == 1
+        # a directory that cannot be created leaves the results uncached, the calls still succeed
+        blocker = os.path.join(directory, 'blocker')
+        open(blocker, 'w').close()
+        options = {'responseCache': {'backend': FileResponseCache(os.path.join(blocker, 'responses'))}}
+        exchange = CachedExchange({'options': options})
+        exchange.fetch_currencies()
+        assert exchange.fetch_currencies()['BTC']['code'] == 'BTC' and exchange.calls == 2
+
+
+async def test_async_response_cache():
+    exchange = AsyncCachedExchange({'options': {'responseCache': {}}})
+    try:
+        assert await exchange.fetch_currencies() == await exchange.fetchCurrencies()
+        assert exchange.calls == 1
+        await exchange.load_markets()
+        await exchange.load_markets(True)
+        assert exchange.calls == 2
+    finally:
+        await exchange.close()
+
+
+async def test_response_cache():
+    test_lru_response_cache()
+    test_response_cache_methods()
+    test_file_response_cache()
+    await test_async_response_cache()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_response_cache())
+    print('test_response_cache passed')
@@ -0,0 +1,85 @@
+import os
+import sys
+import asyncio
+import multiprocessing
+import tempfile
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa: E402
+from ccxt.base.token_bucket import TokenBucketBackend, LocalTokenBucket, SharedTokenBucket, fcntl  # noqa: E402
+from ccxt.async_support.base.throttler import Throttler  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - the token bucket backends
+# let several throttlers draw from one budget: exchange instances of one
+# process through LocalTokenBucket, separate processes through the file-backed
+# SharedTokenBucket, which is checked with real worker processes.
+
+RATE_LIMIT_MS = 20
+REQUESTS_PER_WORKER = 4
+
+
+def shared_bucket_worker(bucket, results):
+    # each worker is a separate sync exchange, the backend is the only thing they share
+    exchange = ccxt.Exchange({'id': 'sampleexchange', 'rateLimit': RATE_LIMIT_MS, 'tokenBucket': {'backend': bucket}})
+    released = []
+    for _ in range(REQUESTS_PER_WORKER):
+        exchange.throttle()
+        released.append(time.time() * 1000)
+    results.put(released)
+
+
+def assert_paced(released, count):
+    released = sorted(released)
+    assert len(released) == count
+    # the first request goes at once, every later one a rate limit after the previous
+    assert released[-1] - released[0] >= (count - 1.5) * RATE_LIMIT_MS, released
+
+
+async def test_shared_token_bucket():
+    # a backend has to implement reserve()
+    try:
+        type('IncompleteTokenBucket', (TokenBucketBackend,), {})()
+        assert False, 'a backend without reserve() must not be constructed'
+    except TypeError:
+        pass
+    # throttlers of two async instances sharing a LocalTokenBucket pace as one
+    local = LocalTokenBucket()
+    config = {'refillRate': 1 / RATE_LIMIT_MS, 'capacity': 1, 'rateLimit': RATE_LIMIT_MS, 'backend': local}
+    first = Throttler(config)
+    second = Throttler(config)
+    released = []
+
+    async def call(throttler):
+        await throttler()
+        released.append(time.time() * 1000)
+
+    await asyncio.gather(*[call(throttler) for throttler in [first, second] * 3])
+    assert_paced(released, 6)
+    assert first.stats()['requests'] == 3
+    if fcntl is None:
+        return
+    # three worker processes sharing one file-backed bucket
+    with tempfile.TemporaryDirectory() as directory:
+        bucket = SharedTokenBucket(os.path.join(directory, 'bucket'))
+        # fork where there is fcntl, spawning has to import ccxt anew in every worker, the
+        # bucket reopens its file in the child either way
+        context = multiprocessing.get_context('fork')
+        results = context.Queue()
+        workers = [context.Process(target=shared_bucket_worker, args=(bucket, results)) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        released = []
+        for _ in workers:
+            released.extend(results.get(timeout=60))
+        for worker in workers:
+            worker.join()
+        bucket.close()
+    assert_paced(released, 3 * REQUESTS_PER_WORKER)
+
+
+if __name__ == '__main__':
+    asyncio.run(test_shared_token_bucket())
@@ -0,0 +1,55 @@
+import os
+import sys
+import asyncio
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - the python Throttler sleeps
+# until the computed wake-up time instead of polling, keeps the rolling window
+# in a deque with a running total and counts queue depth and wait times, none
+# of which the transpiled tests can see. Timings are kept short and only
+# checked with wide margins.
+
+from ccxt.async_support.base.throttler import Throttler  # noqa: E402
+
+
+async def run_throttler(throttler, costs):
+    start = throttler.milliseconds()
+    await asyncio.gather(*[throttler(cost) for cost in costs])
+    return throttler.milliseconds() - start
+
+
+async def test_throttler_scheduling():
+    # 1 token per 10 ms, 10 requests release one every 10 ms after the first
+    leaky = Throttler({'refillRate': 1 / 10, 'capacity': 1, 'rateLimit': 10})
+    elapsed = await run_throttler(leaky, [1] * 10)
+    assert 80 <= elapsed < 400, 'leaky bucket took ' + str(elapsed) + ' ms'
+    stats = leaky.stats()
+    assert stats['queue'] == 0
+    assert stats['maxQueue'] == 10
+    assert stats['requests'] == 10
+    assert stats['maxWait'] >= 80
+    assert stats['averageWait'] <= stats['maxWait']
+    # a window of 200 ms at one request per 50 ms admits 4 at once, the 5th
+    # waits for the first to expire, a single request costlier than the whole
+    # window goes through once the window has emptied
+    rolling = Throttler({'algorithm': 'rollingWindow', 'windowSize': 200, 'rateLimit': 50})
+    assert rolling.config['maxWeight'] == 4
+    elapsed = await run_throttler(rolling, [1, 1, 1, 1])
+    assert elapsed < 100
+    assert rolling.window_cost == 4
+    elapsed = await run_throttler(rolling, [2])
+    assert 150 <= elapsed < 600, 'rolling window took ' + str(elapsed) + ' ms'
+    elapsed = await run_throttler(rolling, [10])
+    assert 150 <= elapsed < 600
+    assert list(cost for _, cost in rolling.timestamps) == [10]
+    assert rolling.window_cost == 10
+    assert rolling.stats()['requests'] == 6
+    rolling.reset_stats()
+    assert rolling.stats()['requests'] == 0
+
+
+if __name__ == '__main__':
+    asyncio.run(test_throttler_scheduling())
@@ -0,0 +1,129 @@
+import os
+import sys
+import asyncio
+import copy
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+import ccxt  # noqa: E402
+import ccxt.async_support as ccxt_async  # noqa: E402
+
+# ----------------------------------------------------------------------------
+# hand-written python-only test (not transpiled) - the incremental market
+# reload is python-only, it has to leave the markets, their indexes and the
+# derived currencies exactly as a full set_markets() of the same markets.
+
+MARKETS = [
+    {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'baseId': 'BTC', 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'linear': None, 'active': True, 'precision': {'amount': 0.0001, 'price': 0.01}, 'info': {}},
+    {'id': 'BTCUSDT', 'symbol': 'BTC/USDT:USDT', 'base': 'BTC', 'quote': 'USDT', 'settle': 'USDT', 'baseId': 'BTC', 'quoteId': 'USDT', 'type': 'swap', 'spot': False, 'swap': True, 'linear': True, 'active': True, 'precision': {'amount': 0.001, 'price': 0.1}, 'info': {}},
+    {'id': 'ETHUSDT', 'symbol': 'ETH/USDT', 'base': 'ETH', 'quote': 'USDT', 'baseId': 'ETH', 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'active': True, 'precision': {'amount': 0.001, 'price': 0.01}, 'info': {}},
+    {'id': 'ETHBTC', 'symbol': 'ETH/BTC', 'base': 'ETH', 'quote': 'BTC', 'baseId': 'ETH', 'quoteId': 'BTC', 'type': 'spot', 'spot': True, 'active': True, 'precision': {'amount': 0.01, 'price': 0.00001}, 'info': {}},
+]
+
+
+def assert_same_markets(exchange, reference):
+    assert exchange.markets == reference.markets
+    assert exchange.markets_by_id == reference.markets_by_id
+    assert exchange.symbols == reference.symbols
+    assert exchange.ids == reference.ids
+    assert exchange.currencies == reference.currencies
+    assert exchange.currencies_by_id == reference.currencies_by_id
+    assert exchange.codes == reference.codes
+    assert exchange.baseCurrencies == reference.baseCurrencies
+    assert exchange.quoteCurrencies == reference.quoteCurrencies
+
+
+class ReloadedExchange(ccxt_async.Exchange):
+    markets_to_fetch = []
+
+    def describe(self):
+        return self.deep_extend(super(ReloadedExchange, self).describe(), {'id': 'reloaded'})
+
+    async def fetch_markets(self, params={}):
+        return copy.deepcopy(ReloadedExchange.markets_to_fetch)
+
+
+def test_sync_update_markets():
+    exchange = ccxt.Exchange({'id': 'sampleexchange'})
+    # nothing loaded yet is a full load
+    assert exchange.update_markets(copy.deepcopy(MARKETS[:3])) == {'added': ['BTC/USDT', 'BTC/USDT:USDT', 'ETH/USDT'], 'changed': [], 'removed': []}
+    markets = exchange.markets
+    btc = exchange.markets['BTC/USDT']
+    assert exchange.update_markets(copy.deepcopy(MARKETS[:3])) == {'added': [], 'changed': [], 'removed': []}
+    assert exchange.markets['BTC/USDT'] is btc
+    fetched = copy.deepcopy(MARKETS[1:])
+    fetched[0]['precision']['amount'] = 0.01
+    fetched.append(copy.deepcopy(MARKETS[0]))  # the spot market comes back last, it still goes first on its id
+    fetched[1]['info'] = {'status': 'trading'}
+    diff = exchange.update_markets(copy.deepcopy(fetched))
+    assert diff == {'added': ['ETH/BTC'], 'changed': ['BTC/USDT:USDT', 'ETH/USDT'], 'removed': []}
+    assert exchange.markets is markets
+    assert exchange.markets['BTC/USDT'] is btc
+    reference = ccxt.Exchange({'id': 'sampleexchange'})
+    reference.set_markets(copy.deepcopy(MARKETS[:3]))
+    reference.set_markets(copy.deepcopy(fetched))
+    assert_same_markets(exchange, reference)
+    diff = exchange.update_markets(copy.deepcopy(fetched[1:]))
+    assert diff == {'added': [], 'changed': [], 'removed': ['BTC/USDT:USDT']}
+    reference.set_markets(copy.deepcopy(fetched[1:]))
+    assert_same_markets(exchange, reference)
+    assert exchange.markets_by_id['BTCUSDT'] == [MARKETS[0]]
+
+
+def test_update_markets_shared():
+    # the instances that share the markets through set_markets_from_exchange() see all of the update
+    exchange = ccxt.Exchange({'id': 'sampleexchange'})
+    exchange.set_markets(copy.deepcopy(MARKETS[:1]))
+    shared = ccxt.Exchange({'id': 'sampleexchange'})
+    shared.set_markets_from_exchange(exchange)
+    exchange.update_markets(copy.deepcopy(MARKETS))
+    for name in ('markets', 'markets_by_id', 'symbols', 'ids', 'currencies', 'currencies_by_id', 'baseCurrencies', 'quoteCurrencies', 'codes'):
+        assert getattr(shared, name) is getattr(exchange, name)
+    assert shared.codes == ['BTC', 'ETH', 'USDT']
+    # the markets of an exchange that overrides set_markets() are built with it
+    swaps = [market for market in copy.deepcopy(MARKETS) if market['spot']]
+    for market in swaps:
+        market.update({'id': market['id'] + '-SWAP', 'symbol': market['symbol'] + ':' + market['quote'], 'type': 'swap', 'spot': False, 'swap': True, 'linear': True, 'settle': market['quote']})
+    exchange = ccxt.deepcoin()
+    exchange.set_markets(copy.deepcopy(swaps[:1]))
+    shared = ccxt.deepcoin()
+    shared.set_markets_from_exchange(exchange)
+    # the ids deepcoin adds for the swap markets are not taken for changes
+    assert exchange.update_markets(copy.deepcopy(swaps[:1])) == {'added': [], 'changed': [], 'removed': []}
+    swaps[0]['precision']['amount'] = 0.01
+    assert exchange.update_markets(copy.deepcopy(swaps)) == {'added': ['ETH/USDT:USDT', 'ETH/BTC:BTC'], 'changed': ['BTC/USDT:USDT'], 'removed': []}
+    assert exchange.markets_by_id['ETHUSDT'] == [exchange.markets['ETH/USDT:USDT']]
+    assert exchange.markets_by_id['BTCUSDT'][0] is exchange.markets['BTC/USDT:USDT']
+    assert shared.markets is exchange.markets and shared.currencies is exchange.currencies
+    assert shared.codes == ['BTC', 'ETH', 'USDT']
+
+
+async def test_async_reload_markets():
+    # the in-place update reaches the instances that share the markets
+    options = {'marketsRegistry': True}
+    ReloadedExchange.markets_to_fetch = MARKETS[:2]
+    first = ReloadedExchange({'options': options})
+    second = ReloadedExchange({'options': options})
+    await first.load_markets()
+    await second.load_markets()
+    assert second.markets is first.markets
+    ReloadedExchange.markets_to_fetch = MARKETS
+    diff = await second.reload_markets()
+    assert diff == {'added': ['ETH/USDT', 'ETH/BTC'], 'changed': [], 'removed': []}
+    assert first.symbols == ['BTC/USDT', 'BTC/USDT:USDT', 'ETH/BTC', 'ETH/USDT']
+    assert first.currencies is second.currencies
+    assert 'ETH' in first.currencies
+    await first.close()
+    await second.close()
+
+
+async def test_update_markets():
+    test_sync_update_markets()
+    test_update_markets_shared()
+    await test_async_reload_markets()
+
+
+if __name__ == '__main__':
+    asyncio.run(test_update_markets())
+    print('test_update_markets passed')